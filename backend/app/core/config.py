@@ -1,6 +1,61 @@
 # JWT configuration
 import os
+import tempfile
 
 SECRET_KEY = os.getenv("SECRET_KEY", "super-secret-key-change-this-later")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+# A refresh token spent this recently may be presented again (another tab
+# refreshing at the same moment) without being treated as stolen
+REFRESH_REUSE_GRACE_SECONDS = int(os.getenv("REFRESH_REUSE_GRACE_SECONDS", "30"))
+# Verified access tokens remembered to skip repeated signature checks
+TOKEN_CACHE_SIZE = 4096
+
+# Password hashing. Changing BCRYPT_ROUNDS re-hashes each user on next login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")  # "thread" or "process"
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Pub/sub broker for server-pushed events.
+# Empty = in-process only (single worker); redis://... fans out across workers
+PUBSUB_BROKER_URL = os.getenv("PUBSUB_BROKER_URL", "")
+
+# Monthly equity/debt/gold price history (CSV or Parquet) used for backtests.
+# Columns: date (YYYY-MM or YYYY-MM-DD), equity, debt, gold
+BACKTEST_DATA_PATH = os.getenv("BACKTEST_DATA_PATH") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "asset_prices.csv"
+)
+
+# Token-bucket rate limiting per user (or IP). Each request spends its route's
+# cost (see app/core/rate_limit.py); buckets refill continuously.
+# Empty store URL = per-process buckets; redis://... shares them across workers
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+RATE_LIMIT_CAPACITY = float(os.getenv("RATE_LIMIT_CAPACITY", "120"))
+RATE_LIMIT_REFILL_PER_SEC = float(os.getenv("RATE_LIMIT_REFILL_PER_SEC", "5"))
+RATE_LIMIT_MAX_CONCURRENT = int(os.getenv("RATE_LIMIT_MAX_CONCURRENT", "10"))
+RATE_LIMIT_STORE_URL = os.getenv("RATE_LIMIT_STORE_URL", "")
+# Reverse proxies (comma-separated IPs/CIDRs) whose X-Forwarded-For is believed
+# when keying anonymous callers; empty = key on the socket peer address
+RATE_LIMIT_TRUSTED_PROXIES = os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "")
+
+# GET /metrics (Prometheus). Off by default: the route answers 404. When on and
+# METRICS_TOKEN is set, scrapes must send "Authorization: Bearer <token>"
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# DEBUG=1 adds X-DB-Queries / X-DB-Time-Ms headers to every response
+DEBUG = os.getenv("DEBUG", "0") == "1"
+# One SQL statement repeated this many times in a request is logged as a likely N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
+
+# On-demand request profiling. Admins (comma-separated emails) can send
+# "X-Profile: 1" to profile one request; PROFILE_SAMPLE_RATE (0..1) also
+# profiles that fraction of all requests. Profiles are kept in PROFILE_DIR.
+ADMIN_EMAILS = {e.strip().lower() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()}
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_MAX_ACTIVE = int(os.getenv("PROFILE_MAX_ACTIVE", "1"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "30"))
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "200"))
+PROFILE_DIR = os.getenv("PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "finsmart-profiles")
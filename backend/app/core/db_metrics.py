@@ -0,0 +1,90 @@
+import contextvars
+import logging
+import time
+from collections import Counter as StatementCounts
+
+from sqlalchemy import event
+
+from app.core.config import DEBUG, N_PLUS_ONE_THRESHOLD
+from app.core.metrics import registry, route_label, Counter, Histogram
+from app.database import engine
+
+logger = logging.getLogger("finsmart.db")
+
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+db_queries = registry.register(Histogram(
+    "finsmart_db_queries_per_request", "SQL statements executed per request", ("route",), QUERY_BUCKETS
+))
+db_time = registry.register(Histogram(
+    "finsmart_db_time_seconds", "Time spent in SQL per request", ("route",)
+))
+db_n_plus_one = registry.register(Counter(
+    "finsmart_db_n_plus_one_total", "Requests that repeated one statement N_PLUS_ONE_THRESHOLD+ times", ("route",)
+))
+
+# Stats of the request being served. The dict is shared, not copied, into the
+# threadpool that runs sync handlers, so mutations made there are seen here.
+_current = contextvars.ContextVar("db_request_stats", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats["queries"] += 1
+        stats["seconds"] += elapsed
+        stats["statements"][statement] += 1
+
+
+class DBStatsMiddleware:
+    """
+    Count SQL statements and DB time per request.
+
+    Feeds the /metrics histograms, warns when one statement repeats often
+    enough to look like an N+1 loop, and with DEBUG=1 adds X-DB-Queries /
+    X-DB-Time-Ms response headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = {"queries": 0, "seconds": 0.0, "statements": StatementCounts()}
+        token = _current.set(stats)
+
+        async def send_wrapper(message):
+            if DEBUG and message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-db-queries", str(stats["queries"]).encode()),
+                    (b"x-db-time-ms", f"{stats['seconds'] * 1000:.1f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            route = route_label(scope)
+            db_queries.observe(stats["queries"], route)
+            db_time.observe(stats["seconds"], route)
+
+            if stats["statements"]:
+                statement, repeats = stats["statements"].most_common(1)[0]
+                if repeats >= N_PLUS_ONE_THRESHOLD:
+                    db_n_plus_one.inc(route)
+                    logger.warning(
+                        "Possible N+1 on %s %s: statement ran %d times: %s",
+                        scope["method"], route, repeats, " ".join(statement.split())[:200],
+                    )
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models.user import User
 from app.core.jwt import verify_access_token
+from app.core.profiling import is_admin
 
 security = HTTPBearer()
 
@@ -39,3 +40,26 @@ def get_current_user(
         )
 
     return user
+
+
+def resolve_user_id(token: str):
+    """Token -> user id without holding a session (for long-lived streams)"""
+    email = verify_access_token(token)
+    if email is None:
+        return None
+
+    db = SessionLocal()
+    try:
+        return db.query(User.id).filter(User.email == email).scalar()
+    finally:
+        db.close()
+
+
+def get_admin_user(current_user: User = Depends(get_current_user)):
+    """Current user, if listed in ADMIN_EMAILS"""
+    if not is_admin(current_user.email):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
@@ -0,0 +1,47 @@
+import hashlib
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Bump when a calculator's output changes so clients/CDNs drop old ETags
+CALC_VERSION = "1"
+# Pure calculators: same query string -> same body, so edges may keep it a day
+CALC_MAX_AGE = 86400
+
+
+def _exact(value):
+    # Whole floats become ints so 1.0 and 1 share a key (and an ETag, which
+    # hashes the repr); anything else is kept as is, so distinct inputs never
+    # collide however close they are
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def canonical_key(data: BaseModel) -> tuple:
+    """Hashable, order-independent key for a request model (1.0 == 1)"""
+    return tuple(sorted((k, _exact(v)) for k, v in data.model_dump().items()))
+
+
+def etag_for(key: tuple) -> str:
+    digest = hashlib.sha1(f"{CALC_VERSION}:{key!r}".encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def cacheable_response(
+    request: Request,
+    key: tuple,
+    payload: dict,
+    response_model: type[BaseModel],
+    max_age: int = CALC_MAX_AGE,
+) -> Response:
+    """JSON response with ETag/Cache-Control; 304 when the client already has it"""
+    etag = etag_for(key)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    body = response_model.model_validate(payload).model_dump(mode="json")
+    return JSONResponse(body, headers=headers)
@@ -1,7 +1,12 @@
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, TOKEN_CACHE_SIZE
 
 
 def create_access_token(data: dict):
@@ -12,12 +17,44 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
+# token -> (email, exp timestamp), least recently used first. Keyed by the
+# whole token, so a hit means the exact signed bytes were verified before.
+_verified = OrderedDict()
+_verified_lock = threading.Lock()
+
+
 def verify_access_token(token: str):
+    with _verified_lock:
+        cached = _verified.get(token)
+        if cached is not None:
+            email, exp = cached
+            if exp > time.time():
+                _verified.move_to_end(token)
+                return email
+            del _verified[token]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
             return None
-        return email
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        with _verified_lock:
+            _verified[token] = (email, exp)
+            while len(_verified) > TOKEN_CACHE_SIZE:
+                _verified.popitem(last=False)
+    return email
+
+
+def new_refresh_token() -> tuple[str, str]:
+    """(opaque token for the client, hash to store)"""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
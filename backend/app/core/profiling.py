@@ -0,0 +1,244 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from functools import lru_cache
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import (
+    ADMIN_EMAILS,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_INTERVAL_MS,
+    PROFILE_MAX_ACTIVE,
+    PROFILE_MAX_SECONDS,
+    PROFILE_KEEP,
+    PROFILE_DIR,
+)
+from app.core.jwt import verify_access_token
+from app.core.metrics import route_label
+
+# Never profiled: scrapes, the profile endpoints themselves and long-lived streams
+SKIP_PATHS = ("/metrics", "/admin/profiles", "/alerts/stream")
+MAX_DEPTH = 128
+
+# Threads parked here are idle (waiting for work or I/O), not serving a request
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py")
+# concurrent.futures workers wait on their queue in C, so _worker is the top frame
+_IDLE_FUNCTIONS = (("thread.py", "_worker"),)
+
+
+@lru_cache(maxsize=8192)
+def _frame_label(code) -> str:
+    path = os.path.relpath(code.co_filename) if os.path.isabs(code.co_filename) else code.co_filename
+    if path.startswith(".."):
+        # stdlib / site-packages: the module name is enough
+        path = os.path.basename(path)
+    return f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+
+
+def is_admin(email) -> bool:
+    return bool(email) and email.lower() in ADMIN_EMAILS
+
+
+class Sampler:
+    """
+    Wall-clock sampling profiler.
+
+    A background thread snapshots every busy thread's stack each interval
+    and counts them as folded stacks ("thread;outer;...;inner count"), the
+    input format of flamegraph.pl and speedscope. Sync handlers run on
+    threadpool workers, so all busy threads are sampled, each rooted at its
+    thread name; a request running concurrently with this one can show up too.
+    """
+
+    def __init__(self, interval: float, max_seconds: float):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        deadline = time.monotonic() + self.max_seconds
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own or names.get(ident) == "profiler":
+                    continue
+                top = (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+                if top[0] in _IDLE_FILES or top in _IDLE_FUNCTIONS:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAX_DEPTH:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """Profiles on disk as <id>.folded plus <id>.json metadata, newest PROFILE_KEEP kept"""
+
+    def __init__(self, directory: str, keep: int):
+        self.directory = directory
+        self.keep = keep
+
+    def _path(self, profile_id: str, ext: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.{ext}")
+
+    def save(self, meta: dict, folded: str):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(meta["id"], "folded"), "w") as f:
+            f.write(folded)
+        with open(self._path(meta["id"], "json"), "w") as f:
+            json.dump(meta, f)
+        self._prune()
+
+    def _prune(self):
+        ids = self._ids()
+        for profile_id in ids[self.keep:]:
+            for ext in ("json", "folded"):
+                try:
+                    os.remove(self._path(profile_id, ext))
+                except FileNotFoundError:
+                    pass
+
+    def _ids(self):
+        # Ids start with a zero-padded millisecond timestamp, so newest sorts first
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted((n[:-5] for n in names if n.endswith(".json")), reverse=True)
+
+    def list(self, limit: int = 50):
+        profiles = []
+        for profile_id in self._ids()[:limit]:
+            try:
+                with open(self._path(profile_id, "json")) as f:
+                    profiles.append(json.load(f))
+            except (FileNotFoundError, ValueError):
+                continue
+        return profiles
+
+    def get(self, profile_id: str):
+        """Folded stacks for ``profile_id``, or None if unknown"""
+        if os.path.basename(profile_id) != profile_id:
+            return None
+        try:
+            with open(self._path(profile_id, "folded")) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+store = ProfileStore(PROFILE_DIR, PROFILE_KEEP)
+
+
+def _header(scope, name: bytes):
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _is_admin_request(scope) -> bool:
+    scheme, _, token = (_header(scope, b"authorization") or "").partition(" ")
+    return scheme.lower() == "bearer" and is_admin(verify_access_token(token))
+
+
+def _trigger(scope):
+    """Why this request should be profiled ("header" / "sampled"), or None"""
+    if _header(scope, b"x-profile") in ("1", "true") and _is_admin_request(scope):
+        return "header"
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return "sampled"
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    Run selected requests under the sampling profiler.
+
+    A request is profiled when an admin sends "X-Profile: 1" or when it
+    falls in PROFILE_SAMPLE_RATE. At most PROFILE_MAX_ACTIVE profiles run
+    at once per worker (extra triggers are served unprofiled) and each
+    stops sampling after PROFILE_MAX_SECONDS. Responses to admins carry
+    X-Profile-Id; the result is fetched from /admin/profiles/{id}. Other
+    callers never learn that their request was sampled.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.active = 0
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(SKIP_PATHS)
+            or self.active >= PROFILE_MAX_ACTIVE
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        trigger = _trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{int(time.time() * 1000):015d}-{uuid.uuid4().hex[:8]}"
+        show_id = trigger == "header" or _is_admin_request(scope)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if show_id:
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-profile-id", profile_id.encode()),
+                    ]
+            await send(message)
+
+        self.active += 1
+        sampler = Sampler(PROFILE_INTERVAL_MS / 1000, PROFILE_MAX_SECONDS)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            await run_in_threadpool(sampler.stop)
+            self.active -= 1
+            meta = {
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route_label(scope),
+                "status": status,
+                "trigger": trigger,
+                "duration_ms": round(elapsed * 1000, 1),
+                "samples": sampler.samples,
+                "interval_ms": PROFILE_INTERVAL_MS,
+                "created_at": time.time(),
+            }
+            await run_in_threadpool(store.save, meta, sampler.folded())
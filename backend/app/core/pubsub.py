@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+
+from sqlalchemy import event
+
+from app.core.config import PUBSUB_BROKER_URL
+from app.database import SessionLocal
+
+
+def _offer(queue: asyncio.Queue, message: dict):
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        # Slow consumer: drop; the client resyncs through GET /alerts/
+        pass
+
+
+class InProcessBroker:
+    """Fan-out to subscribers living in this process.
+
+    Publishing is thread-safe (sync route handlers run on the threadpool);
+    each subscriber owns a bounded asyncio queue on its own event loop.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers = {}  # channel -> {queue: loop}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscribers.setdefault(channel, {})[queue] = loop
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+            subscribers.pop(queue, None)
+            if not subscribers:
+                del self._subscribers[channel]
+
+    def publish(self, channel: str, message: dict):
+        self._deliver(channel, message)
+
+    def _deliver(self, channel: str, message: dict):
+        with self._lock:
+            targets = list(self._subscribers.get(channel, {}).items())
+        for queue, loop in targets:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:
+                # Subscriber's loop already closed
+                pass
+
+
+class RedisBroker(InProcessBroker):
+    """Publishes through Redis so every worker's local subscribers see the event"""
+
+    PREFIX = "finsmart:"
+
+    def __init__(self, url: str, queue_size: int = 100):
+        super().__init__(queue_size)
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("PUBSUB_BROKER_URL points to Redis but the 'redis' package is not installed") from e
+        self._redis = redis.Redis.from_url(url)
+        self._listener = None
+
+    def subscribe(self, channel: str) -> asyncio.Queue:
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name="pubsub-redis", daemon=True)
+                self._listener.start()
+        return super().subscribe(channel)
+
+    def publish(self, channel: str, message: dict):
+        self._redis.publish(self.PREFIX + channel, json.dumps(message))
+
+    def _listen(self):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(self.PREFIX + "*")
+        for item in pubsub.listen():
+            channel = item["channel"].decode()[len(self.PREFIX):]
+            self._deliver(channel, json.loads(item["data"]))
+
+
+def create_broker(url: str) -> InProcessBroker:
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBroker(url)
+    return InProcessBroker()
+
+
+broker = create_broker(PUBSUB_BROKER_URL)
+
+
+def publish_after_commit(db, channel: str, message: dict):
+    """Queue an event on the session; it is only published once the write commits"""
+    db.info.setdefault("pubsub_pending", []).append((channel, message))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_pending(session):
+    for channel, message in session.info.pop("pubsub_pending", ()):
+        broker.publish(channel, message)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _drop_pending(session):
+    session.info.pop("pubsub_pending", None)
+
+
+def alerts_channel(user_id: int) -> str:
+    return f"alerts:{user_id}"
@@ -0,0 +1,298 @@
+import ipaddress
+import json
+import math
+import threading
+import time
+
+from app.core.config import (
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_REFILL_PER_SEC,
+    RATE_LIMIT_MAX_CONCURRENT,
+    RATE_LIMIT_STORE_URL,
+    RATE_LIMIT_TRUSTED_PROXIES,
+)
+from app.core.jwt import verify_access_token
+
+# Tokens charged per request, by (method, path prefix); first match wins.
+# Everything else costs 1. Report routes are weighted by the queries they
+# run (see benchmarks/bench_endpoints.py): ~25 for historical-comparison and
+# income-expense-ratio, ~19 for enhanced insights, 12-13 for the trends.
+ROUTE_COSTS = (
+    ("POST", "/auth/login", 10),
+    ("POST", "/auth/signup", 10),
+    ("POST", "/auth/refresh", 2),
+    ("POST", "/sip/monte-carlo", 10),
+    ("POST", "/sip/scenarios", 5),
+    ("GET", "/investment/backtest", 5),
+    ("POST", "/ai/", 5),
+    ("GET", "/analytics/historical-comparison", 5),
+    ("GET", "/analytics/income-expense-ratio", 5),
+    ("GET", "/insights/enhanced", 5),
+    ("GET", "/analytics/goal-vs-reality", 3),
+    ("GET", "/savings-analytics/trend", 3),
+    ("GET", "/savings-analytics/consistency", 3),
+    ("GET", "/forecast/", 3),
+    ("GET", "/analytics/recurring-transactions", 2),
+    ("GET", "/transactions/search", 2),
+)
+
+# Only these (method, path prefix) routes hold one of the caller's
+# RATE_LIMIT_MAX_CONCURRENT slots while they run; cheap routes never queue
+# behind a user's own slow reports.
+HEAVY_ROUTES = (
+    ("POST", "/auth/login"),
+    ("POST", "/auth/signup"),
+    ("POST", "/sip/monte-carlo"),
+    ("POST", "/sip/scenarios"),
+    ("GET", "/investment/backtest"),
+    ("POST", "/ai/"),
+    ("GET", "/analytics/historical-comparison"),
+    ("GET", "/analytics/income-expense-ratio"),
+    ("GET", "/insights/enhanced"),
+    ("GET", "/analytics/goal-vs-reality"),
+    ("GET", "/savings-analytics/trend"),
+    ("GET", "/savings-analytics/consistency"),
+    ("GET", "/forecast/"),
+)
+
+# Never limited: health check and CORS preflight. /metrics is limited like any
+# route (a scrape every few seconds is far inside the budget) so its token
+# can't be guessed at full speed
+EXEMPT_PATHS = ("/",)
+
+
+def route_cost(method: str, path: str) -> int:
+    for route_method, prefix, cost in ROUTE_COSTS:
+        if method == route_method and path.startswith(prefix):
+            return cost
+    return 1
+
+
+def is_heavy(method: str, path: str) -> bool:
+    return any(method == m and path.startswith(prefix) for m, prefix in HEAVY_ROUTES)
+
+
+def _parse_networks(value: str):
+    return tuple(ipaddress.ip_network(v.strip(), strict=False) for v in value.split(",") if v.strip())
+
+
+TRUSTED_PROXIES = _parse_networks(RATE_LIMIT_TRUSTED_PROXIES)
+
+
+def _trusted(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in TRUSTED_PROXIES)
+
+
+class MemoryStore:
+    """Token buckets and concurrency counters for a single worker process"""
+
+    MAX_KEYS = 100_000
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._buckets = {}  # key -> (tokens, updated_at)
+        self._active = {}  # key -> in-flight requests
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, cost: int) -> float:
+        """Spend ``cost`` tokens; returns 0 if allowed, else seconds until it would be"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.refill_per_sec)
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                if len(self._buckets) > self.MAX_KEYS:
+                    self._prune(now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (cost - tokens) / self.refill_per_sec
+
+    def _prune(self, now: float):
+        # Buckets idle long enough to be full again carry no state worth keeping
+        full_after = self.capacity / self.refill_per_sec
+        self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < full_after}
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        with self._lock:
+            active = self._active.get(key, 0)
+            if active >= limit:
+                return False
+            self._active[key] = active + 1
+            return True
+
+    async def release(self, key: str):
+        with self._lock:
+            active = self._active.get(key, 0) - 1
+            if active > 0:
+                self._active[key] = active
+            else:
+                self._active.pop(key, None)
+
+
+class RedisStore:
+    """Buckets shared by every worker through Redis (atomic Lua script)"""
+
+    PREFIX = "finsmart:ratelimit:"
+    # Slot counters expire so a crashed worker can't leak them forever
+    SLOT_TTL = 300
+
+    TAKE_SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local cost = tonumber(ARGV[3])
+    local now = tonumber(ARGV[4])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+    local wait = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+    else
+        wait = (cost - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str, capacity: float, refill_per_sec: float):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_STORE_URL points to Redis but the 'redis' package is not installed") from e
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._redis = redis.Redis.from_url(url)
+        self._take = self._redis.register_script(self.TAKE_SCRIPT)
+
+    async def take(self, key: str, cost: int) -> float:
+        wait = await self._take(
+            keys=[self.PREFIX + "bucket:" + key],
+            args=[self.capacity, self.refill_per_sec, cost, time.time()],
+        )
+        return float(wait)
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        slot_key = self.PREFIX + "active:" + key
+        pipe = self._redis.pipeline()
+        pipe.incr(slot_key)
+        pipe.expire(slot_key, self.SLOT_TTL)
+        active, _ = await pipe.execute()
+        if active > limit:
+            await self._redis.decr(slot_key)
+            return False
+        return True
+
+    async def release(self, key: str):
+        await self._redis.decr(self.PREFIX + "active:" + key)
+
+
+def create_store(url: str):
+    if url.startswith(("redis://", "rediss://")):
+        return RedisStore(url, RATE_LIMIT_CAPACITY, RATE_LIMIT_REFILL_PER_SEC)
+    return MemoryStore(RATE_LIMIT_CAPACITY, RATE_LIMIT_REFILL_PER_SEC)
+
+
+def client_ip(scope) -> str:
+    """
+    Address of the client that made the request.
+
+    The socket peer, unless it is one of RATE_LIMIT_TRUSTED_PROXIES: then
+    X-Forwarded-For is walked from the right (the entries our proxies
+    appended) and the first hop they don't vouch for is the client. Entries
+    further left are client-supplied and never trusted.
+    """
+    client = scope.get("client")
+    address = client[0] if client else "unknown"
+    if not _trusted(address):
+        return address
+    forwarded = []
+    for name, value in scope.get("headers", ()):
+        if name == b"x-forwarded-for":
+            forwarded.extend(v.strip() for v in value.decode("latin-1").split(","))
+    for hop in reversed(forwarded):
+        if not hop:
+            continue
+        address = hop
+        if not _trusted(hop):
+            break
+    return address
+
+
+def _client_key(scope) -> str:
+    """Authenticated user if the bearer token verifies, else the client address"""
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                email = verify_access_token(token)
+                if email:
+                    return "user:" + email
+            break
+    return "ip:" + client_ip(scope)
+
+
+async def _reject(send, retry_after: float, detail: str):
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """
+    Token-bucket rate limiting per user (or per IP when anonymous).
+
+    Each request spends its route's cost from the caller's bucket, which
+    refills continuously; an empty bucket, or a heavy route while the same
+    caller already has max_concurrent heavy requests in flight, gets 429
+    with Retry-After.
+    """
+
+    def __init__(self, app, store=None, max_concurrent: int = RATE_LIMIT_MAX_CONCURRENT):
+        self.app = app
+        self.store = store or create_store(RATE_LIMIT_STORE_URL)
+        self.max_concurrent = max_concurrent
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not RATE_LIMIT_ENABLED
+            or scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = _client_key(scope)
+        wait = await self.store.take(key, route_cost(scope["method"], scope["path"]))
+        if wait > 0:
+            await _reject(send, wait, "Too many requests, slow down")
+            return
+
+        if not is_heavy(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.store.acquire(key, self.max_concurrent):
+            await _reject(send, 1, "Too many concurrent requests")
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await self.store.release(key)
@@ -1,9 +1,56 @@
+import asyncio
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import BCRYPT_ROUNDS, PASSWORD_HASH_EXECUTOR, PASSWORD_HASH_WORKERS
+
+# Hashes made with other rounds still verify and are upgraded on the next login
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(password: str, hashed_password: str) -> bool:
     return pwd_context.verify(password, hashed_password)
+
+def verify_and_update(password: str, hashed_password: str):
+    """(valid, new_hash); new_hash is set when the stored hash uses outdated settings"""
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+# Dedicated pool so bcrypt never occupies the request threadpool. Requests
+# beyond what the workers can hold wait on the semaphore instead of piling
+# up in the executor queue.
+_executor = None
+_slots = weakref.WeakKeyDictionary()  # event loop -> semaphore
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        if PASSWORD_HASH_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+        else:
+            # bcrypt releases the GIL while hashing, so threads scale too
+            _executor = ThreadPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+            )
+    return _executor
+
+
+async def _run(fn, *args):
+    executor = _get_executor()
+    loop = asyncio.get_running_loop()
+    slots = _slots.setdefault(loop, asyncio.Semaphore(PASSWORD_HASH_WORKERS * 2))
+    async with slots:
+        return await loop.run_in_executor(executor, fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(hash_password, password)
+
+
+async def verify_and_update_async(password: str, hashed_password: str):
+    return await _run(verify_and_update, password, hashed_password)
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 
@@ -23,3 +23,63 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def upsert(db, model):
+    """INSERT construct with ON CONFLICT support for the session's dialect"""
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
+
+class SchemaMigrationError(RuntimeError):
+    """A model change add_missing_columns() can't apply to an existing table"""
+
+
+def _add_column_ddl(table, column, dialect) -> str:
+    """ALTER TABLE ... ADD COLUMN for ``column``, or raise if it needs a real migration"""
+    problems = []
+    if column.primary_key:
+        problems.append("a primary key")
+    if not column.nullable:
+        problems.append("NOT NULL")
+    if column.default is not None or column.server_default is not None:
+        problems.append("defaulted (existing rows would be left NULL)")
+    if column.unique:
+        problems.append("unique")
+    if problems:
+        raise SchemaMigrationError(
+            f"{table.name}.{column.name} is {', '.join(problems)}; "
+            "add it to the existing table with an explicit migration"
+        )
+
+    ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=dialect)}"
+    for fk in column.foreign_keys:
+        ddl += f" REFERENCES {fk.column.table.name} ({fk.column.name})"
+        if fk.ondelete:
+            ddl += f" ON DELETE {fk.ondelete}"
+    return ddl
+
+
+def add_missing_columns(bind=None):
+    """
+    create_all() never alters existing tables; add the columns introduced since.
+
+    Startup only makes additive changes: new nullable, default-free columns
+    (with their foreign key). Any other new column raises
+    SchemaMigrationError instead of being added without its NOT NULL,
+    default or unique. Indexes, unique constraints, changed foreign keys and
+    data backfills are applied by ``python -m app.jobs.migrate_schema``.
+    """
+    bind = bind or engine
+    with bind.begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    conn.execute(text(_add_column_ddl(table, column, bind.dialect)))
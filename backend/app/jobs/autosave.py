@@ -0,0 +1,36 @@
+"""
+Daily job: execute every user's auto-save rules.
+
+    python -m app.jobs.autosave                      # saves for yesterday
+    python -m app.jobs.autosave --date 2026-03-14
+
+Safe to re-run: each rule writes at most one record per run date, and goal
+balances only move for records inserted by the current attempt.
+"""
+import argparse
+from datetime import date
+
+from app.database import SessionLocal
+from app.models import user  # REQUIRED to resolve relationships
+from app.services.autosave import CHUNK_SIZE, run_autosave
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run auto-save rules")
+    parser.add_argument("--date", type=date.fromisoformat, help="Day to evaluate (default: yesterday)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        summary = run_autosave(db, args.date, args.chunk_size)
+    finally:
+        db.close()
+    print(
+        f"{summary['run_key']}: {summary['rules']} rules, "
+        f"{summary['records']} records, ₹{summary['amount']} saved"
+    )
+
+
+if __name__ == "__main__":
+    main()
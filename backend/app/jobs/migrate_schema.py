@@ -0,0 +1,32 @@
+"""
+One-off upgrade of an existing database to the current models.
+
+    python -m app.jobs.migrate_schema
+    python -m app.jobs.migrate_schema --skip-backfill
+
+Startup only creates missing tables and adds new nullable columns. Run this
+after deploying a release that adds indexes, unique constraints or changed
+foreign keys: duplicate rows are removed (newest kept) before each new unique
+index, then rows written before later columns existed are backfilled. Safe
+to re-run; finished steps are skipped.
+"""
+import argparse
+
+from app.database import Base, engine
+from app.models import user  # REQUIRED to resolve relationships
+from app.services.migrations import backfill, migrate_schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upgrade an existing database to the current models")
+    parser.add_argument("--skip-backfill", action="store_true", help="Only change the schema")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    migrate_schema(engine)
+    if not args.skip_backfill:
+        backfill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Nightly job: rebuild cross-user spending sketches per category/month.
+
+    python -m app.jobs.spending_benchmarks                 # this month and last month
+    python -m app.jobs.spending_benchmarks --year 2025 --month 3
+
+Each user's monthly total per expense category is streamed from one
+aggregate query and folded into a QuantileSketch per category, so memory
+stays flat however many users there are. /analytics/benchmark answers
+percentile questions from the stored sketch without touching other users' rows.
+"""
+import argparse
+from datetime import date
+
+from app.database import SessionLocal
+from app.models import user  # REQUIRED to resolve relationships
+from app.services.benchmarks import build_benchmarks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild cross-user spending benchmarks")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--month", type=int)
+    args = parser.parse_args()
+
+    if args.year and args.month:
+        months = [(args.year, args.month)]
+    else:
+        # The running month changes daily; last month settles after its final day
+        today = date.today()
+        previous = (today.year - (today.month == 1), (today.month - 2) % 12 + 1)
+        months = [previous, (today.year, today.month)]
+
+    db = SessionLocal()
+    try:
+        for year, month in months:
+            counts = build_benchmarks(db, year, month)
+            print(f"{year}-{month:02d}: {len(counts)} categories, {sum(counts.values())} user/category totals")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
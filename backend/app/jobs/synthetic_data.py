@@ -0,0 +1,53 @@
+"""
+Load-testing data: generate users with realistic histories and bulk-load them.
+
+    python -m app.jobs.synthetic_data --users 1000                     # ~1.5M transactions
+    python -m app.jobs.synthetic_data --users 8000 --months 24 --seed 7  # 10M+ transactions
+    python -m app.jobs.synthetic_data --users 1000 --first-user 1000     # append the next 1000
+
+Each user gets salary with yearly raises, rent, subscriptions, seasonal
+bills and everyday spend, plus budgets and savings goals. Rows go in with
+COPY on Postgres (executemany on SQLite). The same --seed, --months and
+--end always produce the same data; users are user0000000.s<seed>@synthetic.example.com
+and log in with the password in app.services.synthetic.PASSWORD.
+"""
+import argparse
+import time
+from datetime import date
+
+from app.database import Base, engine, add_missing_columns
+from app.models import user  # REQUIRED to resolve relationships
+from app.seed_categories import seed_categories
+from app.services.synthetic import USER_BATCH, load_synthetic_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic users and transactions")
+    parser.add_argument("--users", type=int, required=True)
+    parser.add_argument("--months", type=int, default=24, help="History length ending at --end")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day of history (default: today)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--first-user", type=int, default=0, help="Index of the first user to generate")
+    parser.add_argument("--batch-size", type=int, default=USER_BATCH)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns()
+    seed_categories()
+
+    started = time.perf_counter()
+    users = transactions = 0
+    with engine.connect() as conn:
+        batches = load_synthetic_data(
+            conn, args.users, args.seed, args.months, args.end or date.today(), args.first_user, args.batch_size
+        )
+        for batch_users, batch_transactions in batches:
+            users += batch_users
+            transactions += batch_transactions
+            elapsed = time.perf_counter() - started
+            print(f"{users}/{args.users} users, {transactions} transactions ({transactions / elapsed:,.0f} rows/s)")
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
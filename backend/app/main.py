@@ -1,6 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
+from app.core.config import METRICS_ENABLED, METRICS_TOKEN
+from app.database import engine, Base, add_missing_columns, SchemaMigrationError
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.db_metrics import DBStatsMiddleware
+from app.core.profiling import ProfilingMiddleware
 from app.models import user, category, transaction, savings_goal, autosave_record
 from app.routes import auth, users, categories, transactions, summary, analytics
 from app.routes import budget
@@ -14,6 +19,11 @@ from app.routes import ai
 from app.routes import markets
 from app.routes import savings_goals
 from app.routes import savings_analytics
+from app.routes import portfolio
+from app.routes import loans
+from app.routes import forecast
+from app.routes import admin
+import hmac
 import os
 
 
@@ -28,6 +38,15 @@ allowed_origins_str = os.getenv(
 )
 allowed_origins = [origin.strip() for origin in allowed_origins_str.split(",")]
 
+# Innermost, so it sees the matched route and only the route's own queries
+app.add_middleware(DBStatsMiddleware)
+# Profiles the route and its DB work, but not rate limiting or metrics
+app.add_middleware(ProfilingMiddleware)
+# Rate limiting sits inside CORS so 429 responses still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+# Outside rate limiting so rejected requests are measured too
+app.add_middleware(MetricsMiddleware)
+
 # Add CORS middleware FIRST (before all routes)
 app.add_middleware(
     CORSMiddleware,
@@ -43,12 +62,16 @@ app.add_middleware(
 def startup_event():
     try:
         Base.metadata.create_all(bind=engine)
+        add_missing_columns()
         # Seed default categories on startup (only if empty)
         from app.seed_categories import seed_categories
         seed_categories()
         # Warm up ML models to avoid first-request delay
         from app.ml.predictor import load_models
         load_models()
+    except SchemaMigrationError:
+        # The schema can't be brought up to the models: don't serve on it
+        raise
     except Exception as e:
         print(f"Warning: Could not initialize database on startup: {e}")
         print("Tables will be created on first request...")
@@ -70,8 +93,24 @@ app.include_router(savings_analytics.router)
 app.include_router(alerts.router)
 app.include_router(ai.router)
 app.include_router(markets.router)
+app.include_router(portfolio.router)
+app.include_router(loans.router)
+app.include_router(forecast.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
 def root():
     return {"message": "FinSmart backend is running 🚀"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(authorization: str = Header("")):
+    """Prometheus exposition of this worker's request metrics (see METRICS_ENABLED / METRICS_TOKEN)"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if METRICS_TOKEN and not hmac.compare_digest(authorization.encode(), f"Bearer {METRICS_TOKEN}".encode()):
+        raise HTTPException(
+            status_code=401, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"}
+        )
+    return Response(registry.render(), media_type="text/plain; version=0.0.4")
@@ -1,6 +1,8 @@
 import pickle
 import re
 
+from app.services.merchants import normalize_merchant
+
 # Global variables for lazy loading
 model = None
 vectorizer = None
@@ -111,6 +113,8 @@ def predict_category(description: str):
 
     # ✅ tokenize into words (removes punctuation safely)
     words = re.findall(r"\b\w+\b", text)
+    # canonical merchant ("AMZN MKTP" -> "amazon") so aliases hit the keyword map
+    words.append(normalize_merchant(description))
 
     # 1️⃣ Rule-based matching (whole-word match only)
     for category, keywords in KEYWORD_MAP.items():
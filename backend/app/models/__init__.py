@@ -5,3 +5,10 @@ from . import budget
 from . import alert
 from . import savings_goal
 from . import autosave_record
+from . import category_monthly_total
+from . import investment_cash_flow
+from . import category_spend_stats
+from . import spending_benchmark
+from . import autosave_rule
+from . import goal_contribution
+from . import refresh_token
@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
 from app.database import Base
 
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        UniqueConstraint("user_id", "category_id", "year", "month", name="uq_alert_user_category_month"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, Date, String, ForeignKey
+from sqlalchemy import Column, Integer, Float, Date, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -6,6 +6,10 @@ from app.database import Base
 
 class AutoSaveRecord(Base):
     __tablename__ = "autosave_records"
+    __table_args__ = (
+        # A rule saves at most once per run key, so re-running a day is a no-op
+        Index("uq_autosave_rule_run", "rule_id", "run_key", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -13,9 +17,12 @@ class AutoSaveRecord(Base):
     amount = Column(Float, nullable=False)
     date = Column(Date, nullable=False)
     rule_type = Column(String, nullable=False)  # "percentage", "roundup", "fixed", "income_percent"
-    goal_id = Column(Integer, ForeignKey("savings_goals.id"), nullable=True)
+    goal_id = Column(Integer, ForeignKey("savings_goals.id", ondelete="SET NULL"), nullable=True)
     
     status = Column(String, default="success")  # "success", "failed", "pending"
+
+    rule_id = Column(Integer, ForeignKey("autosave_rules.id"), nullable=True)
+    run_key = Column(String, nullable=True)  # e.g. "2026-03-14" for the daily run of that date
     
     user = relationship("User")
     goal = relationship("SavingsGoal")
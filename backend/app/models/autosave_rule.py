@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, Float, Date, String, Boolean, ForeignKey
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class AutoSaveRule(Base):
+    __tablename__ = "autosave_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    rule_type = Column(String, nullable=False)  # "percentage", "roundup", "fixed", "income_percent"
+    # percentage / income_percent: % of the day's expenses / income
+    # roundup: round each expense up to a multiple of this; fixed: amount per month
+    value = Column(Float, nullable=False)
+    goal_id = Column(Integer, ForeignKey("savings_goals.id", ondelete="SET NULL"), nullable=True)
+
+    is_active = Column(Boolean, default=True)
+    created_at = Column(Date, nullable=False)
+
+    user = relationship("User")
+    goal = relationship("SavingsGoal")
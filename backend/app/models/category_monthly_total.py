@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, UniqueConstraint
+
+from app.database import Base
+
+
+class CategoryMonthlyTotal(Base):
+    __tablename__ = "category_monthly_totals"
+    __table_args__ = (
+        UniqueConstraint("user_id", "category_id", "year", "month", name="uq_category_monthly_total"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+
+    # Running sum of transaction amounts, kept in step with every write
+    total = Column(Float, nullable=False, default=0)
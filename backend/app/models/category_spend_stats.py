@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, UniqueConstraint
+
+from app.database import Base
+
+
+class CategorySpendStats(Base):
+    """Running (Welford) statistics of transaction amounts per user/category"""
+    __tablename__ = "category_spend_stats"
+    __table_args__ = (
+        UniqueConstraint("user_id", "category_id", name="uq_category_spend_stats"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+
+    count = Column(Integer, nullable=False, default=0)
+    mean = Column(Float, nullable=False, default=0)
+    m2 = Column(Float, nullable=False, default=0)  # sum of squared deviations from the mean
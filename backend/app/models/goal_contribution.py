@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.database import Base
+
+
+class GoalContribution(Base):
+    """Ledger of every amount added to a savings goal"""
+    __tablename__ = "goal_contributions"
+    __table_args__ = (
+        Index("ix_goal_contributions_goal_created", "goal_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    goal_id = Column(Integer, ForeignKey("savings_goals.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    amount = Column(Float, nullable=False)
+    source = Column(String, nullable=False)  # "manual", "autosave"
+    description = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    goal = relationship("SavingsGoal")
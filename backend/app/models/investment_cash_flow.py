@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class InvestmentCashFlow(Base):
+    __tablename__ = "investment_cash_flows"
+    __table_args__ = (
+        Index("ix_investment_cash_flows_user_portfolio_date", "user_id", "portfolio", "date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    portfolio = Column(String, nullable=False)  # e.g. "Nifty 50 SIP", "PPF"
+    date = Column(Date, nullable=False)
+    kind = Column(String, nullable=False)  # "buy", "sell", "dividend", "valuation"
+    amount = Column(Float, nullable=False)  # always positive; kind gives direction
+
+    user = relationship("User")
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.database import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    # SHA-256 of the opaque token; the token itself is never stored
+    token_hash = Column(String, nullable=False, unique=True, index=True)
+    # Every rotation of one login shares a family, revoked together on reuse
+    family_id = Column(String, nullable=False, index=True)
+
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    # Set when a spent token got its one grace-window successor (concurrent tab refresh)
+    grace_used_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    user = relationship("User")
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary, UniqueConstraint
+from datetime import datetime
+
+from app.database import Base
+
+
+class SpendingBenchmark(Base):
+    """Quantile sketch of all users' monthly spend in one category"""
+    __tablename__ = "spending_benchmarks"
+    __table_args__ = (
+        UniqueConstraint("category", "year", "month", name="uq_spending_benchmark"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    category = Column(String, nullable=False)  # lower-cased category name
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+
+    user_count = Column(Integer, nullable=False)
+    bucket_offset = Column(Integer, nullable=False)
+    bucket_counts = Column(LargeBinary, nullable=False)  # little-endian int64 per bucket
+
+    built_at = Column(DateTime, default=datetime.utcnow)
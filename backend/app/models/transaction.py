@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, Date, Boolean, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -6,14 +6,41 @@ from app.database import Base
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_user_merchant", "user_id", "merchant_key"),
+        Index("ix_transactions_user_date", "user_id", "date"),
+        Index("ix_transactions_user_anomaly", "user_id", "is_anomaly"),
+        # Trigram index backing /transactions/search (Postgres only)
+        Index(
+            "ix_transactions_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(Float, nullable=False)
     description = Column(String, nullable=True)
     date = Column(Date, nullable=False)
 
+    # Normalized merchant ("swiggy", "netflix", "#rent"), set on write
+    merchant_key = Column(String, nullable=True)
+
+    # Z-score against the category's history at insert time (None = too little history)
+    anomaly_score = Column(Float, nullable=True)
+    # Set on every insert; NULL on rows written before scoring existed = not flagged
+    is_anomaly = Column(Boolean, nullable=True)
+
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     category = relationship("Category")
     user = relationship("User")
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.core.dependencies import get_admin_user
+from app.core.profiling import store
+from app.models.user import User
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/profiles")
+def list_profiles(
+    limit: int = 50,
+    admin: User = Depends(get_admin_user)
+):
+    """Recent request profiles on this host, newest first"""
+    return store.list(max(1, min(limit, 500)))
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(
+    profile_id: str,
+    admin: User = Depends(get_admin_user)
+):
+    """
+    Folded stacks of one profile ("frame;frame;frame count" per line).
+    Render with flamegraph.pl or drop into speedscope.app.
+    """
+    folded = store.get(profile_id)
+    if folded is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(folded)
@@ -1,16 +1,25 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from datetime import date
 
 from app.database import SessionLocal
 from app.models.alert import Alert
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, resolve_user_id
+from app.core.pubsub import broker, alerts_channel
 from app.models.user import User
 from fastapi import HTTPException
 
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
+# Comment frame sent while idle so proxies keep the stream open
+HEARTBEAT_SECONDS = 15
+
 
 def get_db():
     db = SessionLocal()
@@ -46,3 +55,37 @@ def get_alerts(
     ).all()
 
     return alerts
+
+
+@router.get("/stream")
+async def stream_alerts(request: Request, token: str):
+    """
+    Server-Sent Events channel of alert level changes for the current user.
+    EventSource cannot send an Authorization header, so the JWT is passed
+    as ?token=.
+    """
+    user_id = await run_in_threadpool(resolve_user_id, token)
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+    channel = alerts_channel(user_id)
+    queue = broker.subscribe(channel)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: alert\ndata: {json.dumps(message)}\n\n"
+        finally:
+            broker.unsubscribe(channel, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
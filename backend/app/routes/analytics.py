@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
 from datetime import date, timedelta
@@ -10,12 +10,15 @@ from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.schemas.analytics import (
     ExpenseByCategoryResponse,
-    DailyExpenseResponse
+    DailyExpenseResponse,
+    SpendingBenchmarkResponse
 )
 from app.schemas.insight import InsightResponse
 from app.models.budget import Budget
 from app.schemas.savings import SavingsRequest, SavingsResponse
 from app.schemas.sip import SIPRequest, SIPResponse
+from app.services.recurring import recurring_for_user
+from app.services.benchmarks import load_benchmark
 
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
@@ -81,6 +84,94 @@ def top_expense_categories(
     return results
 
 
+# Top merchants (grouped on the indexed merchant key)
+@router.get("/top-merchants")
+def top_merchants(
+    year: int | None = None,
+    month: int | None = None,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = (
+        db.query(
+            Transaction.merchant_key.label("merchant"),
+            func.sum(Transaction.amount).label("total_amount"),
+            func.count(Transaction.id).label("count")
+        )
+        .join(Category)
+        .filter(
+            Transaction.user_id == current_user.id,
+            Transaction.merchant_key != None,
+            Category.type == "expense"
+        )
+    )
+
+    if year and month:
+        query = query.filter(
+            extract("year", Transaction.date) == year,
+            extract("month", Transaction.date) == month
+        )
+
+    results = (
+        query.group_by(Transaction.merchant_key)
+        .order_by(func.sum(Transaction.amount).desc())
+        .limit(limit)
+        .all()
+    )
+
+    return [
+        {"merchant": r.merchant, "total_amount": round(r.total_amount, 2), "count": r.count}
+        for r in results
+    ]
+
+
+# Fewer peers than this and a percentile would say too much about individuals
+MIN_BENCHMARK_PEERS = 5
+
+
+@router.get("/benchmark", response_model=SpendingBenchmarkResponse)
+def spending_benchmark(
+    category: str,
+    year: int,
+    month: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Where the user's monthly spend in a category ranks among all users"""
+    sketch, built_at = load_benchmark(db, category, year, month)
+    if sketch is None or sketch.count < MIN_BENCHMARK_PEERS:
+        raise HTTPException(status_code=404, detail="Not enough data to benchmark this category yet")
+
+    spent = (
+        db.query(func.sum(Transaction.amount))
+        .join(Category)
+        .filter(
+            Transaction.user_id == current_user.id,
+            Category.type == "expense",
+            func.lower(Category.name) == category.lower(),
+            extract("year", Transaction.date) == year,
+            extract("month", Transaction.date) == month
+        )
+        .scalar()
+        or 0
+    )
+
+    return {
+        "category": category,
+        "year": year,
+        "month": month,
+        "your_spending": round(spent, 2),
+        "percentile": round(sketch.rank(spent), 1),
+        "peer_count": sketch.count,
+        "peer_p25": round(sketch.quantile(0.25), 2),
+        "peer_median": round(sketch.quantile(0.5), 2),
+        "peer_p75": round(sketch.quantile(0.75), 2),
+        "peer_p90": round(sketch.quantile(0.9), 2),
+        "built_at": built_at,
+    }
+
+
 # 3️⃣ Daily expense trend (Line chart)
 @router.get("/daily-expense", response_model=list[DailyExpenseResponse])
 def daily_expense_trend(
@@ -473,68 +564,8 @@ def recurring_transactions(
     current_user: User = Depends(get_current_user)
 ):
     """Detect recurring transactions and subscriptions"""
-    from sqlalchemy import and_
-    from collections import Counter
-    
-    today = date.today()
-    six_months_ago = today.replace(day=1) - timedelta(days=180)
-    
-    # Categories that are truly subscription/recurring in nature
-    # Using case-insensitive matching and includes variations
-    subscription_keywords = [
-        "subscription", "bill", "utilit", "insur", 
-        "entertain", "gym", "health", "stream", "internet", "phone", "netflix"
-    ]
-    
-    # Get all transactions from last 6 months
-    all_transactions = db.query(
-        Transaction.description,
-        Transaction.category_id,
-        Transaction.amount,
-        func.count(Transaction.id).label("frequency"),
-        func.avg(Transaction.amount).label("avg_amount"),
-        Category.name.label("category_name")
-    ).join(Category).filter(
-        Transaction.user_id == current_user.id,
-        Transaction.date >= six_months_ago,
-        Category.type == "expense"
-    ).group_by(
-        Transaction.description,
-        Transaction.category_id,
-        Transaction.amount,
-        Category.name
-    ).all()
-    
-    # Filter by subscription keywords (case-insensitive partial matching)
-    transactions = [
-        txn for txn in all_transactions 
-        if any(keyword.lower() in txn.category_name.lower() for keyword in subscription_keywords)
-    ]
-    
-    recurring = []
-    
-    for txn in transactions:
-        # Consider recurring if appears 2+ times in 6 months (bi-monthly or more frequent)
-        if txn.frequency >= 2:
-            # All transactions in these categories are subscriptions
-            is_likely_subscription = txn.frequency >= 2
-            
-            monthly_cost = txn.avg_amount * 12 if txn.frequency >= 2 else txn.avg_amount
-            
-            recurring.append({
-                "description": txn.description or f"{txn.category_name}",
-                "category": txn.category_name,
-                "frequency": txn.frequency,
-                "avg_amount": round(txn.avg_amount, 2),
-                "estimated_monthly": round(monthly_cost / 12, 2),
-                "estimated_yearly": round(monthly_cost, 2),
-                "is_subscription": is_likely_subscription,
-                "confidence": min(100, (txn.frequency / 4) * 100)  # 0-100% confidence based on frequency
-            })
-    
-    # Sort by yearly cost
-    recurring.sort(key=lambda x: x["estimated_yearly"], reverse=True)
-    
+    recurring = recurring_for_user(db, current_user.id)
+
     total_yearly = sum(r["estimated_yearly"] for r in recurring)
     subscriptions = [r for r in recurring if r["is_subscription"]]
     
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.models.user import User
-from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.core.security import hash_password, verify_password
+from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, RefreshRequest
+from app.core.security import hash_password_async, verify_and_update_async
 from app.core.jwt import create_access_token
+from app.core.config import ACCESS_TOKEN_EXPIRE_MINUTES
+from app.services.sessions import issue_refresh_token, rotate_refresh_token, revoke_refresh_token
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -19,26 +22,34 @@ def get_db():
 
 
 @router.post("/signup", response_model=UserResponse)
-def signup(user: UserCreate, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user.email).first()
+async def signup(user: UserCreate, db: Session = Depends(get_db)):
+    # Handlers are async so bcrypt runs on its own executor; DB calls go to the threadpool
+    existing_user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == user.email).first()
+    )
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     new_user = User(
         email=user.email,
-        hashed_password=hash_password(user.password)
+        hashed_password=await hash_password_async(user.password)
     )
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    def save():
+        db.add(new_user)
+        db.commit()
+        db.refresh(new_user)
+
+    await run_in_threadpool(save)
 
     return new_user
 
 
 @router.post("/login", response_model=Token)
-def login(user: UserLogin, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def login(user: UserLogin, db: Session = Depends(get_db)):
+    db_user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == user.email).first()
+    )
 
     if not db_user:
         raise HTTPException(
@@ -46,17 +57,62 @@ def login(user: UserLogin, db: Session = Depends(get_db)):
             detail="Invalid email or password"
         )
 
-    if not verify_password(user.password, db_user.hashed_password):
+    valid, new_hash = await verify_and_update_async(user.password, db_user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
+    def start_session():
+        if new_hash:
+            # Stored hash predates the current cost settings
+            db_user.hashed_password = new_hash
+        refresh_token = issue_refresh_token(db, db_user.id)
+        db.commit()
+        return refresh_token
+
+    refresh_token = await run_in_threadpool(start_session)
+
     access_token = create_access_token(
         data={"sub": db_user.email}
     )
 
     return {
         "access_token": access_token,
-        "token_type": "bearer"
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    }
+
+
+@router.post("/refresh", response_model=Token)
+def refresh(payload: RefreshRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new access token and a new refresh token"""
+    rotated = rotate_refresh_token(db, payload.refresh_token)
+    # Commit either way: a replayed token revokes its family
+    db.commit()
+
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token"
+        )
+
+    user_id, refresh_token = rotated
+    email = db.query(User.email).filter(User.id == user_id).scalar()
+
+    return {
+        "access_token": create_access_token(data={"sub": email}),
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60
     }
+
+
+@router.post("/logout")
+def logout(payload: RefreshRequest, db: Session = Depends(get_db)):
+    """Revoke the refresh token and every token rotated from it"""
+    revoke_refresh_token(db, payload.refresh_token)
+    db.commit()
+    return {"status": "logged_out"}
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
 from datetime import date
 
 from app.database import SessionLocal
-from app.models.transaction import Transaction
 from app.models.budget import Budget
 from app.models.category import Category
 from app.schemas.budget import BudgetCreate, BudgetResponse
 from app.core.dependencies import get_current_user
 from app.models.user import User
-from app.models.alert import Alert
+from app.services.budget_alerts import (
+    monthly_category_total,
+    on_budget_written,
+    refresh_alert,
+)
 
 router = APIRouter(prefix="/budget", tags=["Budget"])
 
@@ -45,6 +47,8 @@ def set_budget(
 
     if existing:
         existing.monthly_limit = budget.monthly_limit
+        db.flush()
+        on_budget_written(db, current_user.id, budget.category_id)
         db.commit()
         db.refresh(existing)
         return existing
@@ -56,6 +60,8 @@ def set_budget(
     )
 
     db.add(new_budget)
+    db.flush()
+    on_budget_written(db, current_user.id, budget.category_id)
     db.commit()
     db.refresh(new_budget)
     return new_budget
@@ -82,17 +88,8 @@ def budget_usage(
     if not budget:
         return {"used": 0, "limit": 0, "percentage": 0}
 
-    spent = (
-        db.query(func.sum(Transaction.amount))
-        .filter(
-            Transaction.user_id == current_user.id,
-            Transaction.category_id == category_id,
-            extract("year", Transaction.date) == year,
-            extract("month", Transaction.date) == month_num,
-        )
-        .scalar()
-        or 0
-    )
+    # Read-only: a month without a running total is scanned, not seeded
+    spent = monthly_category_total(db, current_user.id, category_id, year, month_num, seed=False)
 
     percentage = round((spent / budget.monthly_limit) * 100, 2)
 
@@ -130,74 +127,10 @@ def check_budget_alerts(
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    if category.type == "income":
-        db.query(Alert).filter(
-            Alert.user_id == current_user.id,
-            Alert.category_id == category_id,
-            Alert.year == year,
-            Alert.month == month_num
-        ).delete()
-        db.commit()
-        return {"status": "income_category"}
-
-    usage = budget_usage(
-        category_id,
-        f"{year}-{month_num:02}",
-        db,
-        current_user
-    )
-
-    # 🔴 No budget → remove alerts
-    if usage["limit"] == 0:
-        db.query(Alert).filter(
-            Alert.user_id == current_user.id,
-            Alert.category_id == category_id,
-            Alert.year == year,
-            Alert.month == month_num
-        ).delete()
-        db.commit()
-        return {"status": "no_budget"}
-
-    percentage = usage["percentage"]
-
-    # 🟢 Back within limit → remove alerts
-    if percentage < 80:
-        db.query(Alert).filter(
-            Alert.user_id == current_user.id,
-            Alert.category_id == category_id,
-            Alert.year == year,
-            Alert.month == month_num
-        ).delete()
-        db.commit()
-        return {"status": "within_limit"}
-
-    # ⚠️ Decide level
-    if percentage >= 100:
-        level = "danger"
-        message = "Budget exceeded! Please reduce spending."
-    else:
-        level = "warning"
-        message = "You have used over 80% of your budget."
-
-    existing = db.query(Alert).filter(
-        Alert.user_id == current_user.id,
-        Alert.category_id == category_id,
-        Alert.year == year,
-        Alert.month == month_num
-    ).first()
-
-    if existing:
-        existing.level = level
-        existing.message = message
-    else:
-        db.add(Alert(
-            user_id=current_user.id,
-            category_id=category_id,
-            year=year,
-            month=month_num,
-            level=level,
-            message=message
-        ))
-
+    # Alerts are kept current on every transaction/budget write; this
+    # endpoint only forces a re-evaluation from the running total.
+    result = refresh_alert(db, current_user.id, category_id, year, month_num)
+    if result["status"] == "category_not_found":
+        raise HTTPException(status_code=404, detail="Category not found")
     db.commit()
-    return {"status": "alert_triggered", "level": level}
+    return result
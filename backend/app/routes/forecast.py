@@ -0,0 +1,71 @@
+import numpy as np
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.core.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.forecast import CashflowForecastResponse
+from app.services.forecast import user_state, project
+
+router = APIRouter(prefix="/forecast", tags=["Forecast"])
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _rounded(values) -> list[float]:
+    return np.round(values, 2).tolist()
+
+
+@router.get("/cashflow", response_model=CashflowForecastResponse)
+def cashflow_forecast(
+    months: int = Query(6, ge=3, le=12),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Projected income, expense and net cash flow for the coming months,
+    from per-category seasonal smoothing plus scheduled recurring charges
+    """
+    state = user_state(db, current_user.id)
+    result = project(state, months)
+
+    categories = [
+        {
+            "category_id": cid,
+            "name": name,
+            "type": kind,
+            "method": "seasonal" if state["seasonal_fit"][i] else "smoothing",
+            "alpha": float(state["alpha"][i]),
+            "forecast": _rounded(result["baseline"][i]),
+        }
+        for i, (cid, (name, kind)) in enumerate(zip(state["category_ids"], state["categories"]))
+    ]
+
+    recurring = [
+        {
+            "merchant": item["merchant"],
+            "description": item["description"],
+            "category": item["category"],
+            "period": item["period"],
+            "amount": item["last_amount"],
+            "forecast": _rounded(result["recurring"][i]),
+        }
+        for i, item in enumerate(state["recurring"])
+    ]
+
+    return {
+        "months": result["months"],
+        "income": _rounded(result["income"]),
+        "expense": _rounded(result["expense"]),
+        "net": _rounded(result["net"]),
+        "cumulative_net": _rounded(np.cumsum(result["net"])),
+        "categories": categories,
+        "recurring": recurring,
+    }
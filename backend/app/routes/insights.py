@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
-from datetime import date, timedelta
+from datetime import date
 from collections import Counter
 
 from app.database import get_db
@@ -10,6 +10,7 @@ from app.models.category import Category
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.budget import Budget
+from app.services.recurring import recurring_for_user
 
 router = APIRouter(prefix="/insights", tags=["AI Insights"])
 
@@ -149,6 +150,46 @@ def get_enhanced_insights(
             "transaction_count": transactions_count,
             "type": "activity"
         })
+        # Insight 4: Unusual transactions, flagged when they were recorded
+        anomalies = (
+            db.query(
+                Transaction.amount,
+                Transaction.description,
+                Transaction.date,
+                Transaction.anomaly_score,
+                Category.name,
+            )
+            .join(Category)
+            .filter(
+                Transaction.user_id == current_user.id,
+                Transaction.is_anomaly == True,
+                extract("year", Transaction.date) == year,
+                extract("month", Transaction.date) == month_num,
+            )
+            .order_by(Transaction.anomaly_score.desc())
+            .limit(5)
+            .all()
+        )
+
+        if anomalies:
+            top = anomalies[0]
+            spending_patterns.append({
+                "title": "Unusual Spending",
+                "icon": "🔍",
+                "description": f"{len(anomalies)} transaction(s) were much larger than usual for their category, e.g. ₹{round(top.amount, 2)} on {top.name}",
+                "metric": f"{len(anomalies)} unusual",
+                "transactions": [
+                    {
+                        "amount": a.amount,
+                        "description": a.description,
+                        "date": a.date,
+                        "category": a.name,
+                        "score": a.anomaly_score,
+                    }
+                    for a in anomalies
+                ],
+                "type": "anomaly"
+            })
     else:
         spending_patterns.append({
             "title": "No Spending Data",
@@ -162,44 +203,11 @@ def get_enhanced_insights(
     savings_ops = []
     
     # A. Detect unused/low-frequency subscriptions
-    today = date.today()
-    six_months_ago = today.replace(day=1) - timedelta(days=180)
-    
-    subscription_keywords = [
-        "subscription", "bill", "utilit", "insur", 
-        "entertain", "gym", "health", "stream", "internet", "phone", "netflix"
+    subscriptions = [
+        r for r in recurring_for_user(db, current_user.id)
+        if r["is_subscription"]
     ]
     
-    all_transactions = db.query(
-        Transaction.description,
-        Transaction.category_id,
-        Transaction.amount,
-        func.count(Transaction.id).label("frequency"),
-        func.avg(Transaction.amount).label("avg_amount"),
-        Category.name.label("category_name")
-    ).join(Category).filter(
-        Transaction.user_id == current_user.id,
-        Transaction.date >= six_months_ago,
-        Category.type == "expense"
-    ).group_by(
-        Transaction.description,
-        Transaction.category_id,
-        Transaction.amount,
-        Category.name
-    ).all()
-    
-    subscriptions = []
-    for txn in all_transactions:
-        if any(keyword.lower() in txn.category_name.lower() for keyword in subscription_keywords):
-            if txn.frequency >= 2:
-                subscriptions.append({
-                    "description": txn.description or txn.category_name,
-                    "category": txn.category_name,
-                    "frequency": txn.frequency,
-                    "avg_amount": round(txn.avg_amount, 2),
-                    "estimated_yearly": round((txn.avg_amount * 12), 2)
-                })
-    
     subscriptions.sort(key=lambda x: x["estimated_yearly"], reverse=True)
     
     # Most expensive subscription
@@ -208,9 +216,9 @@ def get_enhanced_insights(
         savings_ops.append({
             "title": "Most Expensive Subscription",
             "icon": "📺",
-            "description": f"Your most costly recurring expense is {most_expensive['description']} at ₹{most_expensive['avg_amount']}/month",
+            "description": f"Your most costly recurring expense is {most_expensive['description']} at ₹{most_expensive['estimated_monthly']}/month",
             "metric": f"₹{most_expensive['estimated_yearly']}/year",
-            "amount": most_expensive['avg_amount'],
+            "amount": most_expensive['estimated_monthly'],
             "type": "subscription"
         })
         
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -7,7 +9,13 @@ from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.models.category import Category
-from app.schemas.investment import InvestmentRequest, InvestmentResponse
+from app.schemas.investment import (
+    InvestmentRequest,
+    InvestmentResponse,
+    BacktestRequest,
+    BacktestResponse,
+)
+from app.services.backtest import RISK_ALLOCATIONS, backtest_profile
 
 router = APIRouter(prefix="/investment", tags=["Investment Advisor"])
 
@@ -75,14 +83,12 @@ def investment_advice(
         }
 
     # 2️⃣ Base allocation by risk profile
+    allocation = dict(RISK_ALLOCATIONS[payload.risk_profile])
     if payload.risk_profile == "low":
-        allocation = {"equity": 30, "debt": 45, "gold": 15, "emergency": 10}
         msg = "Low-risk profile favors stability through debt and gold with limited equity exposure."
     elif payload.risk_profile == "medium":
-        allocation = {"equity": 50, "debt": 30, "gold": 10, "emergency": 10}
         msg = "Balanced profile aims for growth with controlled risk and adequate safety."
     else:  # high
-        allocation = {"equity": 65, "debt": 20, "gold": 5, "emergency": 10}
         msg = "High-risk profile prioritizes long-term growth through higher equity exposure."
 
     # 3️⃣ Emergency fund adjustment (simple & explainable)
@@ -105,3 +111,31 @@ def investment_advice(
         "monthly_income": income,
         "monthly_expenses": monthly_expense
     }
+
+
+REBALANCE_MONTHS = {"monthly": 1, "quarterly": 3, "yearly": 12}
+
+
+@router.get("/backtest", response_model=BacktestResponse)
+def allocation_backtest(data: Annotated[BacktestRequest, Query()]):
+    """
+    Historical CAGR and drawdown distributions for the advised allocations,
+    over every start month in the price dataset
+    """
+    profiles = [data.risk_profile] if data.risk_profile else list(RISK_ALLOCATIONS)
+    results = [
+        backtest_profile(p, data.horizon_years, REBALANCE_MONTHS[data.rebalance])
+        for p in profiles
+    ]
+
+    if any(r is None for r in results):
+        raise HTTPException(
+            status_code=503,
+            detail="Price history is unavailable or shorter than the requested horizon"
+        )
+
+    return {
+        "horizon_years": data.horizon_years,
+        "rebalance": data.rebalance,
+        "profiles": results,
+    }
@@ -0,0 +1,67 @@
+import numpy as np
+from fastapi import APIRouter, HTTPException
+
+from app.schemas.loan import AmortizationRequest, AmortizationResponse
+from app.services.loans import emi, amortize
+
+router = APIRouter(prefix="/loans", tags=["Loan Calculator"])
+
+
+@router.post("/amortization", response_model=AmortizationResponse)
+def loan_amortization(data: AmortizationRequest):
+    """Amortization schedules and prepayment impact for several loans in one call"""
+    loans = data.loans
+    n = len(loans)
+    n_months = max(loan.tenure_months for loan in loans)
+
+    principal = np.array([loan.principal for loan in loans])
+    rate = np.array([loan.annual_rate for loan in loans])
+    tenure = np.array([loan.tenure_months for loan in loans])
+    emis = emi(principal, rate, tenure)
+
+    extra = np.zeros((n, n_months))
+    for i, loan in enumerate(loans):
+        extra[i, :loan.tenure_months] = loan.monthly_prepayment
+        for p in loan.prepayments:
+            if p.month > loan.tenure_months:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Prepayment month {p.month} is beyond the loan tenure"
+                )
+            extra[i, p.month - 1] += p.amount
+
+    # Prepaid and EMI-only schedules simulated together: rows n.. are baselines
+    result = amortize(
+        np.tile(principal, 2), np.tile(rate, 2), np.tile(emis, 2),
+        np.vstack([extra, np.zeros_like(extra)])
+    )
+    interest_total = result["interest"].sum(axis=1)
+
+    out = []
+    for i, loan in enumerate(loans):
+        months = int(result["months_taken"][i])
+        interest = result["interest"][i, :months]
+        principal_paid = result["principal"][i, :months]
+        prepaid = result["prepayment"][i, :months]
+
+        out.append({
+            "name": loan.name,
+            "emi": round(float(emis[i]), 2),
+            "months": months,
+            "total_interest": round(float(interest_total[i]), 2),
+            "total_paid": round(float(loan.principal + interest_total[i]), 2),
+            "baseline_months": int(result["months_taken"][n + i]),
+            "baseline_interest": round(float(interest_total[n + i]), 2),
+            "interest_saved": round(float(interest_total[n + i] - interest_total[i]), 2),
+            "months_saved": int(result["months_taken"][n + i]) - months,
+            "schedule": {
+                "month": list(range(1, months + 1)),
+                "emi": np.round(interest + principal_paid, 2).tolist(),
+                "interest": np.round(interest, 2).tolist(),
+                "principal": np.round(principal_paid, 2).tolist(),
+                "prepayment": np.round(prepaid, 2).tolist(),
+                "balance": np.round(result["balance"][i, :months], 2).tolist(),
+            },
+        })
+
+    return {"loans": out}
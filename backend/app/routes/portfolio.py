@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.investment_cash_flow import InvestmentCashFlow
+from app.schemas.portfolio import CashFlowCreate, CashFlowResponse, PortfolioReturnsResponse
+from app.core.dependencies import get_current_user
+from app.models.user import User
+from app.services.returns import load_cash_flows, portfolio_returns
+
+router = APIRouter(prefix="/portfolio", tags=["Portfolio Returns"])
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@router.post("/cash-flows", response_model=CashFlowResponse)
+def add_cash_flow(
+    flow: CashFlowCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Record a buy/sell/dividend, or a valuation (current market value) of a portfolio"""
+    new_flow = InvestmentCashFlow(
+        user_id=current_user.id,
+        portfolio=flow.portfolio.strip(),
+        date=flow.date,
+        kind=flow.kind,
+        amount=flow.amount
+    )
+
+    db.add(new_flow)
+    db.commit()
+    db.refresh(new_flow)
+    return new_flow
+
+
+@router.get("/cash-flows", response_model=list[CashFlowResponse])
+def list_cash_flows(
+    portfolio: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = db.query(InvestmentCashFlow).filter(
+        InvestmentCashFlow.user_id == current_user.id
+    )
+    if portfolio:
+        query = query.filter(InvestmentCashFlow.portfolio == portfolio)
+
+    return query.order_by(InvestmentCashFlow.date.desc()).all()
+
+
+@router.delete("/cash-flows/{flow_id}")
+def delete_cash_flow(
+    flow_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    flow = db.query(InvestmentCashFlow).filter(
+        InvestmentCashFlow.id == flow_id,
+        InvestmentCashFlow.user_id == current_user.id
+    ).first()
+
+    if not flow:
+        raise HTTPException(status_code=404, detail="Cash flow not found")
+
+    db.delete(flow)
+    db.commit()
+    return {"status": "deleted"}
+
+
+@router.get("/returns", response_model=PortfolioReturnsResponse)
+def get_portfolio_returns(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """XIRR and time-weighted return of each portfolio, up to its latest valuation"""
+    portfolios, totals = portfolio_returns(load_cash_flows(db, [current_user.id]))
+
+    if not totals:
+        return {
+            "portfolios": [],
+            "total": {
+                "portfolio": "All portfolios",
+                "invested": 0,
+                "withdrawn": 0,
+                "current_value": None,
+                "valued_on": None,
+                "xirr_percent": None,
+                "twr_percent": None
+            }
+        }
+
+    return {"portfolios": portfolios, "total": totals[0]}
@@ -1,22 +1,35 @@
-from fastapi import APIRouter
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request
 from app.schemas.savings import SavingsRequest, SavingsResponse
+from app.core.http_cache import canonical_key, cacheable_response
 
 router = APIRouter(prefix="/savings", tags=["Auto-Savings Advisor"])
 
-@router.post("/advice", response_model=SavingsResponse)
-def savings_advice(data: SavingsRequest):
-    income = data.monthly_income
-    expenses = data.monthly_expenses
+
+@lru_cache(maxsize=4096)
+def _advice(key: tuple) -> dict:
+    data = dict(key)
+    income = data["monthly_income"]
+    expenses = data["monthly_expenses"]
 
     savings = income - expenses
     percent = (savings / income) * 100 if income else 0
 
+    amounts = {
+        "monthly_income": round(income, 2),
+        "monthly_expense": round(expenses, 2),
+        "disposable": round(savings, 2),
+    }
+
     if savings <= 0:
         return {
             "savings_amount": 0,
             "savings_percent": 0,
             "level": "critical",
-            "message": "Your expenses exceed or equal your income. Focus on expense control first."
+            "message": "Your expenses exceed or equal your income. Focus on expense control first.",
+            **amounts
         }
 
     if percent <= 10:
@@ -33,5 +46,18 @@ def savings_advice(data: SavingsRequest):
         "savings_amount": round(savings, 2),
         "savings_percent": round(percent, 2),
         "level": level,
-        "message": message
+        "message": message,
+        **amounts
     }
+
+
+@router.post("/advice", response_model=SavingsResponse)
+def savings_advice(data: SavingsRequest):
+    return _advice(canonical_key(data))
+
+
+@router.get("/advice", response_model=SavingsResponse)
+def savings_advice_cached(request: Request, data: Annotated[SavingsRequest, Query()]):
+    """Same as POST, but cacheable by browsers/CDNs (ETag + Cache-Control)"""
+    key = canonical_key(data)
+    return cacheable_response(request, key, _advice(key), SavingsResponse)
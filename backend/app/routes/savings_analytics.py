@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
 from datetime import date, timedelta
@@ -7,6 +7,9 @@ from app.database import SessionLocal
 from app.models.transaction import Transaction
 from app.models.category import Category
 from app.models.autosave_record import AutoSaveRecord
+from app.models.autosave_rule import AutoSaveRule
+from app.models.savings_goal import SavingsGoal
+from app.schemas.autosave_rule import AutoSaveRuleCreate, AutoSaveRuleResponse
 from app.core.dependencies import get_current_user
 from app.models.user import User
 
@@ -333,6 +336,65 @@ def autosave_records(
     ]
 
 
+# AutoSave rules (executed daily by app.jobs.autosave)
+@router.post("/rules", response_model=AutoSaveRuleResponse)
+def create_autosave_rule(
+    rule: AutoSaveRuleCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if rule.goal_id is not None:
+        goal = db.query(SavingsGoal.id).filter(
+            SavingsGoal.id == rule.goal_id,
+            SavingsGoal.user_id == current_user.id
+        ).first()
+        if not goal:
+            raise HTTPException(status_code=404, detail="Goal not found")
+
+    new_rule = AutoSaveRule(
+        user_id=current_user.id,
+        rule_type=rule.rule_type,
+        value=rule.value,
+        goal_id=rule.goal_id,
+        is_active=True,
+        created_at=date.today()
+    )
+    db.add(new_rule)
+    db.commit()
+    db.refresh(new_rule)
+    return new_rule
+
+
+@router.get("/rules", response_model=list[AutoSaveRuleResponse])
+def list_autosave_rules(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return db.query(AutoSaveRule).filter(
+        AutoSaveRule.user_id == current_user.id
+    ).order_by(AutoSaveRule.id).all()
+
+
+@router.delete("/rules/{rule_id}")
+def delete_autosave_rule(
+    rule_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Deactivate a rule; its past records keep pointing at it"""
+    rule = db.query(AutoSaveRule).filter(
+        AutoSaveRule.id == rule_id,
+        AutoSaveRule.user_id == current_user.id
+    ).first()
+
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+
+    rule.is_active = False
+    db.commit()
+    return {"status": "deleted"}
+
+
 # Recommendations based on data
 @router.get("/recommendations")
 def get_recommendations(
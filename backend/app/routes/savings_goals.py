@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from datetime import date, timedelta
 
 from app.database import SessionLocal
@@ -8,10 +10,17 @@ from app.schemas.savings_goal import (
     SavingsGoalCreate, 
     SavingsGoalUpdate, 
     SavingsGoalResponse,
-    SavingsGoalAddProgress
+    SavingsGoalAddProgress,
+    GoalSIPPlanResponse,
+    GoalContributionResponse
 )
 from app.core.dependencies import get_current_user
 from app.models.user import User
+from app.models.transaction import Transaction
+from app.models.category import Category
+from app.models.goal_contribution import GoalContribution
+from app.services.sip import sip_unit_value
+from app.services.goals import add_progress
 
 router = APIRouter(prefix="/savings-goals", tags=["Savings Goals"])
 
@@ -81,6 +90,104 @@ def get_savings_goals(
     return [format_goal_response(goal) for goal in goals]
 
 
+def _months_until(today, target_date):
+    """Whole months of contributions left (at least 1 while the date is ahead)"""
+    if target_date is None or target_date <= today:
+        return 0
+    return max(1, (target_date.year - today.year) * 12 + target_date.month - today.month)
+
+
+@router.get("/required-sip", response_model=GoalSIPPlanResponse)
+def required_sip_for_goals(
+    expected_return: float = Query(12.0, ge=0, le=50, description="Annual return in %"),
+    step_up_percent: float = Query(0.0, ge=0, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Monthly SIP each goal needs to hit its target by its date, solved for all goals at once"""
+    today = date.today()
+    goals = db.query(SavingsGoal).filter(
+        SavingsGoal.user_id == current_user.id
+    ).order_by(SavingsGoal.priority, SavingsGoal.id).all()
+
+    # Average monthly surplus over the last 3 months, one aggregate query
+    totals = dict(
+        db.query(Category.type, func.sum(Transaction.amount))
+        .join(Transaction)
+        .filter(
+            Transaction.user_id == current_user.id,
+            Transaction.date >= today - timedelta(days=90)
+        )
+        .group_by(Category.type)
+        .all()
+    )
+    available = max(0, ((totals.get("income") or 0) - (totals.get("expense") or 0)) / 3)
+
+    if not goals:
+        return {
+            "expected_return": expected_return,
+            "step_up_percent": step_up_percent,
+            "available_monthly_savings": round(available, 2),
+            "total_required_monthly": 0,
+            "goals": []
+        }
+
+    target = np.array([g.target_amount for g in goals], dtype=np.float64)
+    current = np.array([g.current_amount or 0 for g in goals], dtype=np.float64)
+    has_date = np.array([g.target_date is not None for g in goals])
+    months = np.array([_months_until(today, g.target_date) for g in goals])
+
+    # Savings already in the goal keep compounding until the target date
+    monthly_rate = expected_return / 12 / 100
+    gap = np.maximum(target - current * (1 + monthly_rate) ** months, 0)
+    unit = sip_unit_value(months, expected_return, step_up_percent)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        required = np.where(unit > 0, gap / np.where(unit > 0, unit, 1), gap)
+
+    achieved = current >= target
+    overdue = has_date & (months == 0) & ~achieved
+    solvable = has_date & ~achieved & ~overdue
+    required = np.where(achieved, 0, required)
+
+    # Fund goals in priority order from the available surplus
+    funded = np.cumsum(np.where(solvable, required, 0)) <= available + 1e-9
+
+    plans = []
+    for i, goal in enumerate(goals):
+        if achieved[i]:
+            status, feasible = "achieved", True
+        elif not has_date[i]:
+            status, feasible = "no_target_date", None
+        elif overdue[i]:
+            status, feasible = "overdue", False
+        else:
+            status = "feasible" if funded[i] else "shortfall"
+            feasible = bool(funded[i])
+
+        plans.append({
+            "id": goal.id,
+            "name": goal.name,
+            "priority": goal.priority,
+            "target_amount": goal.target_amount,
+            "current_amount": goal.current_amount or 0,
+            "target_date": goal.target_date,
+            "months_remaining": int(months[i]) if has_date[i] else None,
+            "required_monthly": round(float(required[i]), 2) if solvable[i] or achieved[i] else None,
+            # Past its date a goal needs the rest as a lump sum, not a monthly amount
+            "overdue_amount": round(float(target[i] - current[i]), 2) if overdue[i] else None,
+            "status": status,
+            "feasible": feasible
+        })
+
+    return {
+        "expected_return": expected_return,
+        "step_up_percent": step_up_percent,
+        "available_monthly_savings": round(available, 2),
+        "total_required_monthly": round(float(required[solvable].sum()), 2),
+        "goals": plans
+    }
+
+
 @router.put("/{goal_id}", response_model=SavingsGoalResponse)
 def update_savings_goal(
     goal_id: int,
@@ -114,22 +221,46 @@ def add_goal_progress(
     current_user: User = Depends(get_current_user)
 ):
     """Add manual progress to a savings goal"""
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
-    
+    goal = add_progress(
+        db, current_user.id, goal_id, progress.amount, "manual", progress.description
+    )
+
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
-    
-    goal.current_amount += progress.amount
-    
+
     db.commit()
-    db.refresh(goal)
-    
+
     return format_goal_response(goal)
 
 
+@router.get("/{goal_id}/contributions", response_model=list[GoalContributionResponse])
+def goal_contributions(
+    goal_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Contribution history of a goal, newest first"""
+    goal_exists = db.query(SavingsGoal.id).filter(
+        SavingsGoal.id == goal_id,
+        SavingsGoal.user_id == current_user.id
+    ).first()
+
+    if not goal_exists:
+        raise HTTPException(status_code=404, detail="Goal not found")
+
+    return (
+        db.query(GoalContribution)
+        .filter(
+            GoalContribution.goal_id == goal_id,
+            GoalContribution.user_id == current_user.id
+        )
+        .order_by(GoalContribution.created_at.desc(), GoalContribution.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
 @router.delete("/{goal_id}")
 def delete_savings_goal(
     goal_id: int,
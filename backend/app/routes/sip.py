@@ -1,34 +1,101 @@
-from fastapi import APIRouter
-from app.schemas.sip import SIPRequest, SIPResponse
+from functools import lru_cache
+from typing import Annotated
+
+import numpy as np
+from fastapi import APIRouter, Query, Request
+from app.schemas.sip import (
+    SIPRequest,
+    SIPResponse,
+    SIPScenarioRequest,
+    SIPScenarioResponse,
+    SIPMonteCarloRequest,
+    SIPMonteCarloResponse,
+)
+from app.services.sip import project_sip, simulate_sip
+from app.core.http_cache import canonical_key, cacheable_response
 
 router = APIRouter(prefix="/sip", tags=["SIP Calculator"])
 
 
+@lru_cache(maxsize=4096)
+def _calculate(key: tuple) -> dict:
+    data = dict(key)
+    invested, balances = project_sip(
+        data["monthly_investment"], data["annual_rate"], int(data["years"]), data["step_up_percent"]
+    )
+    total_invested = float(invested[0])
+    maturity_value = float(balances[0, -1])
+
+    gain = maturity_value - total_invested
+
+    return {
+        "total_invested": round(total_invested, 2),
+        "maturity_value": round(maturity_value, 2),
+        "gain": round(gain, 2),
+    }
+
+
 @router.post("/calculate", response_model=SIPResponse)
 def calculate_sip(data: SIPRequest):
-    monthly = data.monthly_investment
-    annual_rate = data.annual_rate
-    years = data.years
-    step_up = data.step_up_percent / 100  # convert % to decimal
+    return _calculate(canonical_key(data))
 
-    monthly_rate = annual_rate / 12 / 100
 
-    total_invested = 0.0
-    maturity_value = 0.0
-    current_monthly = monthly
+@router.get("/calculate", response_model=SIPResponse)
+def calculate_sip_cached(request: Request, data: Annotated[SIPRequest, Query()]):
+    """Same as POST, but cacheable by browsers/CDNs (ETag + Cache-Control)"""
+    key = canonical_key(data)
+    return cacheable_response(request, key, _calculate(key), SIPResponse)
 
-    for year in range(years):
-        for _ in range(12):
-            maturity_value = (maturity_value + current_monthly) * (1 + monthly_rate)
-            total_invested += current_monthly
 
-        # Apply step-up once per year
-        current_monthly += current_monthly * step_up
+@router.post("/scenarios", response_model=SIPScenarioResponse)
+def sip_scenarios(data: SIPScenarioRequest):
+    """Every combination of the given amounts, rates, tenures and step-ups in one call"""
+    grid = data.grid()
+    mesh = np.meshgrid(
+        grid["monthly_investment"],
+        grid["annual_rate"],
+        grid["years"],
+        grid["step_up_percent"],
+        indexing="ij",
+    )
+    monthly, rate, years, step_up = (m.ravel() for m in mesh)
 
-    gain = maturity_value - total_invested
+    invested, balances = project_sip(monthly, rate, years, step_up)
+    maturity = balances[np.arange(len(years)), years.astype(np.int64) - 1]
+    balances = np.round(balances, 2)
 
     return {
-        "total_invested": round(total_invested, 2),
-        "maturity_value": round(maturity_value, 2),
-        "gain": round(gain, 2),
+        "count": len(years),
+        "monthly_investment": monthly.tolist(),
+        "annual_rate": rate.tolist(),
+        "years": years.astype(np.int64).tolist(),
+        "step_up_percent": step_up.tolist(),
+        "total_invested": np.round(invested, 2).tolist(),
+        "maturity_value": np.round(maturity, 2).tolist(),
+        "gain": np.round(maturity - invested, 2).tolist(),
+        "yearly_balances": [row[:n].tolist() for row, n in zip(balances, years.astype(np.int64))],
+    }
+
+
+@router.post("/monte-carlo", response_model=SIPMonteCarloResponse)
+def sip_monte_carlo(data: SIPMonteCarloRequest):
+    """P10/P50/P90 balances per year over simulated market return paths"""
+    invested, values = simulate_sip(
+        data.monthly_investment,
+        data.years,
+        data.step_up_percent,
+        data.expected_return,
+        data.volatility,
+        data.paths,
+        data.seed,
+    )
+    p10, p50, p90 = np.percentile(values, [10, 50, 90], axis=0)
+
+    return {
+        "paths": data.paths,
+        "total_invested": np.round(invested, 2).tolist(),
+        "p10": np.round(p10, 2).tolist(),
+        "p50": np.round(p50, 2).tolist(),
+        "p90": np.round(p90, 2).tolist(),
+        "probability_of_loss": round(float((values[:, -1] < invested[-1]).mean()), 4),
     }
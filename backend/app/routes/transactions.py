@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from datetime import date
 
 from app.database import SessionLocal
 from app.models.transaction import Transaction
 from app.models.category import Category
-from app.schemas.transaction import TransactionCreate, TransactionResponse
+from app.schemas.transaction import TransactionCreate, TransactionResponse, TransactionSearchResponse
 from app.core.dependencies import get_current_user
 from app.models.user import User
+from app.services.budget_alerts import on_transaction_written
+from app.services.merchants import normalize_merchant
+from app.services.anomalies import score_transaction, remove_amount
+from app.services import search, forecast
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
@@ -34,17 +38,33 @@ def create_transaction(
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
+    # Scored against the category's running stats, not a history scan
+    score, unusual = score_transaction(
+        db, current_user.id, transaction.category_id, transaction.amount
+    )
+
     new_transaction = Transaction(
         amount=transaction.amount,
         description=transaction.description,
         date=transaction.date,
+        merchant_key=normalize_merchant(transaction.description, category.name),
+        anomaly_score=score,
+        is_anomaly=unusual and category.type == "expense",
         category_id=transaction.category_id,
         user_id=current_user.id
     )
 
     db.add(new_transaction)
+    db.flush()
+
+    # Keep the running monthly total and the budget alert in step
+    on_transaction_written(
+        db, current_user.id, new_transaction.category_id, new_transaction.date, new_transaction.amount
+    )
     db.commit()
     db.refresh(new_transaction)
+    search.invalidate(current_user.id)
+    forecast.invalidate(current_user.id)
 
     # Explicit response mapping to satisfy TransactionResponse
     return {
@@ -80,6 +100,27 @@ def get_transactions(
 
     return results
 
+@router.get("/search", response_model=TransactionSearchResponse)
+def search_transactions(
+    q: str = Query(..., min_length=1, max_length=100),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Prefix and typo-tolerant search over transaction descriptions"""
+    # Fetch one extra row to know whether another page exists
+    rows = search.search_transactions(
+        db, current_user.id, q, limit=page_size + 1, offset=(page - 1) * page_size
+    )
+
+    return {
+        "items": rows[:page_size],
+        "page": page,
+        "page_size": page_size,
+        "has_more": len(rows) > page_size,
+    }
+
 @router.delete("/{transaction_id}")
 def delete_transaction(
     transaction_id: int,
@@ -95,6 +136,14 @@ def delete_transaction(
         raise HTTPException(status_code=404, detail="Transaction not found")
 
     db.delete(transaction)
+    db.flush()
+
+    on_transaction_written(
+        db, current_user.id, transaction.category_id, transaction.date, -transaction.amount
+    )
+    remove_amount(db, current_user.id, transaction.category_id, transaction.amount)
     db.commit()
+    search.invalidate(current_user.id)
+    forecast.invalidate(current_user.id)
 
     return {"status": "deleted"}
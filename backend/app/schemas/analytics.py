@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from datetime import date
+from datetime import date, datetime
 
 
 class ExpenseByCategoryResponse(BaseModel):
@@ -10,3 +10,17 @@ class ExpenseByCategoryResponse(BaseModel):
 class DailyExpenseResponse(BaseModel):
     date: date
     total_amount: float
+
+
+class SpendingBenchmarkResponse(BaseModel):
+    category: str
+    year: int
+    month: int
+    your_spending: float
+    percentile: float  # share of users spending less in this category
+    peer_count: int
+    peer_p25: float
+    peer_median: float
+    peer_p75: float
+    peer_p90: float
+    built_at: datetime
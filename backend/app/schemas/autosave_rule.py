@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field, model_validator
+from datetime import date
+from typing import Literal
+
+
+class AutoSaveRuleCreate(BaseModel):
+    rule_type: Literal["percentage", "roundup", "fixed", "income_percent"]
+    value: float = Field(..., gt=0, description="% for percentage rules, ₹ step for roundup, ₹ per month for fixed")
+    goal_id: int | None = None
+
+    @model_validator(mode="after")
+    def check_percent(self):
+        if self.rule_type in ("percentage", "income_percent") and self.value > 100:
+            raise ValueError("Percentage rules must be at most 100")
+        return self
+
+
+class AutoSaveRuleResponse(BaseModel):
+    id: int
+    rule_type: str
+    value: float
+    goal_id: int | None
+    is_active: bool
+    created_at: date
+
+    class Config:
+        from_attributes = True
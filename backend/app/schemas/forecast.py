@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+
+
+class CategoryForecast(BaseModel):
+    category_id: int
+    name: str
+    type: str
+    method: str  # "seasonal" or "smoothing"
+    alpha: float
+    forecast: list[float]
+
+
+class RecurringForecast(BaseModel):
+    merchant: str
+    description: str
+    category: str
+    period: str
+    amount: float
+    forecast: list[float]
+
+
+class CashflowForecastResponse(BaseModel):
+    """Columnar: entry i of every list belongs to months[i]"""
+    months: list[str]
+    income: list[float]
+    expense: list[float]
+    net: list[float]
+    cumulative_net: list[float]
+    categories: list[CategoryForecast]
+    recurring: list[RecurringForecast]
@@ -18,3 +18,33 @@ class InvestmentResponse(BaseModel):
     investable_amount: float
     monthly_income: float
     monthly_expenses: float
+
+
+class BacktestRequest(BaseModel):
+    risk_profile: Optional[Literal["low", "medium", "high"]] = None  # None = all profiles
+    horizon_years: int = Field(default=10, ge=1, le=40)
+    rebalance: Literal["monthly", "quarterly", "yearly"] = "yearly"
+
+class PercentileBand(BaseModel):
+    p5: float
+    p25: float
+    p50: float
+    p75: float
+    p95: float
+
+class ProfileBacktest(BaseModel):
+    risk_profile: str
+    allocation: InvestmentAllocation
+    windows: int  # number of start months simulated
+    first_start: str
+    last_start: str
+    cagr: PercentileBand  # % per year
+    max_drawdown: PercentileBand  # % peak-to-trough
+    worst_cagr: float
+    worst_drawdown: float
+    probability_of_loss: float
+
+class BacktestResponse(BaseModel):
+    horizon_years: int
+    rebalance: str
+    profiles: list[ProfileBacktest]
@@ -0,0 +1,51 @@
+from pydantic import BaseModel, Field
+
+
+MAX_LOANS = 20
+MAX_TENURE_MONTHS = 480
+
+
+class Prepayment(BaseModel):
+    month: int = Field(..., ge=1, description="Paid after this month's EMI (1 = first month)")
+    amount: float = Field(..., gt=0)
+
+
+class LoanInput(BaseModel):
+    name: str | None = None
+    principal: float = Field(..., gt=0)
+    annual_rate: float = Field(..., ge=0, le=100, description="Annual interest rate in %")
+    tenure_months: int = Field(..., gt=0, le=MAX_TENURE_MONTHS)
+    monthly_prepayment: float = Field(default=0.0, ge=0, description="Extra paid every month")
+    prepayments: list[Prepayment] = []
+
+
+class AmortizationRequest(BaseModel):
+    loans: list[LoanInput] = Field(..., min_length=1, max_length=MAX_LOANS)
+
+
+class AmortizationSchedule(BaseModel):
+    """Columnar: entry i of every list is month i + 1"""
+    month: list[int]
+    emi: list[float]
+    interest: list[float]
+    principal: list[float]
+    prepayment: list[float]
+    balance: list[float]
+
+
+class LoanAmortization(BaseModel):
+    name: str | None
+    emi: float
+    months: int
+    total_interest: float
+    total_paid: float
+    # Impact of prepayments versus paying only the EMI
+    baseline_months: int
+    baseline_interest: float
+    interest_saved: float
+    months_saved: int
+    schedule: AmortizationSchedule
+
+
+class AmortizationResponse(BaseModel):
+    loans: list[LoanAmortization]
@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import Literal
+
+
+class CashFlowCreate(BaseModel):
+    portfolio: str = Field(..., min_length=1, max_length=100)
+    date: date
+    kind: Literal["buy", "sell", "dividend", "valuation"]
+    amount: float = Field(..., gt=0)
+
+
+class CashFlowResponse(BaseModel):
+    id: int
+    portfolio: str
+    date: date
+    kind: str
+    amount: float
+
+    class Config:
+        from_attributes = True
+
+
+class PortfolioReturn(BaseModel):
+    portfolio: str
+    invested: float
+    withdrawn: float
+    current_value: float | None
+    valued_on: date | None
+    xirr_percent: float | None  # None until there is a valuation
+    twr_percent: float | None  # annualized time-weighted return
+
+
+class PortfolioReturnsResponse(BaseModel):
+    portfolios: list[PortfolioReturn]
+    total: PortfolioReturn
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from datetime import date
+from datetime import date, datetime
 
 
 class SavingsGoalCreate(BaseModel):
@@ -38,3 +38,36 @@ class SavingsGoalResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class GoalContributionResponse(BaseModel):
+    id: int
+    amount: float
+    source: str
+    description: str | None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class GoalSIPPlan(BaseModel):
+    id: int
+    name: str
+    priority: int
+    target_amount: float
+    current_amount: float
+    target_date: date | None
+    months_remaining: int | None
+    required_monthly: float | None  # None when the goal has no target date or is overdue
+    overdue_amount: float | None  # Still missing from an overdue goal, else None
+    status: str  # achieved | overdue | no_target_date | feasible | shortfall
+    feasible: bool | None
+
+
+class GoalSIPPlanResponse(BaseModel):
+    expected_return: float
+    step_up_percent: float
+    available_monthly_savings: float
+    total_required_monthly: float
+    goals: list[GoalSIPPlan]
@@ -1,10 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+MAX_SCENARIOS = 20000
+MAX_YEARS = 50
 
 
 class SIPRequest(BaseModel):
     monthly_investment: float = Field(..., gt=0)
     annual_rate: float = Field(..., gt=0, description="Annual return rate in %")
-    years: int = Field(..., gt=0)
+    years: int = Field(..., gt=0, le=MAX_YEARS)
 
     # Optional → 0 means normal SIP
     step_up_percent: float = Field(
@@ -18,3 +21,103 @@ class SIPResponse(BaseModel):
     total_invested: float
     maturity_value: float
     gain: float
+
+
+class SIPRange(BaseModel):
+    """Inclusive range: start, start + step, ... up to stop"""
+    start: float
+    stop: float
+    step: float = Field(..., gt=0)
+
+    def count(self) -> int:
+        return max(int((self.stop - self.start) / self.step + 1e-9) + 1, 0)
+
+    def values(self) -> list[float]:
+        return [self.start + i * self.step for i in range(self.count())]
+
+
+class SIPScenarioRequest(BaseModel):
+    monthly_investment: list[float] | SIPRange
+    annual_rate: list[float] | SIPRange = Field(..., description="Annual return rates in %")
+    years: list[int] | SIPRange
+    step_up_percent: list[float] | SIPRange = [0.0]
+
+    @staticmethod
+    def _expand(spec) -> list[float]:
+        return spec.values() if isinstance(spec, SIPRange) else list(spec)
+
+    def grid(self) -> dict[str, list[float]]:
+        return {
+            "monthly_investment": self._expand(self.monthly_investment),
+            "annual_rate": self._expand(self.annual_rate),
+            "years": [int(y) for y in self._expand(self.years)],
+            "step_up_percent": self._expand(self.step_up_percent),
+        }
+
+    @model_validator(mode="after")
+    def check_grid(self):
+        # Size the grid before expanding any range
+        total = 1
+        for spec in (self.monthly_investment, self.annual_rate, self.years, self.step_up_percent):
+            size = spec.count() if isinstance(spec, SIPRange) else len(spec)
+            if size == 0:
+                raise ValueError("Every parameter needs at least one value")
+            total *= size
+        if total > MAX_SCENARIOS:
+            raise ValueError(f"Grid has {total} scenarios; the limit is {MAX_SCENARIOS}")
+
+        grid = self.grid()
+        if min(grid["monthly_investment"]) <= 0:
+            raise ValueError("monthly_investment must be > 0")
+        if min(grid["annual_rate"]) < 0 or min(grid["step_up_percent"]) < 0:
+            raise ValueError("annual_rate and step_up_percent must be >= 0")
+        if min(grid["years"]) <= 0 or max(grid["years"]) > MAX_YEARS:
+            raise ValueError(f"years must be between 1 and {MAX_YEARS}")
+        return self
+
+
+class SIPScenarioResponse(BaseModel):
+    """Columnar: entry i of every list belongs to scenario i"""
+    count: int
+    monthly_investment: list[float]
+    annual_rate: list[float]
+    years: list[int]
+    step_up_percent: list[float]
+    total_invested: list[float]
+    maturity_value: list[float]
+    gain: list[float]
+    yearly_balances: list[list[float]]
+
+
+MAX_PATHS = 100_000
+# Simulated year-end balances held per request (float32: ~12 MB)
+MAX_PATH_YEARS = 100_000 * 30
+
+
+class SIPMonteCarloRequest(BaseModel):
+    monthly_investment: float = Field(..., gt=0)
+    years: int = Field(..., gt=0, le=MAX_YEARS)
+    step_up_percent: float = Field(default=0.0, ge=0)
+    expected_return: float = Field(default=12.0, gt=-100, description="Mean annual return in %")
+    volatility: float = Field(default=15.0, ge=0, description="Annual volatility in %")
+    paths: int = Field(default=10000, ge=100, le=MAX_PATHS)
+    seed: int | None = Field(default=None, description="Fix for reproducible bands")
+
+    @model_validator(mode="after")
+    def check_size(self):
+        if self.paths * self.years > MAX_PATH_YEARS:
+            raise ValueError(
+                f"paths x years is {self.paths * self.years}; the limit is {MAX_PATH_YEARS} "
+                f"(e.g. {MAX_PATH_YEARS // self.years} paths for {self.years} years)"
+            )
+        return self
+
+
+class SIPMonteCarloResponse(BaseModel):
+    """Per-year bands; entry i is the balance at the end of year i + 1"""
+    paths: int
+    total_invested: list[float]
+    p10: list[float]
+    p50: list[float]
+    p90: list[float]
+    probability_of_loss: float  # share of paths ending below total invested
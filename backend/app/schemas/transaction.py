@@ -20,3 +20,10 @@ class TransactionResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TransactionSearchResponse(BaseModel):
+    items: list[TransactionResponse]
+    page: int
+    page_size: int
+    has_more: bool
@@ -0,0 +1,108 @@
+import math
+
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
+from app.database import upsert
+from app.models.category_spend_stats import CategorySpendStats
+from app.models.transaction import Transaction
+
+# Transactions needed in a category before amounts are judged
+MIN_HISTORY = 5
+Z_THRESHOLD = 3.0
+# Keeps near-identical histories (same bill every month) from flagging tiny changes
+MIN_STD_FRACTION = 0.1
+
+
+def _stats_filter(user_id: int, category_id: int):
+    return (
+        CategorySpendStats.user_id == user_id,
+        CategorySpendStats.category_id == category_id,
+    )
+
+
+def _seed_stats(db: Session, user_id: int, category_id: int):
+    """Build the running stats of a category that has none yet (one-off scan)"""
+    count, mean, mean_sq = (
+        db.query(
+            func.count(Transaction.id),
+            func.avg(Transaction.amount),
+            func.avg(Transaction.amount * Transaction.amount),
+        )
+        .filter(Transaction.user_id == user_id, Transaction.category_id == category_id)
+        .one()
+    )
+    mean = mean or 0
+    m2 = max((mean_sq or 0) - mean * mean, 0) * count
+    db.execute(
+        upsert(db, CategorySpendStats)
+        .values(user_id=user_id, category_id=category_id, count=count, mean=mean, m2=m2)
+        .on_conflict_do_nothing(index_elements=["user_id", "category_id"])
+    )
+
+
+def _add_amount(db: Session, user_id: int, category_id: int, amount: float):
+    """Welford update in one statement; returns the new (count, mean, m2) or None"""
+    n = CategorySpendStats.count + 1
+    delta = amount - CategorySpendStats.mean
+    return db.execute(
+        update(CategorySpendStats)
+        .where(*_stats_filter(user_id, category_id))
+        .values(
+            count=n,
+            mean=CategorySpendStats.mean + delta / n,
+            m2=CategorySpendStats.m2 + delta * (delta - delta / n),
+        )
+        .returning(CategorySpendStats.count, CategorySpendStats.mean, CategorySpendStats.m2)
+    ).first()
+
+
+def anomaly_score(count: int, mean: float, m2: float, amount: float) -> float | None:
+    """How many standard deviations ``amount`` sits above the history, O(1)"""
+    if count < MIN_HISTORY:
+        return None
+    std = max(math.sqrt(m2 / (count - 1)), abs(mean) * MIN_STD_FRACTION)
+    if std == 0:
+        return None
+    return (amount - mean) / std
+
+
+def score_transaction(db: Session, user_id: int, category_id: int, amount: float):
+    """
+    Fold a new amount into the category's running stats and score it against
+    the history before it. Call before the transaction row is added.
+    Returns ``(score, is_anomaly)``.
+    """
+    stats = _add_amount(db, user_id, category_id, amount)
+    if stats is None:
+        _seed_stats(db, user_id, category_id)
+        stats = _add_amount(db, user_id, category_id, amount)
+
+    # Step the returned stats back to what they were before this amount
+    count, mean, m2 = stats
+    prior_count = count - 1
+    if prior_count == 0:
+        return None, False
+    prior_mean = (mean * count - amount) / prior_count
+    prior_m2 = max(m2 - (amount - prior_mean) * (amount - mean), 0)
+
+    score = anomaly_score(prior_count, prior_mean, prior_m2, amount)
+    if score is None:
+        return None, False
+    return round(score, 2), score >= Z_THRESHOLD
+
+
+def remove_amount(db: Session, user_id: int, category_id: int, amount: float):
+    """Reverse Welford update for a deleted transaction"""
+    n = CategorySpendStats.count
+    new_mean = case((n > 1, (CategorySpendStats.mean * n - amount) / (n - 1)), else_=0)
+    new_m2 = CategorySpendStats.m2 - (amount - new_mean) * (amount - CategorySpendStats.mean)
+    db.execute(
+        update(CategorySpendStats)
+        .where(*_stats_filter(user_id, category_id), CategorySpendStats.count > 0)
+        .values(
+            count=n - 1,
+            mean=new_mean,
+            m2=case((n > 1, case((new_m2 > 0, new_m2), else_=0)), else_=0),
+        )
+    )
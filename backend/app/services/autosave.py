@@ -0,0 +1,164 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import bindparam, case, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.database import upsert
+from app.models.autosave_record import AutoSaveRecord
+from app.models.autosave_rule import AutoSaveRule
+from app.models.category import Category
+from app.models.goal_contribution import GoalContribution
+from app.models.savings_goal import SavingsGoal
+from app.models.transaction import Transaction
+
+RULE_TYPES = ("percentage", "roundup", "fixed", "income_percent")
+CHUNK_SIZE = 5000
+
+
+def _roundup(amount, step):
+    """Spare change from rounding ``amount`` up to a multiple of ``step`` (portable SQL)"""
+    # floor(), not CAST: Postgres rounds on CAST to integer, SQLite truncates
+    whole = func.floor(amount / step) * step
+    return case((amount > whole, whole + step - amount), else_=0)
+
+
+def _day_totals(db: Session, rule_ids: list[int], run_date: date) -> dict:
+    """Expense, income and round-up sums of the day for every rule in a chunk, one query"""
+    is_expense = Category.type == "expense"
+    rows = db.execute(
+        select(
+            AutoSaveRule.id,
+            func.sum(case((is_expense, Transaction.amount), else_=0)),
+            func.sum(case((Category.type == "income", Transaction.amount), else_=0)),
+            func.sum(case(
+                (is_expense & (AutoSaveRule.rule_type == "roundup"),
+                 _roundup(Transaction.amount, AutoSaveRule.value)),
+                else_=0,
+            )),
+        )
+        .join(Transaction, Transaction.user_id == AutoSaveRule.user_id)
+        .join(Category, Category.id == Transaction.category_id)
+        .where(AutoSaveRule.id.in_(rule_ids), Transaction.date == run_date)
+        .group_by(AutoSaveRule.id)
+    ).all()
+    return {rule_id: (expense, income, spare) for rule_id, expense, income, spare in rows}
+
+
+def rule_amount(rule_type: str, value: float, expense: float, income: float, spare: float) -> float:
+    if rule_type == "percentage":
+        return expense * value / 100
+    if rule_type == "income_percent":
+        return income * value / 100
+    if rule_type == "roundup":
+        return spare
+    return value  # fixed
+
+
+def rule_due(rule_type: str, created_at: date | None, run_date: date) -> bool:
+    """
+    Whether a rule runs for ``run_date``: never before the day it was created;
+    fixed rules save once a month, on their creation day (or the month's last
+    day when it is shorter), the others daily.
+    """
+    if created_at is None or run_date < created_at:
+        return False
+    if rule_type != "fixed":
+        return True
+    last_day = calendar.monthrange(run_date.year, run_date.month)[1]
+    return run_date.day == min(created_at.day, last_day)
+
+
+def _run_chunk(db: Session, rules, run_date: date, run_key: str) -> tuple[int, float]:
+    rules = [r for r in rules if rule_due(r.rule_type, r.created_at, run_date)]
+    if not rules:
+        return 0, 0.0
+    totals = _day_totals(db, [r.id for r in rules if r.rule_type != "fixed"], run_date)
+
+    records = []
+    for rule in rules:
+        amount = round(rule_amount(rule.rule_type, rule.value, *totals.get(rule.id, (0, 0, 0))), 2)
+        if amount > 0:
+            records.append({
+                "user_id": rule.user_id,
+                "amount": amount,
+                "date": run_date,
+                "rule_type": rule.rule_type,
+                "goal_id": rule.goal_id,
+                "status": "success",
+                "rule_id": rule.id,
+                "run_key": run_key,
+            })
+    if not records:
+        return 0, 0.0
+
+    now = datetime.utcnow()
+
+    # Records already written by an earlier attempt of this run are skipped,
+    # and only the rows inserted now move goal balances
+    inserted = db.execute(
+        upsert(db, AutoSaveRecord.__table__)
+        .on_conflict_do_nothing(index_elements=["rule_id", "run_key"])
+        .returning(AutoSaveRecord.user_id, AutoSaveRecord.goal_id, AutoSaveRecord.amount),
+        records,
+    ).all()
+
+    per_goal = {}
+    contributions = []
+    for user_id, goal_id, amount in inserted:
+        if goal_id is not None:
+            per_goal[goal_id] = per_goal.get(goal_id, 0) + amount
+            contributions.append({
+                "goal_id": goal_id,
+                "user_id": user_id,
+                "amount": amount,
+                "source": "autosave",
+                "description": f"Auto-save {run_key}",
+                "created_at": now,
+            })
+    if per_goal:
+        goals = SavingsGoal.__table__
+        db.execute(
+            update(goals)
+            .where(goals.c.id == bindparam("goal"))
+            .values(current_amount=func.coalesce(goals.c.current_amount, 0) + bindparam("delta")),
+            [{"goal": goal_id, "delta": delta} for goal_id, delta in per_goal.items()],
+        )
+        db.execute(insert(GoalContribution.__table__), contributions)
+    return len(inserted), sum(amount for *_, amount in inserted)
+
+
+def run_autosave(db: Session, run_date: date | None = None, chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Evaluate every active rule for ``run_date`` (default yesterday).
+
+    Rules are walked in id order, ``chunk_size`` at a time; each chunk is
+    one aggregate query, one bulk insert and one batched goal update, and
+    commits on its own. The run key makes the job safe to re-run or resume.
+    """
+    run_date = run_date or date.today() - timedelta(days=1)
+    run_key = run_date.isoformat()
+    summary = {"run_key": run_key, "rules": 0, "records": 0, "amount": 0.0}
+
+    last_id = 0
+    while True:
+        rules = db.execute(
+            select(AutoSaveRule.id, AutoSaveRule.user_id, AutoSaveRule.rule_type,
+                   AutoSaveRule.value, AutoSaveRule.goal_id, AutoSaveRule.created_at)
+            .where(AutoSaveRule.is_active == True, AutoSaveRule.id > last_id)
+            .order_by(AutoSaveRule.id)
+            .limit(chunk_size)
+        ).all()
+        if not rules:
+            break
+
+        records, amount = _run_chunk(db, rules, run_date, run_key)
+        db.commit()
+
+        summary["rules"] += len(rules)
+        summary["records"] += records
+        summary["amount"] += amount
+        last_id = rules[-1].id
+
+    summary["amount"] = round(summary["amount"], 2)
+    return summary
@@ -0,0 +1,147 @@
+import csv
+import os
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.core.config import BACKTEST_DATA_PATH
+
+# Target allocations (%) per risk profile, shared with /investment/advice
+RISK_ALLOCATIONS = {
+    "low": {"equity": 30, "debt": 45, "gold": 15, "emergency": 10},
+    "medium": {"equity": 50, "debt": 30, "gold": 10, "emergency": 10},
+    "high": {"equity": 65, "debt": 20, "gold": 5, "emergency": 10},
+}
+
+ASSETS = ("equity", "debt", "gold")
+# The emergency bucket sits in a savings account rather than a traded asset
+EMERGENCY_ANNUAL_RATE = 4.0
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _read_prices(path):
+    """(yyyymm, equity, debt, gold) rows from CSV or Parquet, month-end only"""
+    if path.endswith(".parquet"):
+        import pandas as pd
+
+        frame = pd.read_parquet(path, columns=["date", *ASSETS])
+        dates = frame["date"].astype(str).tolist()
+        prices = frame[list(ASSETS)].to_numpy(dtype=np.float64)
+    else:
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        dates = [row["date"] for row in rows]
+        prices = np.array([[float(row[a]) for a in ASSETS] for row in rows])
+
+    months = np.array([int(d[:4]) * 100 + int(d[5:7]) for d in dates], dtype=np.int64)
+    order = np.argsort(months, kind="stable")
+    months, prices = months[order], prices[order]
+
+    # Daily or weekly data collapses to the last observation of each month
+    last = np.r_[months[1:] != months[:-1], True]
+    return np.column_stack([months[last], prices[last]])
+
+
+def load_prices(path=BACKTEST_DATA_PATH):
+    """
+    Monthly price table as a read-only memory-mapped (months, 4) array.
+
+    The source file is parsed once into a ``.npy`` sidecar next to it; later
+    loads (and other workers) map that file instead of re-parsing. Returns
+    None when no dataset is installed.
+    """
+    if not os.path.exists(path):
+        return None
+
+    cache_path = os.path.splitext(path)[0] + ".npy"
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+        # Each writer gets its own temp file; concurrent first loads all
+        # publish a complete sidecar and the last rename wins
+        prices = _read_prices(path)
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(cache_path) or ".", suffix=".npy", delete=False
+        ) as tmp:
+            np.save(tmp, prices)
+        try:
+            os.replace(tmp.name, cache_path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+    return np.load(cache_path, mmap_mode="r")
+
+
+def _yyyymm(value):
+    return f"{int(value) // 100:04d}-{int(value) % 100:02d}"
+
+
+def backtest_allocation(table, weights, horizon_months, rebalance_months):
+    """
+    Rebalanced portfolio growth of 1 for every start month at once.
+
+    ``table`` is the (months, 4) price table, ``weights`` the target fractions
+    for (equity, debt, gold, emergency). Returns ``(cagr, max_drawdown)``,
+    one entry per start month, as fractions.
+    """
+    prices = np.asarray(table[:, 1:], dtype=np.float64)
+    growth = prices[1:] / prices[:-1]
+    cash = np.full((len(growth), 1), (1 + EMERGENCY_ANNUAL_RATE / 100) ** (1 / 12))
+    growth = np.hstack([growth, cash])
+
+    # (starts, assets, horizon) -> (starts, blocks, months in block, assets)
+    windows = sliding_window_view(growth, horizon_months, axis=0)
+    starts = windows.shape[0]
+    blocks = horizon_months // rebalance_months
+    windows = windows.transpose(0, 2, 1).reshape(starts, blocks, rebalance_months, -1)
+
+    # Within a block each asset compounds alone; weights reset at block ends
+    block_path = np.cumprod(windows, axis=2) @ weights
+    block_start = np.cumprod(block_path[:, :, -1], axis=1)
+    block_start = np.hstack([np.ones((starts, 1)), block_start[:, :-1]])
+    values = (block_start[:, :, None] * block_path).reshape(starts, horizon_months)
+
+    peaks = np.maximum.accumulate(np.hstack([np.ones((starts, 1)), values]), axis=1)[:, 1:]
+    max_drawdown = np.maximum(1 - (values / peaks).min(axis=1), 0)
+    cagr = values[:, -1] ** (12 / horizon_months) - 1
+    return cagr, max_drawdown
+
+
+def _distribution(values):
+    points = np.percentile(values, PERCENTILES)
+    return {f"p{p}": round(float(v) * 100, 2) for p, v in zip(PERCENTILES, points)}
+
+
+@lru_cache(maxsize=64)
+def _profile_backtest(profile, horizon_years, rebalance_months, dataset_version):
+    table = load_prices()
+    horizon_months = horizon_years * 12
+    if table is None or len(table) <= horizon_months:
+        return None
+
+    allocation = RISK_ALLOCATIONS[profile]
+    weights = np.array([allocation[a] for a in (*ASSETS, "emergency")], dtype=np.float64) / 100
+    cagr, drawdown = backtest_allocation(table, weights, horizon_months, rebalance_months)
+
+    return {
+        "risk_profile": profile,
+        "allocation": allocation,
+        "windows": int(cagr.size),
+        "first_start": _yyyymm(table[0, 0]),
+        "last_start": _yyyymm(table[cagr.size - 1, 0]),
+        "cagr": _distribution(cagr),
+        "max_drawdown": _distribution(drawdown),
+        "worst_cagr": round(float(cagr.min()) * 100, 2),
+        "worst_drawdown": round(float(drawdown.max()) * 100, 2),
+        "probability_of_loss": round(float((cagr < 0).mean()) * 100, 2),
+    }
+
+
+def backtest_profile(profile, horizon_years, rebalance_months):
+    """Cached per profile; a re-ingested dataset changes the cache key"""
+    try:
+        version = os.path.getmtime(BACKTEST_DATA_PATH)
+    except OSError:
+        return None
+    return _profile_backtest(profile, horizon_years, rebalance_months, version)
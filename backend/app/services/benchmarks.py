@@ -0,0 +1,77 @@
+from datetime import date, datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.database import upsert
+from app.models.category import Category
+from app.models.spending_benchmark import SpendingBenchmark
+from app.models.transaction import Transaction
+from app.services.sketches import QuantileSketch
+
+CHUNK_SIZE = 5000
+
+
+def _month_bounds(year: int, month: int):
+    first = date(year, month, 1)
+    end = date(year + (month == 12), month % 12 + 1, 1)
+    return first, end
+
+
+def build_benchmarks(db: Session, year: int, month: int, chunk_size: int = CHUNK_SIZE) -> dict:
+    """Rebuild the sketches of one month; returns users per category"""
+    first, end = _month_bounds(year, month)
+    category = func.lower(Category.name)
+    totals = (
+        select(category.label("category"), func.sum(Transaction.amount).label("total"))
+        .join(Category)
+        .where(
+            Category.type == "expense",
+            Transaction.date >= first,
+            Transaction.date < end,
+        )
+        .group_by(Transaction.user_id, category)
+    )
+
+    sketches = {}
+    result = db.execute(totals, execution_options={"yield_per": chunk_size})
+    for chunk in result.partitions():
+        by_category = {}
+        for row in chunk:
+            by_category.setdefault(row.category, []).append(row.total)
+        for name, values in by_category.items():
+            sketches.setdefault(name, QuantileSketch()).add(values)
+
+    built_at = datetime.utcnow()
+    for name, sketch in sketches.items():
+        if not sketch.count:
+            continue
+        values = {
+            "user_count": sketch.count,
+            "bucket_offset": sketch.offset,
+            "bucket_counts": sketch.to_bytes(),
+            "built_at": built_at,
+        }
+        db.execute(
+            upsert(db, SpendingBenchmark)
+            .values(category=name, year=year, month=month, **values)
+            .on_conflict_do_update(index_elements=["category", "year", "month"], set_=values)
+        )
+    db.commit()
+    return {name: sketch.count for name, sketch in sketches.items()}
+
+
+def load_benchmark(db: Session, category: str, year: int, month: int):
+    """Stored sketch for a category/month, or None if the job hasn't built one"""
+    row = (
+        db.query(SpendingBenchmark)
+        .filter(
+            SpendingBenchmark.category == category.lower(),
+            SpendingBenchmark.year == year,
+            SpendingBenchmark.month == month,
+        )
+        .first()
+    )
+    if row is None:
+        return None, None
+    return QuantileSketch.from_bytes(row.bucket_offset, row.bucket_counts), row.built_at
@@ -0,0 +1,199 @@
+from datetime import date
+
+from sqlalchemy import func, extract, update
+from sqlalchemy.orm import Session
+
+from app.core.pubsub import alerts_channel, publish_after_commit
+from app.database import upsert
+from app.models.alert import Alert
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.category_monthly_total import CategoryMonthlyTotal
+from app.models.transaction import Transaction
+
+WARNING_PERCENT = 80
+DANGER_PERCENT = 100
+
+
+def _scan_total(db: Session, user_id: int, category_id: int, year: int, month: int) -> float:
+    return (
+        db.query(func.sum(Transaction.amount))
+        .filter(
+            Transaction.user_id == user_id,
+            Transaction.category_id == category_id,
+            extract("year", Transaction.date) == year,
+            extract("month", Transaction.date) == month,
+        )
+        .scalar()
+        or 0
+    )
+
+
+def _seed_total(db: Session, user_id: int, category_id: int, year: int, month: int) -> float:
+    """Build the running total for a month that has none yet (one-off scan)"""
+    db.flush()
+    total = _scan_total(db, user_id, category_id, year, month)
+    db.execute(
+        upsert(db, CategoryMonthlyTotal)
+        .values(user_id=user_id, category_id=category_id, year=year, month=month, total=total)
+        .on_conflict_do_nothing(index_elements=["user_id", "category_id", "year", "month"])
+    )
+    return total
+
+
+def monthly_category_total(
+    db: Session, user_id: int, category_id: int, year: int, month: int, seed: bool = True
+) -> float:
+    """
+    Spent amount for a category/month, read from the running total.
+
+    A month without one is scanned; with ``seed`` the scan is also stored as
+    its running total (a write the caller commits). Read-only callers pass
+    seed=False.
+    """
+    total = (
+        db.query(CategoryMonthlyTotal.total)
+        .filter(
+            CategoryMonthlyTotal.user_id == user_id,
+            CategoryMonthlyTotal.category_id == category_id,
+            CategoryMonthlyTotal.year == year,
+            CategoryMonthlyTotal.month == month,
+        )
+        .scalar()
+    )
+    if total is None:
+        if not seed:
+            return _scan_total(db, user_id, category_id, year, month)
+        return _seed_total(db, user_id, category_id, year, month)
+    return total
+
+
+def apply_transaction_delta(db: Session, user_id: int, category_id: int, txn_date: date, delta: float) -> float:
+    """Shift the running total of a category/month by ``delta`` and return the new total"""
+    year, month = txn_date.year, txn_date.month
+
+    total = db.execute(
+        update(CategoryMonthlyTotal)
+        .where(
+            CategoryMonthlyTotal.user_id == user_id,
+            CategoryMonthlyTotal.category_id == category_id,
+            CategoryMonthlyTotal.year == year,
+            CategoryMonthlyTotal.month == month,
+        )
+        .values(total=CategoryMonthlyTotal.total + delta)
+        .returning(CategoryMonthlyTotal.total)
+    ).scalar()
+
+    if total is None:
+        # No running total yet: the flushed write is already part of the scan
+        total = _seed_total(db, user_id, category_id, year, month)
+    return total
+
+
+def alert_level(spent: float, limit: float):
+    """Return ``(level, message)`` for a usage, or ``None`` when within limit"""
+    if limit <= 0:
+        return None
+    percentage = round((spent / limit) * 100, 2)
+    if percentage >= DANGER_PERCENT:
+        return "danger", "Budget exceeded! Please reduce spending."
+    if percentage >= WARNING_PERCENT:
+        return "warning", "You have used over 80% of your budget."
+    return None
+
+
+def refresh_alert(db: Session, user_id: int, category_id: int, year: int, month: int, spent: float | None = None):
+    """Upsert or clear the alert of one category/month; returns the new level or status"""
+    row = (
+        db.query(Category.type, Budget.monthly_limit)
+        .outerjoin(
+            Budget,
+            (Budget.category_id == Category.id) & (Budget.user_id == user_id),
+        )
+        .filter(Category.id == category_id)
+        .first()
+    )
+
+    if row is None:
+        return {"status": "category_not_found"}
+    if row.type == "income":
+        status = "income_category"
+        level = None
+    elif not row.monthly_limit:
+        status = "no_budget"
+        level = None
+    else:
+        if spent is None:
+            spent = monthly_category_total(db, user_id, category_id, year, month)
+        level = alert_level(spent, row.monthly_limit)
+        status = "alert_triggered" if level else "within_limit"
+
+    alert_filter = (
+        Alert.user_id == user_id,
+        Alert.category_id == category_id,
+        Alert.year == year,
+        Alert.month == month,
+    )
+    previous_level = db.query(Alert.level).filter(*alert_filter).scalar()
+
+    if level is None:
+        if previous_level is not None:
+            db.query(Alert).filter(*alert_filter).delete(synchronize_session=False)
+            _notify(db, user_id, category_id, year, month, None, None, previous_level)
+        return {"status": status}
+
+    level, message = level
+    if level == previous_level:
+        return {"status": status, "level": level}
+
+    db.execute(
+        upsert(db, Alert)
+        .values(
+            user_id=user_id,
+            category_id=category_id,
+            year=year,
+            month=month,
+            level=level,
+            message=message,
+        )
+        .on_conflict_do_update(
+            index_elements=["user_id", "category_id", "year", "month"],
+            set_={"level": level, "message": message},
+        )
+    )
+    _notify(db, user_id, category_id, year, month, level, message, previous_level)
+    return {"status": status, "level": level}
+
+
+def _notify(db, user_id, category_id, year, month, level, message, previous_level):
+    publish_after_commit(db, alerts_channel(user_id), {
+        "category_id": category_id,
+        "year": year,
+        "month": month,
+        "level": level,  # None = alert cleared
+        "previous_level": previous_level,
+        "message": message,
+    })
+
+
+def on_transaction_written(db: Session, user_id: int, category_id: int, txn_date: date, delta: float):
+    """Hook for transaction inserts (+amount) and deletes (-amount)"""
+    spent = apply_transaction_delta(db, user_id, category_id, txn_date, delta)
+    return refresh_alert(db, user_id, category_id, txn_date.year, txn_date.month, spent)
+
+
+def on_budget_written(db: Session, user_id: int, category_id: int):
+    """Re-evaluate every tracked month of a category after its limit changed"""
+    today = date.today()
+    monthly_category_total(db, user_id, category_id, today.year, today.month)
+
+    months = (
+        db.query(CategoryMonthlyTotal.year, CategoryMonthlyTotal.month, CategoryMonthlyTotal.total)
+        .filter(
+            CategoryMonthlyTotal.user_id == user_id,
+            CategoryMonthlyTotal.category_id == category_id,
+        )
+        .all()
+    )
+    for year, month, total in months:
+        refresh_alert(db, user_id, category_id, year, month, total)
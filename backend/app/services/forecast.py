@@ -0,0 +1,264 @@
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import extract, func
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.services.recurring import PERIODS, recurring_for_user
+
+HISTORY_MONTHS = 36
+# Smoothing factors tried per category; the one with the lowest one-step error wins
+ALPHAS = np.array([0.1, 0.2, 0.3, 0.5, 0.7, 0.9])
+# Seasonal indices need at least this many months of a category's history
+SEASONAL_MIN_MONTHS = 24
+MAX_CACHED_USERS = 64
+
+_PERIOD_DAYS = {name: nominal_days for name, *_, nominal_days in PERIODS}
+
+
+def _month_index(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+
+def _month_label(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def load_monthly_totals(db: Session, user_id: int, first: date, end: date):
+    """
+    Per category, per month and per merchant totals in one aggregate query.
+
+    Grouping by merchant lets recurring charges be split out of the
+    category series and projected on their own schedule.
+    """
+    year = extract("year", Transaction.date)
+    month = extract("month", Transaction.date)
+    return (
+        db.query(
+            Category.id.label("category_id"),
+            Category.name.label("category_name"),
+            Category.type.label("category_type"),
+            Transaction.merchant_key,
+            year.label("year"),
+            month.label("month"),
+            func.sum(Transaction.amount).label("total"),
+        )
+        .join(Category)
+        .filter(
+            Transaction.user_id == user_id,
+            Transaction.date >= first,
+            Transaction.date < end,
+        )
+        .group_by(Category.id, Category.name, Category.type, Transaction.merchant_key, year, month)
+        .all()
+    )
+
+
+def fit_series(series: np.ndarray, observed: np.ndarray):
+    """
+    Seasonal exponential smoothing for many monthly series at once.
+
+    ``series`` is (categories, months); ``observed`` marks months on or after
+    each category's first transaction. Months before that are skipped, later
+    months without spend count as zero. Returns ``(level, seasonal, alpha)``
+    where ``seasonal`` is (categories, 12), indexed by position modulo 12
+    from the first column.
+    """
+    n, months = series.shape
+    history = observed.sum(axis=1)
+
+    # Additive month-of-year index from complete history, zero-mean per category
+    seasonal = np.zeros((n, 12))
+    has_season = history >= SEASONAL_MIN_MONTHS
+    if has_season.any():
+        position = np.arange(months) % 12
+        sums = np.zeros((n, 12))
+        counts = np.zeros((n, 12))
+        for p in range(12):
+            cols = position == p
+            sums[:, p] = (series[:, cols] * observed[:, cols]).sum(axis=1)
+            counts[:, p] = observed[:, cols].sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, sums / counts, np.nan)
+        deviations = means - np.nanmean(means, axis=1, keepdims=True)
+        seasonal[has_season] = np.nan_to_num(deviations[has_season])
+
+    adjusted = series - seasonal[:, np.arange(months) % 12]
+
+    # Run every candidate alpha side by side: state is (alphas, categories)
+    alphas = ALPHAS[:, None]
+    level = np.zeros((len(ALPHAS), n))
+    started = np.zeros(n, dtype=bool)
+    sse = np.zeros((len(ALPHAS), n))
+    for t in range(months):
+        y = adjusted[:, t]
+        live = observed[:, t]
+        update = live & started
+        sse += np.where(update, (y - level) ** 2, 0)
+        level = np.where(update, alphas * y + (1 - alphas) * level, level)
+        first = live & ~started
+        level = np.where(first, y, level)
+        started |= live
+
+    best = sse.argmin(axis=0)
+    columns = np.arange(n)
+    return np.maximum(level[best, columns], 0), seasonal, ALPHAS[best]
+
+
+def _recurring_schedule(items, first_month: int, horizon: int):
+    """Expected charges of each recurring item, (items, horizon) by month"""
+    out = np.zeros((len(items), horizon))
+    for i, item in enumerate(items):
+        due = item["next_expected_date"]
+        m = _month_index(due.year, due.month) - first_month
+        if item["period"] == "weekly":
+            # Day-level schedule, bucketed into months
+            while m < horizon:
+                if m >= 0:
+                    out[i, m] += item["last_amount"]
+                due += timedelta(days=7)
+                m = _month_index(due.year, due.month) - first_month
+        else:
+            # Monthly and yearly charges keep their calendar slot
+            step = 1 if item["period"] == "monthly" else 12
+            months = np.arange(m, horizon, step)
+            out[i, months[months >= 0]] += item["last_amount"]
+    return out
+
+
+def fit_user(db: Session, user_id: int, today: date | None = None) -> dict:
+    """Fitted forecasting state for a user, valid until their next write"""
+    today = today or date.today()
+    current = _month_index(today.year, today.month)
+    start = current - HISTORY_MONTHS
+    # Complete months only; the running month would read as a dip
+    rows = load_monthly_totals(
+        db, user_id, date(start // 12, start % 12 + 1, 1), date(today.year, today.month, 1)
+    )
+
+    # Series overdue by more than a full period look cancelled
+    recurring = [
+        item for item in recurring_for_user(db, user_id, today)
+        if item["next_expected_date"] + timedelta(days=_PERIOD_DAYS[item["period"]]) >= today
+    ]
+    recurring_keys = {item["merchant"] for item in recurring}
+
+    categories = {}
+    for r in rows:
+        categories.setdefault(r.category_id, (r.category_name, r.category_type))
+    ids = list(categories)
+    position = {cid: i for i, cid in enumerate(ids)}
+
+    series = np.zeros((len(ids), HISTORY_MONTHS))
+    first_seen = np.full(len(ids), HISTORY_MONTHS)
+    for r in rows:
+        i = position[r.category_id]
+        t = _month_index(int(r.year), int(r.month)) - start
+        first_seen[i] = min(first_seen[i], t)
+        if r.category_type == "expense" and r.merchant_key in recurring_keys:
+            continue
+        series[i, t] += r.total
+    observed = np.arange(HISTORY_MONTHS)[None, :] >= first_seen[:, None]
+
+    level, seasonal, alpha = fit_series(series, observed)
+    return {
+        "fitted_month": current,
+        "history_start": start,
+        "category_ids": ids,
+        "categories": [categories[cid] for cid in ids],
+        "level": level,
+        "seasonal": seasonal,
+        "alpha": alpha,
+        "seasonal_fit": observed.sum(axis=1) >= SEASONAL_MIN_MONTHS,
+        "recurring": recurring,
+    }
+
+
+def project(state: dict, horizon: int) -> dict:
+    """Monthly projection from fitted state, starting next month: O(horizon)"""
+    first = state["fitted_month"] + 1
+    steps = np.arange(first, first + horizon)
+    seasonal = state["seasonal"][:, (steps - state["history_start"]) % 12]
+    baseline = np.maximum(state["level"][:, None] + seasonal, 0)
+
+    kinds = np.array([kind for _, kind in state["categories"]])
+    recurring = _recurring_schedule(state["recurring"], first, horizon)
+
+    income = baseline[kinds == "income"].sum(axis=0)
+    expense = baseline[kinds == "expense"].sum(axis=0) + recurring.sum(axis=0)
+    net = income - expense
+
+    return {
+        "months": [_month_label(m) for m in steps],
+        "income": income,
+        "expense": expense,
+        "recurring": recurring,
+        "net": net,
+        "baseline": baseline,
+    }
+
+
+_states = OrderedDict()  # user_id -> fitted state, least recently used first
+_fitting = {}  # user_id -> list of _Fit in flight; only users being fitted have an entry
+_lock = threading.Lock()
+
+
+class _Fit:
+    """One fit in flight; a write committed meanwhile makes it stale"""
+    __slots__ = ("stale",)
+
+    def __init__(self):
+        self.stale = False
+
+
+def invalidate(user_id: int):
+    """
+    Drop the user's fitted state after a transaction write.
+
+    The cache is per process: other workers keep serving their fitted state
+    until they see a write themselves, evict the user, or the month rolls over.
+    """
+    with _lock:
+        _states.pop(user_id, None)
+        for fit in _fitting.get(user_id, ()):
+            fit.stale = True
+
+
+def user_state(db: Session, user_id: int, today: date | None = None) -> dict:
+    today = today or date.today()
+    with _lock:
+        state = _states.get(user_id)
+        if state is not None and state["fitted_month"] == _month_index(today.year, today.month):
+            _states.move_to_end(user_id)
+            return state
+        fit = _Fit()
+        _fitting.setdefault(user_id, []).append(fit)
+
+    try:
+        state = fit_user(db, user_id, today)
+    finally:
+        with _lock:
+            fits = _fitting[user_id]
+            fits.remove(fit)
+            if not fits:
+                del _fitting[user_id]
+
+    with _lock:
+        # A write committed while fitting: serve this state once, don't cache it
+        if fit.stale:
+            return state
+        _states[user_id] = state
+        while len(_states) > MAX_CACHED_USERS:
+            _states.popitem(last=False)
+    return state
+
+    state = fit_user(db, user_id, today)
+    with _lock:
+        _states[user_id] = state
+        while len(_states) > MAX_CACHED_USERS:
+            _states.popitem(last=False)
+    return state
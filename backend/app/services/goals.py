@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+
+from app.models.goal_contribution import GoalContribution
+from app.models.savings_goal import SavingsGoal
+
+
+def add_progress(db: Session, user_id: int, goal_id: int, amount: float,
+                 source: str = "manual", description: str | None = None):
+    """
+    Add ``amount`` to a goal in one UPDATE ... RETURNING and record it in the
+    ledger. The increment happens in the database, so concurrent contributions
+    never overwrite each other. Returns the updated goal, or None if the user
+    has no such goal. The caller commits.
+    """
+    goal = db.execute(
+        update(SavingsGoal)
+        .where(SavingsGoal.id == goal_id, SavingsGoal.user_id == user_id)
+        .values(current_amount=func.coalesce(SavingsGoal.current_amount, 0) + amount)
+        .returning(SavingsGoal)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).scalar_one_or_none()
+
+    if goal is not None:
+        db.execute(insert(GoalContribution).values(
+            goal_id=goal_id,
+            user_id=user_id,
+            amount=amount,
+            source=source,
+            description=description,
+            created_at=datetime.utcnow(),
+        ))
+    return goal
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+def emi(principal, annual_rate, months):
+    """Equated monthly instalment (vectorized)"""
+    principal, annual_rate, months = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(principal, dtype=np.float64)),
+        np.atleast_1d(np.asarray(annual_rate, dtype=np.float64)),
+        np.atleast_1d(np.asarray(months, dtype=np.float64)),
+    )
+    r = annual_rate / 12 / 100
+    with np.errstate(invalid="ignore", divide="ignore"):
+        factor = (1 + r) ** months
+        return np.where(r > 0, principal * r * factor / (factor - 1), principal / months)
+
+
+def amortize(principal, annual_rate, emis, extra):
+    """
+    Month-by-month schedules for many loans at once.
+
+    ``principal``, ``annual_rate`` and ``emis`` are (loans,); ``extra`` is
+    (loans, months) of prepayments made after each month's EMI. The EMI stays
+    fixed, so prepayments shorten the tenure. Returns a dict of
+    (loans, months) arrays plus ``months_taken`` per loan.
+    """
+    n_loans, n_months = extra.shape
+    r = np.asarray(annual_rate, dtype=np.float64) / 12 / 100
+    balance = np.asarray(principal, dtype=np.float64).copy()
+    emis = np.asarray(emis, dtype=np.float64)
+
+    interest = np.zeros((n_loans, n_months))
+    principal_paid = np.zeros((n_loans, n_months))
+    prepaid = np.zeros((n_loans, n_months))
+    balances = np.zeros((n_loans, n_months))
+    months_taken = np.zeros(n_loans, dtype=np.int64)
+
+    for k in range(n_months):
+        active = balance > 0.005
+        if not active.any():
+            break
+        months_taken += active
+        interest[:, k] = np.where(active, balance * r, 0)
+        principal_paid[:, k] = np.where(active, np.minimum(emis - interest[:, k], balance), 0)
+        balance = balance - principal_paid[:, k]
+        prepaid[:, k] = np.where(active, np.minimum(extra[:, k], balance), 0)
+        balance = balance - prepaid[:, k]
+        balances[:, k] = np.maximum(balance, 0)
+
+    return {
+        "interest": interest,
+        "principal": principal_paid,
+        "prepayment": prepaid,
+        "balance": balances,
+        "months_taken": months_taken,
+    }
@@ -0,0 +1,81 @@
+import re
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Words that describe the payment rather than the merchant
+NOISE_WORDS = {
+    "upi", "pos", "neft", "imps", "ach", "nach", "txn", "ref", "payment", "paid",
+    "order", "purchase", "debit", "credit", "card", "online", "pvt", "ltd",
+    "india", "the", "to", "for", "at", "via", "of", "www", "com", "co", "in",
+}
+
+# Canonical merchant -> spellings seen in bank/UPI descriptions
+MERCHANT_ALIASES = {
+    "swiggy": ["swiggy", "instamart", "swiggy instamart", "swiggy genie"],
+    "zomato": ["zomato"],
+    "blinkit": ["blinkit", "grofers"],
+    "zepto": ["zepto"],
+    "bigbasket": ["bigbasket", "big basket", "bb now"],
+    "amazon": ["amazon", "amzn", "amazon pay", "amazon prime", "prime video"],
+    "flipkart": ["flipkart", "fkrt"],
+    "myntra": ["myntra"],
+    "netflix": ["netflix"],
+    "spotify": ["spotify"],
+    "hotstar": ["hotstar", "disney hotstar", "jiohotstar"],
+    "youtube": ["youtube", "yt premium"],
+    "uber": ["uber", "uber eats"],
+    "ola": ["ola", "olacabs", "ola cabs"],
+    "rapido": ["rapido"],
+    "irctc": ["irctc"],
+    "airtel": ["airtel", "bharti airtel"],
+    "jio": ["jio", "reliance jio"],
+    "vi": ["vodafone", "vodafone idea", "vi postpaid"],
+}
+
+_ALIAS_LOOKUP = {alias: merchant for merchant, aliases in MERCHANT_ALIASES.items() for alias in aliases}
+# Longest spelling first so "swiggy instamart" wins over "swiggy"
+_ALIAS_RE = re.compile(
+    r"\b(" + "|".join(re.escape(a) for a in sorted(_ALIAS_LOOKUP, key=len, reverse=True)) + r")\b"
+)
+
+
+def normalize_merchant(description: str | None, category_name: str | None = None) -> str:
+    """Collapse a free-text description to a merchant key ("SWIGGY*ORDER 1234" -> "swiggy")"""
+    tokens = [t for t in _TOKEN_RE.findall((description or "").lower()) if t not in NOISE_WORDS]
+
+    if tokens:
+        match = _ALIAS_RE.search(" ".join(tokens))
+        if match:
+            return _ALIAS_LOOKUP[match.group(1)]
+        return tokens[0]
+
+    # No usable text: group by category so undescribed rent/EMI still recurs
+    return f"#{(category_name or 'other').lower()}"
+
+
+def backfill_merchant_keys(db: Session, batch_size: int = 1000) -> int:
+    """Fill merchant_key on rows written before it existed; returns rows updated"""
+    updated = 0
+    while True:
+        rows = (
+            db.query(Transaction.id, Transaction.description, Category.name)
+            .join(Category)
+            .filter(Transaction.merchant_key == None)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return updated
+
+        db.execute(
+            update(Transaction),
+            [{"id": r.id, "merchant_key": normalize_merchant(r.description, r.name)} for r in rows],
+        )
+        db.commit()
+        updated += len(rows)
@@ -0,0 +1,89 @@
+from sqlalchemy import UniqueConstraint, inspect, text
+
+from app.database import Base, SessionLocal, add_missing_columns
+from app.services.merchants import backfill_merchant_keys
+
+
+def _not_null(columns) -> str:
+    return " AND ".join(f"{c} IS NOT NULL" for c in columns)
+
+
+def dedupe(conn, table: str, columns) -> int:
+    """Delete all but the newest row (highest id) of each duplicate group; returns rows deleted"""
+    cols = ", ".join(columns)
+    return conn.execute(text(
+        f"DELETE FROM {table} WHERE {_not_null(columns)} AND id NOT IN ("
+        f"SELECT MAX(id) FROM {table} WHERE {_not_null(columns)} GROUP BY {cols})"
+    )).rowcount
+
+
+def _unique_targets(table):
+    """(name, columns) of every unique constraint and unique index on the model"""
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.name:
+            yield constraint.name, [c.name for c in constraint.columns]
+    for index in table.indexes:
+        if index.unique:
+            yield index.name, [c.name for c in index.columns]
+
+
+def add_unique_constraints(conn, inspector, table, log=print):
+    """Missing unique constraints/indexes, created as unique indexes after removing duplicates"""
+    existing = {u["name"] for u in inspector.get_unique_constraints(table.name)}
+    existing |= {i["name"] for i in inspector.get_indexes(table.name)}
+    for name, columns in _unique_targets(table):
+        if name in existing:
+            continue
+        removed = dedupe(conn, table.name, columns)
+        if removed:
+            log(f"{table.name}: removed {removed} duplicate rows on ({', '.join(columns)})")
+        conn.execute(text(f"CREATE UNIQUE INDEX {name} ON {table.name} ({', '.join(columns)})"))
+        log(f"{table.name}: created unique index {name}")
+
+
+def sync_foreign_keys(conn, inspector, table, log=print):
+    """Re-create foreign keys whose ON DELETE changed (Postgres; SQLite doesn't enforce them here)"""
+    if conn.dialect.name != "postgresql":
+        return
+    reflected = {
+        (tuple(fk["constrained_columns"]), fk["referred_table"]): fk
+        for fk in inspector.get_foreign_keys(table.name)
+    }
+    for constraint in table.foreign_key_constraints:
+        key = (tuple(constraint.column_keys), constraint.referred_table.name)
+        existing = reflected.get(key)
+        if existing is None or (existing["options"].get("ondelete") or None) == constraint.ondelete:
+            continue
+        columns = ", ".join(constraint.column_keys)
+        referred = ", ".join(e.column.name for e in constraint.elements)
+        conn.execute(text(f"ALTER TABLE {table.name} DROP CONSTRAINT {existing['name']}"))
+        conn.execute(text(
+            f"ALTER TABLE {table.name} ADD CONSTRAINT {existing['name']} FOREIGN KEY ({columns}) "
+            f"REFERENCES {constraint.referred_table.name} ({referred})"
+            + (f" ON DELETE {constraint.ondelete}" if constraint.ondelete else "")
+        ))
+        log(f"{table.name}: {existing['name']} now ON DELETE {constraint.ondelete}")
+
+
+def migrate_schema(engine, log=print):
+    """Bring existing tables up to the models: columns, unique constraints, foreign keys, indexes"""
+    add_missing_columns(engine)
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            add_unique_constraints(conn, inspector, table, log)
+            sync_foreign_keys(conn, inspector, table, log)
+            for index in table.indexes:
+                if not index.unique:
+                    index.create(conn, checkfirst=True)
+
+
+def backfill(log=print):
+    """Data written before later columns existed"""
+    db = SessionLocal()
+    try:
+        log(f"transactions: merchant_key set on {backfill_merchant_keys(db)} rows")
+    finally:
+        db.close()
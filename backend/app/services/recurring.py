@@ -0,0 +1,135 @@
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.services.merchants import normalize_merchant
+
+# Enough to hold two charges of a yearly series, whose gaps run up to 380 days
+HISTORY_DAYS = 400
+
+# (period, min gap, max gap, min occurrences, nominal days) on the median gap
+PERIODS = (
+    ("weekly", 5, 9, 3, 7),
+    ("monthly", 26, 35, 3, 30.44),
+    ("yearly", 350, 380, 2, 365.25),
+)
+
+# Max coefficient of variation of the gaps for a series to count as regular
+MAX_GAP_CV = 0.35
+# Share of charges that must sit within AMOUNT_TOLERANCE of the median amount
+MIN_AMOUNT_MATCH = 0.75
+AMOUNT_TOLERANCE = 0.15
+
+
+def _group_medians(values: np.ndarray, groups: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Median of ``values`` per group (groups are 0..len(counts)-1), vectorized"""
+    order = np.lexsort((values, groups))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    lo = starts + (counts - 1) // 2
+    hi = starts + counts // 2
+    valid = counts > 0
+    out = np.full(len(counts), np.nan)
+    out[valid] = (values[order][lo[valid]] + values[order][hi[valid]]) / 2
+    return out
+
+
+def load_expense_history(db: Session, user_id: int, since: date):
+    """All expense rows since ``since`` in one query, oldest first"""
+    return (
+        db.query(
+            Transaction.date,
+            Transaction.amount,
+            Transaction.description,
+            Transaction.merchant_key,
+            Category.name.label("category_name"),
+        )
+        .join(Category)
+        .filter(
+            Transaction.user_id == user_id,
+            Category.type == "expense",
+            Transaction.date >= since,
+        )
+        .order_by(Transaction.date)
+        .all()
+    )
+
+
+def detect_recurring(rows) -> list[dict]:
+    """Find weekly/monthly/yearly series in date-ordered expense rows"""
+    if len(rows) < 2:
+        return []
+
+    keys = [r.merchant_key or normalize_merchant(r.description, r.category_name) for r in rows]
+    merchants, codes = np.unique(np.asarray(keys), return_inverse=True)
+    days = np.fromiter((r.date.toordinal() for r in rows), dtype=np.int64, count=len(rows))
+    amounts = np.fromiter((r.amount for r in rows), dtype=np.float64, count=len(rows))
+
+    # Group rows by merchant; stable sort keeps each group in date order
+    order = np.argsort(codes, kind="stable")
+    codes, days, amounts = codes[order], days[order], amounts[order]
+    n_groups = len(merchants)
+    counts = np.bincount(codes, minlength=n_groups)
+    last_idx = np.cumsum(counts) - 1
+
+    # Gaps between consecutive charges of the same merchant
+    same = codes[1:] == codes[:-1]
+    gaps = (days[1:] - days[:-1])[same].astype(np.float64)
+    gap_codes = codes[1:][same]
+    gap_counts = np.bincount(gap_codes, minlength=n_groups)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gap_sum = np.bincount(gap_codes, weights=gaps, minlength=n_groups)
+        gap_sq = np.bincount(gap_codes, weights=gaps * gaps, minlength=n_groups)
+        gap_mean = gap_sum / gap_counts
+        gap_cv = np.sqrt(np.maximum(gap_sq / gap_counts - gap_mean ** 2, 0)) / gap_mean
+        median_gap = _group_medians(gaps, gap_codes, gap_counts)
+
+        median_amount = _group_medians(amounts, codes, counts)
+        within = np.abs(amounts - median_amount[codes]) <= AMOUNT_TOLERANCE * median_amount[codes]
+        amount_match = np.bincount(codes, weights=within, minlength=n_groups) / counts
+        amount_avg = np.bincount(codes, weights=amounts, minlength=n_groups) / counts
+
+    period_idx = np.full(n_groups, -1)
+    for i, (_, lo, hi, min_count, _) in enumerate(PERIODS):
+        hit = (median_gap >= lo) & (median_gap <= hi) & (counts >= min_count)
+        period_idx[hit & (period_idx < 0)] = i
+
+    regular = (period_idx >= 0) & (gap_cv <= MAX_GAP_CV) & (amount_match >= MIN_AMOUNT_MATCH)
+    confidence = 100 * np.clip(1 - gap_cv / MAX_GAP_CV * 0.5, 0, 1) * amount_match
+
+    # Description/category of the latest charge in each group
+    last_rows = [rows[order[i]] for i in last_idx]
+
+    found = []
+    for g in np.flatnonzero(regular):
+        last = last_rows[g]
+        gap = float(median_gap[g])
+        period, *_, nominal_days = PERIODS[period_idx[g]]
+        monthly = float(amount_avg[g]) * 30.44 / nominal_days
+        found.append({
+            "merchant": str(merchants[g]),
+            "description": last.description or last.category_name,
+            "category": last.category_name,
+            "period": period,
+            "frequency": int(counts[g]),
+            "avg_amount": round(float(amount_avg[g]), 2),
+            "last_amount": round(float(amounts[last_idx[g]]), 2),
+            "median_gap_days": round(gap, 1),
+            "last_date": last.date,
+            "next_expected_date": last.date + timedelta(days=round(gap)),
+            "estimated_monthly": round(monthly, 2),
+            "estimated_yearly": round(monthly * 12, 2),
+            "is_subscription": period in ("monthly", "yearly"),
+            "confidence": round(float(confidence[g]), 1),
+        })
+
+    found.sort(key=lambda r: r["estimated_monthly"], reverse=True)
+    return found
+
+
+def recurring_for_user(db: Session, user_id: int, today: date | None = None) -> list[dict]:
+    today = today or date.today()
+    return detect_recurring(load_expense_history(db, user_id, today - timedelta(days=HISTORY_DAYS)))
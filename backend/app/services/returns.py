@@ -0,0 +1,209 @@
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.investment_cash_flow import InvestmentCashFlow
+
+DAYS_PER_YEAR = 365.0
+NEWTON_ITERATIONS = 50
+BISECT_ITERATIONS = 100
+TOLERANCE = 1e-9
+RATE_BOUNDS = (-0.9999, 100.0)
+
+
+def _npv(rates, amounts, years):
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        return (amounts * (1 + rates[:, None]) ** -years).sum(axis=1)
+
+
+def _bisect(amounts, years):
+    """Bracketed fallback for rows Newton could not solve; NaN without a sign change"""
+    n = amounts.shape[0]
+    lo = np.full(n, RATE_BOUNDS[0])
+    hi = np.full(n, RATE_BOUNDS[1])
+    f_lo = _npv(lo, amounts, years)
+    f_hi = _npv(hi, amounts, years)
+    bracketed = np.sign(f_lo) * np.sign(f_hi) < 0
+
+    for _ in range(BISECT_ITERATIONS):
+        mid = (lo + hi) / 2
+        f_mid = _npv(mid, amounts, years)
+        left = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(left, mid, lo)
+        f_lo = np.where(left, f_mid, f_lo)
+        hi = np.where(left, hi, mid)
+    return np.where(bracketed, (lo + hi) / 2, np.nan)
+
+
+def xirr_batch(amounts: np.ndarray, years: np.ndarray, guess: float = 0.1) -> np.ndarray:
+    """
+    Annual IRR of many irregular cash-flow series at once.
+
+    ``amounts``/``years`` are (portfolios, flows), zero-padded; ``years`` is
+    the time of each flow since the series' first flow. Invested money is
+    negative, money received (including the final valuation) positive.
+    Vectorized Newton-Raphson, with bisection for rows that do not converge.
+    """
+    n = amounts.shape[0]
+    rate = np.full(n, guess)
+    converged = np.zeros(n, dtype=bool)
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(NEWTON_ITERATIONS):
+            base = 1 + rate[:, None]
+            discounted = amounts * base ** -years
+            npv = discounted.sum(axis=1)
+            slope = (-years * discounted / base).sum(axis=1)
+            step = npv / slope
+            new_rate = rate - step
+            ok = np.isfinite(new_rate) & (new_rate > RATE_BOUNDS[0]) & (new_rate < RATE_BOUNDS[1])
+            rate = np.where(ok & ~converged, new_rate, rate)
+            converged |= ok & (np.abs(step) < TOLERANCE)
+            if converged.all():
+                break
+
+    # An IRR needs money flowing both ways
+    solvable = (amounts > 0).any(axis=1) & (amounts < 0).any(axis=1)
+    retry = solvable & ~converged
+    if retry.any():
+        rate[retry] = _bisect(amounts[retry], years[retry])
+    rate[~solvable] = np.nan
+    return rate
+
+
+def _xirr_by_group(group, n_groups, flow, day):
+    """Pack per-row flows into padded (group, flow) matrices and solve them together"""
+    order = np.lexsort((day, group))
+    group, flow, day = group[order], flow[order], day[order]
+    counts = np.bincount(group, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    position = np.arange(len(group)) - starts[group]
+    first_day = day[np.minimum(starts, len(day) - 1)]
+
+    amounts = np.zeros((n_groups, max(counts.max(), 1)))
+    years = np.zeros_like(amounts)
+    amounts[group, position] = flow
+    years[group, position] = (day - first_day[group]) / DAYS_PER_YEAR
+    return xirr_batch(amounts, years)
+
+
+def _percent(value):
+    return None if np.isnan(value) else round(float(value) * 100, 2) + 0.0
+
+
+def portfolio_returns(rows):
+    """
+    XIRR and annualized TWR for every (user_id, portfolio) in ``rows``, plus
+    a combined XIRR per user across their valued portfolios.
+
+    ``rows`` are cash flows sorted by user, portfolio and date. Only flows up
+    to each portfolio's latest valuation count; that valuation is the
+    terminal inflow for XIRR. Returns ``(portfolios, totals)``.
+    """
+    if not rows:
+        return [], []
+
+    keys = [(r.user_id, r.portfolio) for r in rows]
+    kinds = np.array([r.kind for r in rows])
+    amount = np.array([r.amount for r in rows], dtype=np.float64)
+    day = np.array([r.date.toordinal() for r in rows], dtype=np.int64)
+
+    starts = np.flatnonzero([i == 0 or keys[i] != keys[i - 1] for i in range(len(keys))])
+    counts = np.diff(np.append(starts, len(rows)))
+    group = np.repeat(np.arange(len(starts)), counts)
+    n_groups = len(starts)
+
+    is_val = kinds == "valuation"
+    # Position of each group's latest valuation (-1 when never valued)
+    val_idx = np.where(is_val, np.arange(len(rows)), -1)
+    last_val = np.full(n_groups, -1)
+    np.maximum.at(last_val, group, val_idx)
+    valued = last_val >= 0
+    cutoff_day = np.where(valued, day[np.maximum(last_val, 0)], np.iinfo(np.int64).max)
+    in_window = day <= cutoff_day[group]
+
+    # Signed external flows: + into the portfolio, - out of it
+    net_in = np.select([kinds == "buy", kinds == "sell", kinds == "dividend"], [amount, -amount, -amount], 0.0)
+    invested = np.bincount(group, weights=np.where(kinds == "buy", amount, 0), minlength=n_groups)
+    withdrawn = np.bincount(group, weights=np.where((kinds == "sell") | (kinds == "dividend"), amount, 0), minlength=n_groups)
+
+    # --- XIRR: investor's view (buys negative, sells/dividends/final value positive)
+    flow = np.where(is_val, 0.0, -net_in)
+    terminal = np.arange(len(rows)) == last_val[group]
+    flow = np.where(terminal, amount, flow)
+    flow = np.where(in_window, flow, 0.0)
+
+    xirr = np.where(valued, _xirr_by_group(group, n_groups, flow, day), np.nan)
+
+    # Per-user total: every valued portfolio's flows and final value as one series
+    user_ids, user_code = np.unique([k[0] for k in keys], return_inverse=True)
+    counted = valued[group]
+    user_xirr = _xirr_by_group(user_code, len(user_ids), np.where(counted, flow, 0.0), day)
+
+    # --- TWR: chain holding-period returns between valuations
+    # A segment ends at each valuation; flows in it are treated as made at its start
+    boundary = np.zeros(len(rows), dtype=bool)
+    boundary[starts] = True
+    boundary[1:] |= is_val[:-1]
+    segment = np.cumsum(boundary) - 1
+    seg_flows = np.bincount(segment, weights=np.where(is_val, 0.0, net_in))
+
+    prev_val = np.maximum.accumulate(np.where(np.r_[False, is_val[:-1]], np.arange(len(rows)) - 1, -1))
+    has_prev = (prev_val >= 0) & (prev_val >= starts[group])
+    base = np.where(has_prev, amount[np.maximum(prev_val, 0)], 0.0) + seg_flows[segment]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_hpr = np.where(is_val & (base > 0), np.log(amount / np.where(base > 0, base, 1)), 0.0)
+        growth = np.exp(np.bincount(group, weights=log_hpr, minlength=n_groups))
+        span_years = (cutoff_day - day[starts]) / DAYS_PER_YEAR
+        twr = np.where(valued & (span_years > 0), growth ** (1 / np.where(span_years > 0, span_years, 1)) - 1, np.nan)
+
+    portfolios = []
+    for g, start in enumerate(starts):
+        user_id, name = keys[start]
+        portfolios.append({
+            "user_id": user_id,
+            "portfolio": name,
+            "invested": round(float(invested[g]), 2),
+            "withdrawn": round(float(withdrawn[g]), 2),
+            "current_value": round(float(amount[last_val[g]]), 2) if valued[g] else None,
+            "valued_on": rows[last_val[g]].date if valued[g] else None,
+            "xirr_percent": _percent(xirr[g]),
+            "twr_percent": _percent(twr[g]),
+        })
+
+    totals = []
+    for u, user_id in enumerate(user_ids):
+        mine = [p for p in portfolios if p["user_id"] == user_id]
+        values = [p for p in mine if p["current_value"] is not None]
+        totals.append({
+            "user_id": int(user_id),
+            "portfolio": "All portfolios",
+            "invested": round(sum(p["invested"] for p in mine), 2),
+            "withdrawn": round(sum(p["withdrawn"] for p in mine), 2),
+            "current_value": round(sum(p["current_value"] for p in values), 2) if values else None,
+            "valued_on": max(p["valued_on"] for p in values) if values else None,
+            "xirr_percent": _percent(user_xirr[u]),
+            # Portfolios are valued on different dates, so TWR is not chained across them
+            "twr_percent": None,
+        })
+    return portfolios, totals
+
+
+def load_cash_flows(db: Session, user_ids=None):
+    """Cash flows of the given users (all users when None), in one ordered query"""
+    query = db.query(
+        InvestmentCashFlow.user_id,
+        InvestmentCashFlow.portfolio,
+        InvestmentCashFlow.date,
+        InvestmentCashFlow.kind,
+        InvestmentCashFlow.amount,
+    )
+    if user_ids is not None:
+        query = query.filter(InvestmentCashFlow.user_id.in_(user_ids))
+    return query.order_by(
+        InvestmentCashFlow.user_id,
+        InvestmentCashFlow.portfolio,
+        InvestmentCashFlow.date,
+        # Flows on a valuation day happen before the valuation is taken
+        InvestmentCashFlow.kind == "valuation",
+    ).all()
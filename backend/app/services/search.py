@@ -0,0 +1,189 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+
+from sqlalchemy import func, literal, or_
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Edit budget of the in-memory fallback (Postgres uses pg_trgm's own threshold)
+MAX_EDITS = 2
+MAX_CACHED_USERS = 64
+
+
+def _tokens(text: str | None) -> list[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _trigrams(token: str) -> set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up early once it exceeds ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class InvertedIndex:
+    """Token -> transaction ids, with prefix and typo-tolerant token lookup"""
+
+    def __init__(self, rows):
+        self.postings = defaultdict(set)
+        self.gram_tokens = defaultdict(set)
+        self.dates = {}
+        for txn_id, description, txn_date in rows:
+            self.dates[txn_id] = txn_date
+            for token in _tokens(description):
+                self.postings[token].add(txn_id)
+        for token in self.postings:
+            for gram in _trigrams(token):
+                self.gram_tokens[gram].add(token)
+        self.sorted_tokens = sorted(self.postings)
+
+    def _matching_tokens(self, term: str) -> dict[str, float]:
+        """Index tokens matching ``term`` with a score (exact 1.0 > prefix > typo)"""
+        matches = {}
+        i = bisect_left(self.sorted_tokens, term)
+        while i < len(self.sorted_tokens) and self.sorted_tokens[i].startswith(term):
+            token = self.sorted_tokens[i]
+            matches[token] = 1.0 if token == term else 0.8
+            i += 1
+
+        limit = min(MAX_EDITS, len(term) // 4)
+        if limit:
+            candidates = set().union(*(self.gram_tokens.get(g, ()) for g in _trigrams(term)))
+            for token in candidates - matches.keys():
+                distance = _edit_distance(term, token[:len(term) + limit], limit)
+                if distance <= limit:
+                    matches[token] = 0.6 - 0.1 * distance
+        return matches
+
+    def search(self, query: str) -> list[int]:
+        """Ids matching every query term, best score first then newest"""
+        scores = None
+        for term in _tokens(query):
+            term_scores = {}
+            for token, score in self._matching_tokens(term).items():
+                for txn_id in self.postings[token]:
+                    if score > term_scores.get(txn_id, 0):
+                        term_scores[txn_id] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {i: s + term_scores[i] for i, s in scores.items() if i in term_scores}
+            if not scores:
+                return []
+        if not scores:
+            return []
+        return sorted(scores, key=lambda i: (-scores[i], -self.dates[i].toordinal()))
+
+
+_indexes = OrderedDict()  # user_id -> InvertedIndex, least recently used first
+_building = {}  # user_id -> list of _Build in flight; only users being built have an entry
+_lock = threading.Lock()
+
+
+class _Build:
+    """One index build in flight; a write committed meanwhile makes it stale"""
+    __slots__ = ("stale",)
+
+    def __init__(self):
+        self.stale = False
+
+
+def invalidate(user_id: int):
+    """Drop the user's index; called after every committed transaction create/delete"""
+    with _lock:
+        _indexes.pop(user_id, None)
+        for build in _building.get(user_id, ()):
+            build.stale = True
+
+
+def _user_index(db: Session, user_id: int) -> InvertedIndex:
+    with _lock:
+        index = _indexes.get(user_id)
+        if index is not None:
+            _indexes.move_to_end(user_id)
+            return index
+        build = _Build()
+        _building.setdefault(user_id, []).append(build)
+
+    try:
+        rows = (
+            db.query(Transaction.id, Transaction.description, Transaction.date)
+            .filter(Transaction.user_id == user_id, Transaction.description != None)
+            .all()
+        )
+        index = InvertedIndex(rows)
+    finally:
+        with _lock:
+            builds = _building[user_id]
+            builds.remove(build)
+            if not builds:
+                del _building[user_id]
+
+    with _lock:
+        # A write committed while this index was being built: serve it once, don't cache it
+        if build.stale:
+            return index
+        _indexes[user_id] = index
+        while len(_indexes) > MAX_CACHED_USERS:
+            _indexes.popitem(last=False)
+    return index
+
+
+def _result_query(db: Session, user_id: int):
+    return (
+        db.query(
+            Transaction.id,
+            Transaction.amount,
+            Transaction.description,
+            Transaction.date,
+            Transaction.category_id,
+            Category.name.label("category_name"),
+            Category.type.label("category_type"),
+        )
+        .join(Category)
+        .filter(Transaction.user_id == user_id)
+    )
+
+
+def search_transactions(db: Session, user_id: int, query: str, limit: int, offset: int):
+    """Page of transactions whose description matches ``query`` (prefix/typo tolerant)"""
+    if db.bind.dialect.name == "postgresql":
+        # Served by the pg_trgm GIN index on transactions.description
+        term = literal(query)
+        pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return (
+            _result_query(db, user_id)
+            .filter(or_(
+                Transaction.description.ilike(f"%{pattern}%", escape="\\"),
+                term.op("<%")(Transaction.description),
+            ))
+            .order_by(func.word_similarity(term, Transaction.description).desc(), Transaction.date.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+    ids = _user_index(db, user_id).search(query)[offset:offset + limit]
+    if not ids:
+        return []
+    rows = {r.id: r for r in _result_query(db, user_id).filter(Transaction.id.in_(ids)).all()}
+    return [rows[i] for i in ids if i in rows]
@@ -0,0 +1,105 @@
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import REFRESH_TOKEN_EXPIRE_DAYS, REFRESH_REUSE_GRACE_SECONDS
+from app.core.jwt import new_refresh_token, hash_refresh_token
+from app.models.refresh_token import RefreshToken
+
+
+def issue_refresh_token(db: Session, user_id: int, family_id: str | None = None) -> str:
+    """Store a new refresh token (a new family per login) and return it; the caller commits"""
+    token, token_hash = new_refresh_token()
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=token_hash,
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return token
+
+
+def _revoke_family(db: Session, family_id: str, now: datetime):
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at == None)
+        .values(revoked_at=now)
+    )
+
+
+def rotate_refresh_token(db: Session, token: str):
+    """
+    Spend a refresh token and issue its successor in the same family.
+
+    The spend is one conditional UPDATE, so two requests racing with the same
+    token cannot both spend it. A token spent within REFRESH_REUSE_GRACE_SECONDS
+    whose family is still live is another tab refreshing at the same moment:
+    it gets one extra successor, claimed by a second conditional UPDATE on
+    grace_used_at. Any other already-spent token, including a second replay
+    inside the window, means it leaked: the whole family is revoked. Returns
+    ``(user_id, new_token)`` or None. The caller commits.
+    """
+    now = datetime.utcnow()
+    token_hash = hash_refresh_token(token)
+    spent = db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at == None,
+            RefreshToken.expires_at > now,
+        )
+        .values(revoked_at=now)
+        .returning(RefreshToken.user_id, RefreshToken.family_id)
+    ).first()
+
+    if spent is None:
+        family_id = (
+            db.query(RefreshToken.family_id)
+            .filter(RefreshToken.token_hash == token_hash, RefreshToken.revoked_at != None)
+            .scalar()
+        )
+        if family_id is None:
+            return None
+
+        grace = db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at > now - timedelta(seconds=REFRESH_REUSE_GRACE_SECONDS),
+                RefreshToken.grace_used_at == None,
+            )
+            .values(grace_used_at=now)
+            .returning(RefreshToken.user_id)
+        ).first()
+        if grace is not None:
+            # Rotated, not logged out or revoked for reuse: the family still has a live token
+            live = (
+                db.query(RefreshToken.id)
+                .filter(
+                    RefreshToken.family_id == family_id,
+                    RefreshToken.revoked_at == None,
+                    RefreshToken.expires_at > now,
+                )
+                .first()
+            )
+            if live is not None:
+                return grace.user_id, issue_refresh_token(db, grace.user_id, family_id)
+        _revoke_family(db, family_id, now)
+        return None
+
+    return spent.user_id, issue_refresh_token(db, spent.user_id, spent.family_id)
+
+
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    """Log out: revoke the token's whole family. The caller commits."""
+    family_id = (
+        db.query(RefreshToken.family_id)
+        .filter(RefreshToken.token_hash == hash_refresh_token(token))
+        .scalar()
+    )
+    if family_id is None:
+        return False
+    _revoke_family(db, family_id, datetime.utcnow())
+    return True
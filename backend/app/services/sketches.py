@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+# Relative accuracy of every quantile the sketch answers (1%)
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch).
+
+    Positive values land in bucket ceil(log_gamma(x)), so any quantile is
+    answered within RELATIVE_ACCURACY of the true value. Sketches merge by
+    adding bucket counts, which makes them safe to build in chunks or per
+    worker and combine later. Buckets are stored densely from ``offset``;
+    spending amounts from ₹1 to ₹1 crore need under a thousand of them.
+    """
+
+    def __init__(self, offset: int = 0, counts: np.ndarray | None = None):
+        self.offset = offset
+        self.counts = counts if counts is not None else np.zeros(0, dtype=np.int64)
+
+    @staticmethod
+    def bucket(values) -> np.ndarray:
+        return np.ceil(np.log(np.asarray(values, dtype=np.float64)) / _LOG_GAMMA).astype(np.int64)
+
+    @staticmethod
+    def bucket_value(index) -> np.ndarray:
+        """Representative value of a bucket (relative error <= RELATIVE_ACCURACY)"""
+        return 2 * GAMMA ** np.asarray(index, dtype=np.float64) / (GAMMA + 1)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def _resize(self, lo: int, hi: int):
+        if not self.counts.size:
+            self.offset = lo
+            self.counts = np.zeros(hi - lo + 1, dtype=np.int64)
+            return
+        lo, hi = min(lo, self.offset), max(hi, self.offset + self.counts.size - 1)
+        if lo == self.offset and hi == self.offset + self.counts.size - 1:
+            return
+        counts = np.zeros(hi - lo + 1, dtype=np.int64)
+        counts[self.offset - lo:self.offset - lo + self.counts.size] = self.counts
+        self.offset, self.counts = lo, counts
+
+    def add(self, values):
+        """Add a batch of values; non-positive values are ignored"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[values > 0]
+        if not values.size:
+            return
+        idx = self.bucket(values)
+        self._resize(int(idx.min()), int(idx.max()))
+        self.counts += np.bincount(idx - self.offset, minlength=self.counts.size)
+
+    def merge(self, other: "QuantileSketch"):
+        if not other.counts.size:
+            return
+        self._resize(other.offset, other.offset + other.counts.size - 1)
+        start = other.offset - self.offset
+        self.counts[start:start + other.counts.size] += other.counts
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if not total:
+            return None
+        cumulative = np.cumsum(self.counts)
+        i = int(np.searchsorted(cumulative, q * (total - 1), side="right"))
+        return float(self.bucket_value(self.offset + i))
+
+    def rank(self, value: float) -> float | None:
+        """Share of values (0-100) below ``value``; ties count half"""
+        total = self.count
+        if not total:
+            return None
+        if value <= 0:
+            return 0.0
+        i = int(self.bucket(value)) - self.offset
+        if i < 0:
+            return 0.0
+        if i >= self.counts.size:
+            return 100.0
+        below = self.counts[:i].sum() + self.counts[i] / 2
+        return float(100 * below / total)
+
+    def to_bytes(self) -> bytes:
+        return self.counts.astype("<i8").tobytes()
+
+    @classmethod
+    def from_bytes(cls, offset: int, data: bytes) -> "QuantileSketch":
+        return cls(offset, np.frombuffer(data, dtype="<i8").astype(np.int64))
@@ -0,0 +1,336 @@
+import csv
+import io
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import insert, select
+
+from app.core.security import hash_password
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.savings_goal import SavingsGoal
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.merchants import normalize_merchant
+
+USER_BATCH = 500
+PASSWORD = "synthetic-password"
+EMAIL_DOMAIN = "synthetic.example.com"
+
+# Median monthly salary (INR) of the generated population; spread is log-normal
+MEDIAN_SALARY = 60000
+
+# Everyday spend per category: (transactions per day for a typical user,
+# merchants as (description, median amount)). Descriptions are what a bank
+# or UPI statement shows, so merchant normalization sees realistic text.
+DAILY_SPEND = {
+    "Food": (0.45, (
+        ("SWIGGY*ORDER", 380), ("ZOMATO ONLINE ORDER", 420),
+        ("UPI/CHAAYOS", 240), ("UPI/DOMINOS PIZZA", 550),
+    )),
+    "Groceries": (0.22, (
+        ("BLINKIT", 520), ("BIGBASKET ORDER", 1400), ("ZEPTO MARKETPLACE", 450), ("UPI/DMART", 1900),
+    )),
+    "Transport": (0.5, (
+        ("UBER TRIP", 290), ("OLA CABS", 250), ("RAPIDO BIKE", 95), ("HPCL FUEL STATION", 1500),
+    )),
+    "Shopping": (0.1, (
+        ("AMAZON PAY", 1300), ("FLIPKART INTERNET", 1600), ("MYNTRA DESIGNS", 1900),
+    )),
+    "Entertainment": (0.05, (("BOOKMYSHOW", 650), ("PVR CINEMAS", 750))),
+    "Healthcare": (0.03, (("APOLLO PHARMACY", 650), ("PRACTO CONSULTATION", 900))),
+    "Travel": (0.01, (("IRCTC TICKET", 1900), ("MAKEMYTRIP", 9000), ("INDIGO AIRLINES", 7500))),
+    "Education": (0.01, (("UDEMY", 550), ("COURSERA", 3200))),
+}
+
+# Spend multiplier by calendar month, Jan..Dec (festive season, summer/winter travel, monsoon)
+SEASONALITY = {
+    "Food": (1.05, 1, 1, 1, 1, 1, 1, 1, 1, 1.1, 1.15, 1.25),
+    "Shopping": (1, 0.9, 1, 1, 1, 0.9, 1.2, 1, 1.1, 1.9, 1.6, 1.2),
+    "Travel": (1, 1, 1, 1.3, 2.2, 1.8, 0.7, 0.6, 0.8, 1.2, 1.4, 2.4),
+    "Healthcare": (1, 1, 1, 1, 1, 1, 1.5, 1.5, 1.2, 1, 1, 1),
+    "Entertainment": (1, 1, 1, 1, 1.2, 1.2, 1, 1, 1, 1.2, 1.2, 1.3),
+}
+# Spend multiplier on Saturdays and Sundays
+WEEKEND_BOOST = {"Food": 1.5, "Entertainment": 1.8, "Shopping": 1.3, "Transport": 0.8}
+
+# Monthly "Bills", each taken by a user with probability SUBSCRIPTION_RATE
+SUBSCRIPTIONS = (
+    ("NETFLIX.COM", 649), ("SPOTIFY INDIA", 119), ("DISNEY HOTSTAR", 299),
+    ("YOUTUBE PREMIUM", 129), ("AIRTEL POSTPAID", 599), ("JIO RECHARGE", 349),
+)
+SUBSCRIPTION_RATE = 0.4
+ELECTRICITY = "BESCOM ELECTRICITY BILL"
+ELECTRICITY_SEASON = (1, 1, 1.2, 1.5, 1.7, 1.5, 1.1, 1, 1, 1, 0.9, 0.9)
+
+EMPLOYERS = ("INFOSYS LTD", "TATA CONSULTANCY", "WIPRO LTD", "HDFC BANK", "ACCENTURE SOLUTIONS", "RELIANCE INDUSTRIES")
+RENT_SHARE = 0.65  # users paying rent
+FREELANCE_SHARE = 0.25  # users with side income
+
+# (name, goal category, target in months of salary)
+GOALS = (
+    ("Emergency Fund", "emergency", 6),
+    ("Vacation", "vacation", 1.5),
+    ("New Phone", "gadget", 1),
+    ("Home Down Payment", "home", 24),
+    ("Retirement", "investment", 60),
+)
+
+FIRST_NAMES = ("Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Kavya", "Rohan", "Meera", "Arjun", "Priya", "Sneha")
+LAST_NAMES = ("Sharma", "Patel", "Iyer", "Reddy", "Nair", "Gupta", "Singh", "Das", "Mehta", "Rao", "Kulkarni", "Joshi")
+
+TRANSACTION_COLUMNS = (
+    "amount", "description", "date", "merchant_key", "anomaly_score", "is_anomaly", "category_id", "user_id",
+)
+BUDGET_COLUMNS = ("user_id", "category_id", "monthly_limit")
+GOAL_COLUMNS = ("user_id", "name", "target_amount", "current_amount", "category", "priority", "created_at", "target_date")
+
+
+class Calendar:
+    """Day-level lookups for the simulated window, shared by every user"""
+
+    def __init__(self, start: date, end: date):
+        self.start = start
+        self.end = end
+        self.days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+        self.n_days = len(self.days)
+        self.iso = [str(d) for d in self.days]
+
+        months = self.days.astype("datetime64[M]")
+        self.month_of_year = months.astype(int) % 12
+        # 1970-01-01 was a Thursday
+        self.weekend = (self.days.astype(int) + 3) % 7 >= 5
+
+        self.month_starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+        # Days in the full calendar month (the last month may be cut short)
+        next_month = (months[self.month_starts] + 1).astype("datetime64[D]")
+        self.days_in_month = (next_month - months[self.month_starts].astype("datetime64[D]")).astype(int)
+        self.n_months = len(self.month_starts)
+        self.month_of_year_by_month = self.month_of_year[self.month_starts]
+
+        # Expected daily transactions per spend category for a typical user
+        self.spend_categories = list(DAILY_SPEND)
+        base = np.empty((len(self.spend_categories), self.n_days))
+        for i, name in enumerate(self.spend_categories):
+            season = np.array(SEASONALITY.get(name, (1,) * 12))
+            base[i] = DAILY_SPEND[name][0] * season[self.month_of_year]
+            base[i, self.weekend] *= WEEKEND_BOOST.get(name, 1)
+        self.spend_rates = base
+
+    def day_in_month(self, day: np.ndarray) -> np.ndarray:
+        """Index of day-of-month ``day`` (1-based, clamped to month end) in every month; -1 if past the window"""
+        idx = self.month_starts + np.minimum(day, self.days_in_month) - 1
+        return np.where(idx < self.n_days, idx, -1)
+
+
+class Descriptions:
+    """Every description the generator writes, with its category and merchant key"""
+
+    def __init__(self, category_ids: dict):
+        self.category_ids = category_ids
+        self.text, self.category_id, self.merchant_key, self.is_expense = [], [], [], []
+
+        self.spend_first, self.spend_count, self.spend_median = [], [], []
+        for name, (_, merchants) in DAILY_SPEND.items():
+            self.spend_first.append(len(self.text))
+            self.spend_count.append(len(merchants))
+            for text, median in merchants:
+                self.add(text, name, "expense")
+                self.spend_median.append(median)
+
+        self.subscriptions = [self.add(text, "Bills", "expense") for text, _ in SUBSCRIPTIONS]
+        self.electricity = self.add(ELECTRICITY, "Bills", "expense")
+        # Undescribed transfers, like most rent payments
+        self.rent = self.add(None, "Rent", "expense")
+        self.salary = [self.add(f"NEFT SALARY {employer}", "Salary", "income") for employer in EMPLOYERS]
+        self.freelance = self.add("UPWORK PAYMENT", "Freelance", "income")
+        self.interest = self.add("SAVINGS INTEREST CREDIT", "Interest", "income")
+
+        self.spend_first = np.array(self.spend_first)
+        self.spend_count = np.array(self.spend_count)
+        self.spend_median = np.array(self.spend_median, dtype=float)
+        self.category_id = np.array(self.category_id)
+        self.is_expense = np.array(self.is_expense)
+
+    def add(self, text, category_name: str, category_type: str) -> int:
+        self.text.append(text)
+        self.category_id.append(self.category_ids[category_name, category_type])
+        self.merchant_key.append(normalize_merchant(text, category_name))
+        self.is_expense.append(category_type == "expense")
+        return len(self.text) - 1
+
+
+def generate_user(rng: np.random.Generator, cal: Calendar, desc: Descriptions) -> dict:
+    """
+    One user's history over the calendar window: salary with yearly raises,
+    rent, subscriptions and a seasonal electricity bill, optional freelance
+    income, quarterly interest and Poisson everyday spend shaped by month
+    and weekday. Budgets and goals are sized from the generated spend.
+    """
+    salary = round(MEDIAN_SALARY * rng.lognormal(0, 0.5), -2)
+    month_number = np.arange(cal.n_months)
+    days, items, amounts = [], [], []
+
+    def monthly(day_of_month, item, amount, when=True):
+        idx = cal.day_in_month(day_of_month)
+        keep = (idx >= 0) & when
+        days.append(idx[keep])
+        items.append(np.full(keep.sum(), item))
+        amounts.append(np.broadcast_to(amount, idx.shape)[keep])
+
+    # Appraisals every 12 months from the start of the window
+    raises = (1 + rng.uniform(0.04, 0.12)) ** (month_number // 12)
+    pay_day = rng.choice((1, 1, 1, 7, 25, 28, 31))
+    monthly(pay_day, desc.salary[rng.integers(len(EMPLOYERS))], np.round(salary * raises, -2))
+
+    if rng.random() < RENT_SHARE:
+        rent = salary * rng.uniform(0.18, 0.32) * 1.05 ** (month_number // 12)
+        monthly(rng.integers(1, 6), desc.rent, np.round(rent, -2))
+    for item, (_, price) in zip(desc.subscriptions, SUBSCRIPTIONS):
+        if rng.random() < SUBSCRIPTION_RATE:
+            monthly(rng.integers(1, 29), item, float(price))
+    electricity = (
+        salary * rng.uniform(0.015, 0.03)
+        * np.array(ELECTRICITY_SEASON)[cal.month_of_year_by_month]
+        * rng.lognormal(0, 0.1, cal.n_months)
+    )
+    monthly(rng.integers(5, 16), desc.electricity, np.round(electricity))
+
+    if rng.random() < FREELANCE_SHARE:
+        payout = np.round(salary * 0.15 * rng.lognormal(0, 0.5, cal.n_months), -2)
+        monthly(rng.integers(1, 29, cal.n_months), desc.freelance, payout, rng.random(cal.n_months) < 0.35)
+    # Credited on the last day of Mar/Jun/Sep/Dec
+    interest = np.round(salary * rng.uniform(0.02, 0.08) * rng.lognormal(0, 0.1, cal.n_months), 2)
+    monthly(31, desc.interest, interest, np.isin(cal.month_of_year_by_month, (2, 5, 8, 11)))
+
+    # Everyday spend: Poisson counts per category/day, then a merchant and a log-normal amount each
+    activity = rng.lognormal(0, 0.35) * rng.lognormal(0, 0.5, len(cal.spend_categories))
+    counts = rng.poisson(cal.spend_rates * activity[:, None])
+    cell = np.repeat(np.arange(counts.size), counts.ravel())
+    category, day = np.divmod(cell, cal.n_days)
+    item = desc.spend_first[category] + (rng.random(len(cell)) * desc.spend_count[category]).astype(int)
+    scale = (salary / MEDIAN_SALARY) ** 0.6
+    days.append(day)
+    items.append(item)
+    amounts.append(np.maximum(np.round(desc.spend_median[item] * scale * rng.lognormal(0, 0.55, len(cell))), 10))
+
+    days, items, amounts = np.concatenate(days), np.concatenate(items), np.concatenate(amounts)
+    order = np.argsort(days, kind="stable")
+    days, items, amounts = days[order], items[order], amounts[order]
+
+    # Budgets on the biggest expense categories, some set tighter than actual spend
+    expense = desc.is_expense[items]
+    monthly_spend = np.bincount(desc.category_id[items[expense]], weights=amounts[expense]) / cal.n_months
+    budgeted = np.argsort(monthly_spend)[::-1][:rng.integers(3, 7)]
+    budgets = [
+        (int(c), max(100.0, round(monthly_spend[c] * rng.uniform(0.8, 1.3), -2)))
+        for c in budgeted if monthly_spend[c] > 0
+    ]
+
+    goals = []
+    for g in rng.choice(len(GOALS), size=rng.integers(1, 4), replace=False):
+        name, kind, salary_months = GOALS[g]
+        target = round(salary * salary_months, -3)
+        goals.append((
+            name, target, round(target * rng.uniform(0, 0.7), -2), kind, int(rng.integers(1, 4)),
+            cal.start + timedelta(days=int(rng.integers(cal.n_days))),
+            cal.end + timedelta(days=int(rng.integers(180, 1080))),
+        ))
+
+    return {
+        "full_name": f"{FIRST_NAMES[rng.integers(len(FIRST_NAMES))]} {LAST_NAMES[rng.integers(len(LAST_NAMES))]}",
+        "days": days,
+        "items": items,
+        "amounts": amounts,
+        "budgets": budgets,
+        "goals": goals,
+    }
+
+
+def bulk_insert(conn, table: str, columns, rows):
+    """COPY rows into ``table`` on Postgres; executemany on other databases"""
+    cursor = conn.connection.cursor()
+    try:
+        if conn.dialect.name == "postgresql":
+            buffer = io.StringIO()
+            # Unquoted empty fields are NULL in COPY's CSV format
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        else:
+            marks = ", ".join("?" * len(columns))
+            cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({marks})", rows)
+    finally:
+        cursor.close()
+
+
+def history_window(months: int, end: date):
+    """First day of the month ``months - 1`` months before ``end``, and ``end``"""
+    first = end.year * 12 + end.month - 1 - (months - 1)
+    return date(first // 12, first % 12 + 1, 1), end
+
+
+def synthetic_email(seed: int, index: int) -> str:
+    return f"user{index:07d}.s{seed}@{EMAIL_DOMAIN}"
+
+
+def load_synthetic_data(conn, n_users: int, seed: int = 0, months: int = 24, end: date | None = None,
+                        first_user: int = 0, batch_size: int = USER_BATCH):
+    """
+    Generate users ``first_user .. first_user + n_users - 1`` and bulk-load
+    them with their transactions, budgets and goals, committing per batch.
+    Yields ``(users, transactions)`` for each batch.
+
+    User i's data depends only on (seed, i, months, end), so a run is
+    reproducible and can be split across processes or resumed by index.
+    Every user logs in with PASSWORD.
+    """
+    cal = Calendar(*history_window(months, end or date.today()))
+    category_ids = {
+        (name, type_): id_
+        for id_, name, type_ in conn.execute(
+            select(Category.id, Category.name, Category.type).where(Category.user_id == None)
+        )
+    }
+    desc = Descriptions(category_ids)
+    text, merchant_key, category_id = desc.text, desc.merchant_key, desc.category_id.tolist()
+    hashed_password = hash_password(PASSWORD)
+    created_at = datetime.combine(cal.start, datetime.min.time())
+
+    for batch_start in range(first_user, first_user + n_users, batch_size):
+        indices = range(batch_start, min(batch_start + batch_size, first_user + n_users))
+        plans = [generate_user(np.random.default_rng([seed, i]), cal, desc) for i in indices]
+
+        user_ids = conn.execute(
+            insert(User.__table__).returning(User.__table__.c.id, sort_by_parameter_order=True),
+            [
+                {
+                    "email": synthetic_email(seed, i),
+                    "hashed_password": hashed_password,
+                    "full_name": plan["full_name"],
+                    "subscription_plan": "Free",
+                    "created_at": created_at,
+                }
+                for i, plan in zip(indices, plans)
+            ],
+        ).scalars().all()
+
+        transactions, budgets, goals = [], [], []
+        for user_id, plan in zip(user_ids, plans):
+            for day, item, amount in zip(plan["days"].tolist(), plan["items"].tolist(), plan["amounts"].tolist()):
+                transactions.append((
+                    amount, text[item], cal.iso[day], merchant_key[item], None, False, category_id[item], user_id,
+                ))
+            budgets.extend((user_id, c, limit) for c, limit in plan["budgets"])
+            goals.extend((user_id, *goal) for goal in plan["goals"])
+
+        bulk_insert(conn, Transaction.__tablename__, TRANSACTION_COLUMNS, transactions)
+        bulk_insert(conn, Budget.__tablename__, BUDGET_COLUMNS, budgets)
+        bulk_insert(conn, SavingsGoal.__tablename__, GOAL_COLUMNS, goals)
+        conn.commit()
+        yield len(user_ids), len(transactions)
+
+    if conn.dialect.name == "postgresql":
+        # Fresh planner statistics, or the first benchmark runs see empty tables
+        conn.exec_driver_sql("ANALYZE users, transactions, budgets, savings_goals")
+        conn.commit()
@@ -0,0 +1,564 @@
+"""
+Endpoint latency and queries-per-request benchmark with a regression gate.
+
+    cd backend && DATABASE_URL=sqlite:////tmp/bench.db python -m benchmarks.bench_endpoints --save-baseline
+    cd backend && DATABASE_URL=sqlite:////tmp/bench.db python -m benchmarks.bench_endpoints
+    python -m benchmarks.bench_endpoints --only /analytics --requests 50
+
+Needs the dev requirements: pip install -r requirements-dev.txt
+
+On first use the database is filled by the synthetic data generator
+(--data-users users, ~1,450 transactions each); for scale runs load it
+beforehand with `python -m app.jobs.synthetic_data` and the same --seed.
+Every route in app/routes is called --requests times in process, rotating
+through --users of the synthetic users, and reports p50/p95 latency and the
+median SQL statements per request (X-DB-Queries). Writes made to measure
+a POST/PUT/DELETE route are undone after the request, through the API where
+it can and directly in the database where it can't (signups, new
+categories, budget limits, goal contributions, the overwritten profile
+phone and goal priority), and the sessions the run logged in with are
+deleted at the end, so repeated runs measure the same data. Not undone:
+tables rebuilt from that data (budget alerts, spending benchmarks), and the
+request profiles /admin/profiles lists, which go to a temporary directory
+removed on exit.
+
+Results are compared with benchmarks/baselines/endpoints-<dialect>.json
+(record one with --save-baseline on the reference machine); the run exits 1
+when a route's latency or query count grows by more than --threshold (routes
+that regress are re-measured up to --retries times first, keeping the best
+run), a route returns an unexpected status, a route has no entry in
+ENDPOINTS or SKIPPED below, or the database no longer matches the data
+fingerprint (row counts, seed, last transaction date) the baseline was
+recorded on.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+# Settings are read when the app is imported: per-response query counts,
+# no rate limiting, cheap bcrypt so untimed logins don't dominate the run,
+# and an empty profile store so /admin/profiles sees the same data every run
+os.environ["DEBUG"] = "1"
+os.environ["RATE_LIMIT_ENABLED"] = "0"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ["PROFILE_DIR"] = tempfile.mkdtemp(prefix="finsmart-bench-profiles-")
+
+import httpx
+import numpy as np
+from fastapi.routing import APIRoute
+from sqlalchemy import func, select
+
+from app.core.config import ADMIN_EMAILS
+from app.database import SessionLocal, engine
+from app.main import app, startup_event
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.goal_contribution import GoalContribution
+from app.models.refresh_token import RefreshToken
+from app.models.savings_goal import SavingsGoal
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.benchmarks import build_benchmarks
+from app.services.budget_alerts import on_budget_written
+from app.services.synthetic import PASSWORD, load_synthetic_data, synthetic_email
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+# Latency changes smaller than this are noise whatever the ratio
+MIN_DELTA_MS = 2.0
+
+# Routes not measured, with the reason
+SKIPPED = {
+    ("GET", "/alerts/stream"): "long-lived SSE stream",
+    ("GET", "/markets/ticker"): "calls the NSE API over the network",
+}
+
+
+def endpoint(method, path, params=None, json=None, setup=None, cleanup=None, ok=(200,)):
+    """
+    One benchmarked request. ``params``/``json`` are dicts or callables of the
+    request context; ``setup(client, ctx)`` runs untimed before each request
+    and returns extra context (ids for the path, tokens); ``cleanup(client,
+    ctx, response)`` undoes what the request created.
+    """
+    return {
+        "method": method, "path": path, "params": params, "json": json,
+        "setup": setup, "cleanup": cleanup, "ok": ok,
+    }
+
+
+def _create(url, body, key):
+    async def setup(client, ctx):
+        r = await client.post(url, json=body(ctx), headers=ctx["headers"])
+        r.raise_for_status()
+        return {key: r.json()["id"]}
+    return setup
+
+
+def _delete(url):
+    async def cleanup(client, ctx, response):
+        if response.status_code == 200:
+            await client.delete(url.format(id=response.json()["id"]), headers=ctx["headers"])
+    return cleanup
+
+
+def _in_db(undo):
+    """Cleanup for writes the API can't undo: ``undo(db, ctx, body)`` runs in its own session"""
+    async def cleanup(client, ctx, response):
+        if response.status_code != 200:
+            return
+        db = SessionLocal()
+        try:
+            undo(db, ctx, response.json())
+            db.commit()
+        finally:
+            db.close()
+    return cleanup
+
+
+def _drop_user(db, ctx, body):
+    db.query(User).filter(User.id == body["id"]).delete()
+
+
+def _drop_category(db, ctx, body):
+    db.query(Category).filter(Category.id == body["id"]).delete()
+
+
+async def _budget_before(client, ctx):
+    db = SessionLocal()
+    try:
+        limit = db.query(Budget.monthly_limit).filter(
+            Budget.user_id == ctx["user_id"], Budget.category_id == ctx["food_id"]
+        ).scalar()
+    finally:
+        db.close()
+    return {"previous_limit": limit}
+
+
+def _restore_budget(db, ctx, body):
+    budget = db.query(Budget).filter(Budget.id == body["id"]).one()
+    if ctx["previous_limit"] is None:
+        db.delete(budget)
+    else:
+        budget.monthly_limit = ctx["previous_limit"]
+    db.flush()
+    on_budget_written(db, ctx["user_id"], ctx["food_id"])
+
+
+def _drop_contribution(db, ctx, body):
+    contribution = (
+        db.query(GoalContribution)
+        .filter(GoalContribution.goal_id == ctx["goal_id"], GoalContribution.description == "bench")
+        .order_by(GoalContribution.id.desc())
+        .first()
+    )
+    db.query(SavingsGoal).filter(SavingsGoal.id == ctx["goal_id"]).update(
+        {SavingsGoal.current_amount: SavingsGoal.current_amount - contribution.amount}
+    )
+    db.delete(contribution)
+
+
+def _restoring(model, column, id_key):
+    """setup/cleanup that put ``column`` of the row with id ``ctx[id_key]`` back after a PUT overwrites it"""
+    async def setup(client, ctx):
+        db = SessionLocal()
+        try:
+            value = db.query(column).filter(model.id == ctx[id_key]).scalar()
+        finally:
+            db.close()
+        return {"previous_value": value}
+
+    def undo(db, ctx, body):
+        db.query(model).filter(model.id == ctx[id_key]).update({column: ctx["previous_value"]})
+
+    return {"setup": setup, "cleanup": _in_db(undo)}
+
+
+def data_fingerprint(db, seed):
+    """What the timings depend on; a baseline only applies to the same data"""
+    counts = {
+        name: db.execute(select(func.count()).select_from(model)).scalar()
+        for name, model in (
+            ("users", User),
+            ("transactions", Transaction),
+            ("categories", Category),
+            ("budgets", Budget),
+            ("savings_goals", SavingsGoal),
+            ("goal_contributions", GoalContribution),
+            ("refresh_tokens", RefreshToken),
+        )
+    }
+    last_day = db.query(func.max(Transaction.date)).scalar()
+    return {**counts, "seed": seed, "last_transaction": str(last_day)}
+
+
+async def _login(client, ctx):
+    r = await client.post("/auth/login", json={"email": ctx["email"], "password": ctx["password"]})
+    r.raise_for_status()
+    return {"refresh_token": r.json()["refresh_token"]}
+
+
+async def _profiled_request(client, ctx):
+    r = await client.get("/", headers={**ctx["headers"], "X-Profile": "1"})
+    return {"profile_id": r.headers["x-profile-id"]}
+
+
+def _transaction(ctx):
+    return {"amount": 420, "description": "SWIGGY*ORDER", "date": ctx["day"], "category_id": ctx["food_id"]}
+
+
+def _goal(ctx):
+    return {"name": "Bench goal", "target_amount": 50000, "category": "vacation"}
+
+
+def _rule(ctx):
+    return {"rule_type": "roundup", "value": 10, "goal_id": ctx["goal_id"]}
+
+
+def _cash_flow(ctx):
+    return {"portfolio": "bench", "date": ctx["day"], "kind": "buy", "amount": 5000}
+
+
+def _month(ctx):
+    return {"year": ctx["year"], "month": ctx["month"]}
+
+
+def _ym(ctx):
+    return {"month": ctx["ym"]}
+
+
+ENDPOINTS = [
+    # auth / users / categories
+    endpoint("POST", "/auth/signup", json=lambda ctx: {"email": f"bench-{uuid.uuid4().hex}@example.com", "password": "bench-password"},
+             cleanup=_in_db(_drop_user)),
+    endpoint("POST", "/auth/login", json=lambda ctx: {"email": ctx["email"], "password": ctx["password"]}),
+    endpoint("POST", "/auth/refresh", json=lambda ctx: {"refresh_token": ctx["refresh_token"]}, setup=_login),
+    endpoint("POST", "/auth/logout", json=lambda ctx: {"refresh_token": ctx["refresh_token"]}, setup=_login),
+    endpoint("GET", "/users/me"),
+    endpoint("GET", "/users/profile"),
+    endpoint("PUT", "/users/profile", json={"phone": "9800000000"}, **_restoring(User, User.phone, "user_id")),
+    endpoint("POST", "/categories/", json=lambda ctx: {"name": f"Bench {uuid.uuid4().hex[:6]}", "type": "expense"},
+             cleanup=_in_db(_drop_category)),
+    endpoint("GET", "/categories/"),
+    # transactions
+    endpoint("POST", "/transactions/", json=_transaction, cleanup=_delete("/transactions/{id}")),
+    endpoint("GET", "/transactions/"),
+    endpoint("GET", "/transactions/search", params={"q": "swiggy"}),
+    endpoint("DELETE", "/transactions/{transaction_id}", setup=_create("/transactions/", _transaction, "transaction_id")),
+    endpoint("GET", "/summary/monthly", params=_month),
+    # analytics
+    endpoint("GET", "/analytics/expense-by-category", params=_month),
+    endpoint("GET", "/analytics/top-expenses"),
+    endpoint("GET", "/analytics/top-merchants", params=_month),
+    endpoint("GET", "/analytics/benchmark", params=lambda ctx: {"category": "food", **_month(ctx)}, ok=(200, 404)),
+    endpoint("GET", "/analytics/daily-expense", params=_month),
+    endpoint("GET", "/analytics/summary", params=_ym),
+    endpoint("GET", "/analytics/insights"),
+    endpoint("GET", "/analytics/auto-savings", params=_month),
+    endpoint("GET", "/analytics/historical-comparison"),
+    endpoint("GET", "/analytics/goal-vs-reality", params=_month),
+    endpoint("GET", "/analytics/recurring-transactions"),
+    endpoint("GET", "/analytics/income-expense-ratio"),
+    # budgets, insights, alerts
+    endpoint("POST", "/budget/", json=lambda ctx: {"category_id": ctx["food_id"], "monthly_limit": 12000},
+             setup=_budget_before, cleanup=_in_db(_restore_budget)),
+    endpoint("GET", "/budget/usage/{food_id}", params=_ym),
+    endpoint("POST", "/budget/check-alerts/{food_id}", params=_ym),
+    endpoint("POST", "/categorize-expense/", json={"text": "Swiggy dinner order"}),
+    endpoint("GET", "/insights/enhanced", params=_ym),
+    endpoint("GET", "/insights/monthly", params=_ym),
+    endpoint("GET", "/alerts/", params=_ym),
+    endpoint("POST", "/ai/search", json={"query": "what is compounding"}),
+    # calculators
+    endpoint("POST", "/sip/calculate", json={"monthly_investment": 10000, "annual_rate": 12, "years": 15, "step_up_percent": 10}),
+    endpoint("GET", "/sip/calculate", params={"monthly_investment": 10000, "annual_rate": 12, "years": 15}),
+    endpoint("POST", "/sip/scenarios", json={"monthly_investment": [5000, 10000, 20000], "annual_rate": [10, 12, 14], "years": [10, 20]}),
+    endpoint("POST", "/sip/monte-carlo", json={"monthly_investment": 10000, "years": 20, "paths": 10000, "seed": 1}),
+    endpoint("POST", "/investment/advice", json={"risk_profile": "medium"}),
+    endpoint("GET", "/investment/backtest", params={"risk_profile": "medium"}, ok=(200, 503)),
+    endpoint("POST", "/savings/advice", json={"monthly_income": 80000, "monthly_expenses": 52000}),
+    endpoint("GET", "/savings/advice", params={"monthly_income": 80000, "monthly_expenses": 52000}),
+    endpoint("POST", "/loans/amortization", json={"loans": [
+        {"principal": 5000000, "annual_rate": 8.5, "tenure_months": 240, "prepayments": [{"month": 24, "amount": 200000}]},
+        {"principal": 800000, "annual_rate": 10.5, "tenure_months": 60},
+    ]}),
+    endpoint("GET", "/forecast/cashflow"),
+    # savings goals and auto-save
+    endpoint("POST", "/savings-goals/", json=_goal, cleanup=_delete("/savings-goals/{id}")),
+    endpoint("GET", "/savings-goals/"),
+    endpoint("GET", "/savings-goals/required-sip"),
+    endpoint("PUT", "/savings-goals/{goal_id}", json={"priority": 2},
+             **_restoring(SavingsGoal, SavingsGoal.priority, "goal_id")),
+    endpoint("POST", "/savings-goals/{goal_id}/add-progress", json={"amount": 100, "description": "bench"},
+             cleanup=_in_db(_drop_contribution)),
+    endpoint("GET", "/savings-goals/{goal_id}/contributions"),
+    endpoint("DELETE", "/savings-goals/{new_goal_id}", setup=_create("/savings-goals/", _goal, "new_goal_id")),
+    endpoint("GET", "/savings-analytics/trend"),
+    endpoint("GET", "/savings-analytics/safety-score"),
+    endpoint("GET", "/savings-analytics/consistency"),
+    endpoint("GET", "/savings-analytics/records"),
+    endpoint("POST", "/savings-analytics/rules", json=_rule, cleanup=_delete("/savings-analytics/rules/{id}")),
+    endpoint("GET", "/savings-analytics/rules"),
+    endpoint("DELETE", "/savings-analytics/rules/{rule_id}", setup=_create("/savings-analytics/rules", _rule, "rule_id")),
+    endpoint("GET", "/savings-analytics/recommendations"),
+    # portfolio
+    endpoint("POST", "/portfolio/cash-flows", json=_cash_flow, cleanup=_delete("/portfolio/cash-flows/{id}")),
+    endpoint("GET", "/portfolio/cash-flows"),
+    endpoint("DELETE", "/portfolio/cash-flows/{flow_id}", setup=_create("/portfolio/cash-flows", _cash_flow, "flow_id")),
+    endpoint("GET", "/portfolio/returns", ok=(200, 404)),
+    # admin
+    endpoint("GET", "/admin/profiles"),
+    endpoint("GET", "/admin/profiles/{profile_id}", setup=_profiled_request),
+]
+
+
+def _resolve(value, ctx):
+    return value(ctx) if callable(value) else value
+
+
+def _shape(method, path):
+    # Path parameter names may differ from the route's, so compare with them blanked
+    return method, "/".join("{}" if part.startswith("{") else part for part in path.split("/"))
+
+
+def check_coverage():
+    """Routes under app/routes with neither a benchmark nor a reason to skip"""
+    covered = {_shape(e["method"], e["path"]) for e in ENDPOINTS} | {_shape(*key) for key in SKIPPED}
+    missing = []
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.endpoint.__module__.startswith("app.routes."):
+            for method in route.methods:
+                if _shape(method, route.path) not in covered:
+                    missing.append(f"{method} {route.path}")
+    return missing
+
+
+async def measure(client, spec, users, requests, warmup):
+    latencies, queries, errors = [], [], []
+    for i in range(warmup + requests):
+        ctx = dict(users[i % len(users)])
+        if spec["setup"]:
+            ctx.update(await spec["setup"](client, ctx))
+
+        start = time.perf_counter()
+        r = await client.request(
+            spec["method"],
+            spec["path"].format(**ctx),
+            params=_resolve(spec["params"], ctx),
+            json=_resolve(spec["json"], ctx),
+            headers=ctx["headers"],
+        )
+        elapsed = time.perf_counter() - start
+
+        if spec["cleanup"]:
+            await spec["cleanup"](client, ctx, r)
+        if r.status_code not in spec["ok"]:
+            errors.append(f"{r.status_code}: {r.text[:120]}")
+        if i >= warmup:
+            latencies.append(elapsed * 1000)
+            queries.append(int(r.headers.get("x-db-queries", 0)))
+
+    return {
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+        "queries": float(np.median(queries)),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Regressions of ``results`` against ``baseline`` as (route, description) pairs"""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            limit = base[metric] * (1 + threshold)
+            if current[metric] > limit and current[metric] - base[metric] > MIN_DELTA_MS:
+                regressions.append((key, f"{metric} {base[metric]} -> {current[metric]}"))
+        if current["queries"] > base["queries"] * (1 + threshold) and current["queries"] - base["queries"] >= 1:
+            regressions.append((key, f"queries {base['queries']:g} -> {current['queries']:g}"))
+    return regressions
+
+
+def best_of(first, second):
+    """Keep the better run of each metric, so one noisy pass can't fail a route"""
+    merged = dict(first)
+    for metric in ("p50_ms", "p95_ms", "queries"):
+        merged[metric] = min(first[metric], second[metric])
+    return merged
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark every API route")
+    parser.add_argument("--users", type=int, default=10, help="Synthetic users the requests rotate through")
+    parser.add_argument("--requests", type=int, default=30, help="Timed requests per route")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--data-users", type=int, default=200, help="Users to generate when the database has none")
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", help="Only routes whose path starts with this prefix")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative growth before failing")
+    parser.add_argument("--retries", type=int, default=2, help="Re-measurements of a regressed route before failing")
+    parser.add_argument("--baseline", help="Baseline file (default: baselines/endpoints-<dialect>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    return parser.parse_args()
+
+
+async def main_async(args):
+    emails = [synthetic_email(args.seed, i) for i in range(args.users)]
+    # Lets the bench users call /admin routes (the set is shared with app.core.profiling)
+    ADMIN_EMAILS.update(emails)
+    # Repeated-statement warnings would interleave with the table, which already shows query counts
+    logging.getLogger("finsmart.db").setLevel(logging.ERROR)
+
+    missing = check_coverage()
+    if missing:
+        print("Routes without a benchmark (add to ENDPOINTS or SKIPPED):\n  " + "\n  ".join(missing))
+        sys.exit(1)
+
+    startup_event()
+    db = SessionLocal()
+    try:
+        first_user = db.query(User.id).filter(User.email == emails[0]).scalar()
+        if first_user is None:
+            n_users = max(args.data_users, args.users)
+            print(f"Generating {n_users} synthetic users...")
+            with engine.connect() as conn:
+                for _ in load_synthetic_data(conn, n_users, args.seed, args.months):
+                    pass
+            first_user = db.query(User.id).filter(User.email == emails[0]).scalar()
+        last_day = db.query(func.max(Transaction.date)).filter(Transaction.user_id == first_user).scalar()
+        fingerprint = data_fingerprint(db, args.seed)
+        # Every login below (setup and timed) adds a session; they are deleted after the run
+        last_session = db.query(func.max(RefreshToken.id)).scalar() or 0
+        user_ids = dict(db.query(User.email, User.id).filter(User.email.in_(emails)).all())
+        build_benchmarks(db, last_day.year, last_day.month)
+    finally:
+        db.close()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        users = []
+        for email in emails:
+            r = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+            r.raise_for_status()
+            headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+            categories = (await client.get("/categories/", headers=headers)).json()
+            goals = (await client.get("/savings-goals/", headers=headers)).json()
+            users.append({
+                "user_id": user_ids[email],
+                "email": email,
+                "password": PASSWORD,
+                "headers": headers,
+                "year": last_day.year,
+                "month": last_day.month,
+                "ym": f"{last_day.year}-{last_day.month:02d}",
+                "day": date.today().isoformat(),
+                "food_id": next(c["id"] for c in categories if c["name"] == "Food" and c["type"] == "expense"),
+                "goal_id": goals[0]["id"],
+            })
+
+        results = {}
+        specs = {}
+        print(f"{'route':58} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+        for spec in ENDPOINTS:
+            if args.only and not spec["path"].startswith(args.only):
+                continue
+            key = f"{spec['method']} {spec['path']}"
+            specs[key] = spec
+            results[key] = await measure(client, spec, users, args.requests, args.warmup)
+            r = results[key]
+            note = f"  {r['errors']} errors, first {r['first_error']}" if r["errors"] else ""
+            print(f"{key:58} {r['p50_ms']:9.2f} {r['p95_ms']:9.2f} {r['queries']:8g}{note}")
+
+        dialect = engine.dialect.name
+        path = args.baseline or os.path.join(BASELINE_DIR, f"endpoints-{dialect}.json")
+        failed = any(r["errors"] for r in results.values())
+
+        if os.path.exists(path):
+            with open(path) as f:
+                recorded = json.load(f)
+            baseline = recorded["endpoints"]
+            recorded_data = recorded["meta"].get("data") or {}
+            if recorded_data != fingerprint:
+                changed = [
+                    f"{k}: {recorded_data.get(k)} -> {fingerprint.get(k)}"
+                    for k in sorted(recorded_data.keys() | fingerprint.keys())
+                    if recorded_data.get(k) != fingerprint.get(k)
+                ]
+                print(f"\nDatabase differs from the data {path} was recorded on "
+                      "(re-record with --save-baseline):\n  " + "\n  ".join(changed))
+                failed = True
+            regressions = compare(results, baseline, args.threshold)
+            for _ in range(args.retries):
+                if not regressions:
+                    break
+                for key in dict(regressions):
+                    again = await measure(client, specs[key], users, args.requests, args.warmup)
+                    results[key] = best_of(results[key], again)
+                regressions = compare(results, baseline, args.threshold)
+
+            if regressions:
+                lines = [f"{key}: {change}" for key, change in regressions]
+                print(f"\nRegressions beyond {args.threshold:.0%} against {path}:\n  " + "\n  ".join(lines))
+                failed = True
+            else:
+                print(f"\nNo regressions beyond {args.threshold:.0%} against {path}")
+        else:
+            print(f"\nNo baseline at {path}; record one with --save-baseline")
+
+    db = SessionLocal()
+    try:
+        db.query(RefreshToken).filter(RefreshToken.id > last_session).delete()
+        db.commit()
+        after = data_fingerprint(db, args.seed)
+    finally:
+        db.close()
+    leaked = [f"{k}: {fingerprint[k]} -> {v}" for k, v in after.items() if fingerprint[k] != v]
+    if leaked:
+        print("\nBenchmark writes were not cleaned up:\n  " + "\n  ".join(leaked))
+        failed = True
+
+    if args.save_baseline and failed:
+        print("Not saving a baseline from a failed run")
+    elif args.save_baseline:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({
+                "meta": {
+                    "dialect": dialect,
+                    "data": fingerprint,
+                    "users": args.users,
+                    "requests": args.requests,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                },
+                "endpoints": results,
+            }, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {path}")
+
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    try:
+        asyncio.run(main_async(parse_args()))
+    finally:
+        shutil.rmtree(os.environ["PROFILE_DIR"], ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Login throughput benchmark.
+
+    cd backend && DATABASE_URL=sqlite:////tmp/bench_login.db python -m benchmarks.bench_login
+
+Needs the dev requirements: pip install -r requirements-dev.txt
+Fires CONCURRENCY simultaneous logins (LOGINS in total) at the app in
+process and reports logins/second with p50/p95 latency, alongside a
+/ request measured during the burst to show other traffic is not starved.
+Set BCRYPT_ROUNDS / PASSWORD_HASH_EXECUTOR / PASSWORD_HASH_WORKERS to compare settings.
+"""
+import asyncio
+import time
+
+import httpx
+import numpy as np
+
+from app.main import app
+from app.database import Base, engine
+
+USERS = 8
+LOGINS = 64
+CONCURRENCY = 16
+PASSWORD = "bench-password"
+
+
+async def main_async():
+    Base.metadata.create_all(bind=engine)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        emails = [f"bench{i}@example.com" for i in range(USERS)]
+        await asyncio.gather(*(
+            client.post("/auth/signup", json={"email": e, "password": PASSWORD}) for e in emails
+        ))
+
+        slots = asyncio.Semaphore(CONCURRENCY)
+        latencies = []
+        side_latencies = []
+
+        async def login(i):
+            async with slots:
+                start = time.perf_counter()
+                r = await client.post(
+                    "/auth/login", json={"email": emails[i % USERS], "password": PASSWORD}
+                )
+                latencies.append(time.perf_counter() - start)
+                r.raise_for_status()
+
+        async def side_traffic(done):
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/")
+                side_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        done = asyncio.Event()
+        side = asyncio.create_task(side_traffic(done))
+        start = time.perf_counter()
+        await asyncio.gather(*(login(i) for i in range(LOGINS)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await side
+
+    p50, p95 = np.percentile(latencies, [50, 95]) * 1000
+    side_p95 = np.percentile(side_latencies, 95) * 1000
+    print(
+        f"{LOGINS} logins, concurrency {CONCURRENCY}: {LOGINS / elapsed:.1f} logins/s, "
+        f"p50 {p50:.0f}ms, p95 {p95:.0f}ms; GET / during burst p95 {side_p95:.1f}ms"
+    )
+    return 0
+
+
+def main():
+    return asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,20 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.database import Base
+from app.models.user import User
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory database with every table and one user (id 1)"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(User(id=1, email="user@example.com", hashed_password="x"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
@@ -0,0 +1,41 @@
+from datetime import date
+
+from sqlalchemy import create_engine, literal, select
+from sqlalchemy.dialects import postgresql
+
+from app.services.autosave import _roundup, rule_due
+
+
+def _spare(amount, step):
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        return conn.execute(select(_roundup(literal(amount), literal(step)))).scalar()
+
+
+def test_roundup_quotient_above_half():
+    # 460 / 100 = 4.6; rounding the quotient instead of flooring it saves nothing
+    assert _spare(460.0, 100.0) == 40
+    assert _spare(410.0, 100.0) == 90
+    assert _spare(400.0, 100.0) == 0
+
+
+def test_roundup_floors_on_postgres():
+    sql = str(select(_roundup(literal(460.0), literal(100.0))).compile(dialect=postgresql.dialect()))
+    assert "floor" in sql.lower()
+    assert "AS INTEGER" not in sql
+
+
+def test_rules_skip_days_before_creation():
+    created = date(2026, 3, 14)
+    assert not rule_due("roundup", created, date(2026, 3, 13))
+    assert rule_due("roundup", created, date(2026, 3, 14))
+
+
+def test_fixed_rules_run_monthly_on_creation_day():
+    created = date(2026, 1, 31)
+    assert rule_due("fixed", created, date(2026, 1, 31))
+    assert not rule_due("fixed", created, date(2026, 2, 1))
+    # Short months save on their last day
+    assert rule_due("fixed", created, date(2026, 2, 28))
+    assert rule_due("fixed", created, date(2026, 3, 31))
+    assert not rule_due("fixed", created, date(2026, 3, 30))
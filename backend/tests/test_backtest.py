@@ -0,0 +1,19 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from app.services.backtest import load_prices
+
+
+def test_concurrent_first_loads_share_one_sidecar(tmp_path):
+    source = tmp_path / "prices.csv"
+    rows = "".join(f"2020-{m:02d},{100 + m},{50 + m},{30 + m}\n" for m in range(1, 13))
+    source.write_text("date,equity,debt,gold\n" + rows)
+
+    with ThreadPoolExecutor(8) as pool:
+        tables = list(pool.map(lambda _: np.array(load_prices(str(source))), range(16)))
+
+    assert all(np.array_equal(t, tables[0]) for t in tables)
+    assert tables[0].shape == (12, 4)
+    assert sorted(os.listdir(tmp_path)) == ["prices.csv", "prices.npy"]
@@ -0,0 +1,30 @@
+from datetime import date
+
+import pytest
+
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.category_monthly_total import CategoryMonthlyTotal
+from app.models.transaction import Transaction
+from app.services.budget_alerts import monthly_category_total, refresh_alert
+
+
+@pytest.fixture(autouse=True)
+def food_budget(db):
+    db.add(Category(id=1, name="Food", type="expense", user_id=1))
+    db.add(Budget(user_id=1, category_id=1, monthly_limit=1000))
+    db.add(Transaction(amount=900, description="Groceries", date=date(2026, 2, 3), category_id=1, user_id=1))
+    db.commit()
+
+
+def test_read_without_seeding(db):
+    assert monthly_category_total(db, 1, 1, 2026, 2, seed=False) == 900
+    assert db.query(CategoryMonthlyTotal).count() == 0
+
+    assert monthly_category_total(db, 1, 1, 2026, 2) == 900
+    assert db.query(CategoryMonthlyTotal).count() == 1
+
+
+def test_missing_category_is_not_found(db):
+    assert refresh_alert(db, 1, 42, 2026, 2) == {"status": "category_not_found"}
+    assert refresh_alert(db, 1, 1, 2026, 2)["level"] == "warning"
@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, inspect, text
+
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.database import Base, SchemaMigrationError, _add_column_ddl, add_missing_columns
+from app.services.migrations import migrate_schema
+
+# Tables as they were before merchant keys, anomaly flags, alert upserts and rule runs
+OLD_SCHEMA = (
+    "CREATE TABLE transactions (id INTEGER PRIMARY KEY, amount FLOAT NOT NULL, description VARCHAR,"
+    " date DATE NOT NULL, category_id INTEGER NOT NULL, user_id INTEGER NOT NULL)",
+    "CREATE TABLE alerts (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, category_id INTEGER NOT NULL,"
+    " year INTEGER NOT NULL, month INTEGER NOT NULL, level VARCHAR NOT NULL, message VARCHAR NOT NULL)",
+    "CREATE TABLE autosave_records (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, amount FLOAT NOT NULL,"
+    " date DATE NOT NULL, rule_type VARCHAR NOT NULL, goal_id INTEGER, status VARCHAR)",
+)
+
+
+def _old_database():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        for ddl in OLD_SCHEMA:
+            conn.execute(text(ddl))
+        # Legacy duplicates the old insert-or-update code could leave behind
+        for level in ("warning", "danger"):
+            conn.execute(text(
+                f"INSERT INTO alerts (user_id, category_id, year, month, level, message) "
+                f"VALUES (1, 2, 2025, 6, '{level}', 'm')"
+            ))
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_startup_only_adds_columns():
+    engine = _old_database()
+    add_missing_columns(engine)
+
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns("transactions")}
+    assert {"merchant_key", "anomaly_score", "is_anomaly"} <= columns
+    assert any(fk["constrained_columns"] == ["rule_id"] for fk in inspector.get_foreign_keys("autosave_records"))
+    assert not [i for i in inspector.get_indexes("alerts") if i["unique"]]
+
+
+def test_migration_dedupes_before_unique_index():
+    engine = _old_database()
+    migrate_schema(engine, log=lambda message: None)
+
+    inspector = inspect(engine)
+    assert "uq_alert_user_category_month" in {i["name"] for i in inspector.get_indexes("alerts") if i["unique"]}
+    assert "ix_transactions_user_merchant" in {i["name"] for i in inspector.get_indexes("transactions")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT level FROM alerts")).scalars().all() == ["danger"]
+
+    # Idempotent when re-run
+    migrate_schema(engine, log=lambda message: None)
+
+
+@pytest.mark.parametrize("column", [
+    Column("flag", Integer, nullable=False),
+    Column("status", String, default="new"),
+    Column("code", String, unique=True),
+])
+def test_refuses_columns_it_cannot_add_faithfully(column):
+    table = Table("things", MetaData(), Column("id", Integer, primary_key=True), column)
+    with pytest.raises(SchemaMigrationError, match=f"things.{column.name}"):
+        _add_column_ddl(table, column, create_engine("sqlite://").dialect)
@@ -0,0 +1,24 @@
+from datetime import date
+
+from app.services import forecast
+
+
+def test_state_fitted_across_a_write_is_not_cached(monkeypatch):
+    today = date(2026, 5, 10)
+    fits = []
+
+    def fake_fit(db, user_id, today):
+        fits.append(user_id)
+        if len(fits) == 1:
+            # A transaction is written (and the cache invalidated) mid-fit
+            forecast.invalidate(user_id)
+        return {"fitted_month": forecast._month_index(today.year, today.month)}
+
+    monkeypatch.setattr(forecast, "fit_user", fake_fit)
+    forecast.invalidate(7)
+
+    forecast.user_state(None, 7, today)
+    forecast.user_state(None, 7, today)
+    forecast.user_state(None, 7, today)
+    assert len(fits) == 2
+    assert forecast._fitting == {}
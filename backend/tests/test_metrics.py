@@ -0,0 +1,20 @@
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+
+def test_metrics_off_by_default():
+    assert not main.METRICS_ENABLED
+    assert TestClient(main.app).get("/metrics").status_code == 404
+
+
+def test_metrics_token(monkeypatch):
+    monkeypatch.setattr(main, "METRICS_ENABLED", True)
+    monkeypatch.setattr(main, "METRICS_TOKEN", "scrape-secret")
+    client = TestClient(main.app)
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    r = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert r.status_code == 200
+    assert "finsmart_http_requests_total" in r.text
@@ -0,0 +1,36 @@
+import asyncio
+
+from app.core import profiling
+from app.core.profiling import ProfileStore, ProfilingMiddleware
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def _request(middleware, token):
+    headers = []
+    scope = {"type": "http", "method": "GET", "path": "/categories/", "headers": [
+        (b"authorization", f"Bearer {token}".encode()),
+    ]}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            headers.extend(message["headers"])
+
+    asyncio.run(middleware(scope, None, send))
+    return dict(headers)
+
+
+def test_sampled_profile_id_only_shown_to_admins(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(profiling, "store", ProfileStore(str(tmp_path), 10))
+    monkeypatch.setattr(profiling, "verify_access_token", lambda token: token)
+    monkeypatch.setattr(profiling, "is_admin", lambda email: email == "admin@example.com")
+    middleware = ProfilingMiddleware(_app)
+
+    assert b"x-profile-id" not in _request(middleware, "user@example.com")
+    assert b"x-profile-id" in _request(middleware, "admin@example.com")
+    # Both requests were still sampled
+    assert len(profiling.store.list()) == 2
@@ -0,0 +1,55 @@
+import asyncio
+
+from app.core import rate_limit
+from app.core.rate_limit import MemoryStore, RateLimitMiddleware, client_ip, is_heavy, route_cost
+
+
+def _scope(method, path, client="203.0.113.7", headers=()):
+    return {"type": "http", "method": method, "path": path, "client": (client, 50000), "headers": list(headers)}
+
+
+def test_report_routes_are_weighted():
+    assert route_cost("GET", "/analytics/historical-comparison") == 5
+    assert route_cost("GET", "/insights/enhanced") == 5
+    assert route_cost("GET", "/analytics/summary") == 1
+
+
+def test_forwarded_for_ignored_without_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(rate_limit, "TRUSTED_PROXIES", ())
+    scope = _scope("POST", "/auth/login", headers=[(b"x-forwarded-for", b"198.51.100.1")])
+    assert client_ip(scope) == "203.0.113.7"
+
+
+def test_forwarded_for_behind_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(rate_limit, "TRUSTED_PROXIES", rate_limit._parse_networks("10.0.0.0/8"))
+    # The left-most entry is client-supplied; the proxy appended the real peer
+    scope = _scope("POST", "/auth/login", client="10.0.0.2",
+                   headers=[(b"x-forwarded-for", b"1.2.3.4, 198.51.100.9, 10.0.0.5")])
+    assert client_ip(scope) == "198.51.100.9"
+
+
+def test_concurrency_cap_only_on_heavy_routes(monkeypatch):
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_ENABLED", True)
+    gate = asyncio.Event()
+    statuses = []
+
+    async def app(scope, receive, send):
+        if is_heavy(scope["method"], scope["path"]):
+            await gate.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    async def run():
+        middleware = RateLimitMiddleware(app, store=MemoryStore(1000, 100), max_concurrent=1)
+        slow = asyncio.create_task(middleware(_scope("GET", "/insights/enhanced"), None, send))
+        await asyncio.sleep(0)
+        await middleware(_scope("GET", "/analytics/summary"), None, send)
+        await middleware(_scope("GET", "/analytics/historical-comparison"), None, send)
+        gate.set()
+        await slow
+
+    asyncio.run(run())
+    assert statuses == [200, 429, 200]
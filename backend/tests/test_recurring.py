@@ -0,0 +1,24 @@
+from datetime import date
+from types import SimpleNamespace
+
+from app.services import recurring
+
+
+def _charge(day, amount):
+    return SimpleNamespace(
+        date=day, amount=amount, description="AMAZON PRIME", merchant_key="amazon prime", category_name="Subscriptions"
+    )
+
+
+def test_two_annual_charges_are_a_yearly_series(monkeypatch):
+    charges = [_charge(date(2025, 6, 1), 1499), _charge(date(2026, 5, 28), 1499)]
+
+    def history(db, user_id, since):
+        return [c for c in charges if c.date >= since]
+
+    monkeypatch.setattr(recurring, "load_expense_history", history)
+    # The first charge is 374 days old, past a one-year window
+    found = recurring.recurring_for_user(None, 1, today=date(2026, 6, 10))
+
+    assert [(r["merchant"], r["period"], r["frequency"]) for r in found] == [("amazon prime", "yearly", 2)]
+    assert found[0]["next_expected_date"] == date(2027, 5, 24)
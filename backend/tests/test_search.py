@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.services import search
+
+
+@pytest.fixture(autouse=True)
+def swiggy_dinner(db):
+    db.add(Category(id=1, name="Food", type="expense", user_id=1))
+    db.add(Transaction(amount=250, description="Swiggy dinner", date=date(2026, 1, 5), category_id=1, user_id=1))
+    db.commit()
+
+
+def _add(db, description):
+    db.add(Transaction(amount=99, description=description, date=date(2026, 1, 6), category_id=1, user_id=1))
+    db.commit()
+
+
+def test_invalidate_picks_up_new_transactions(db):
+    search.invalidate(1)
+    assert len(search.search_transactions(db, 1, "swiggy", 20, 0)) == 1
+
+    _add(db, "Swiggy lunch")
+    search.invalidate(1)
+    assert len(search.search_transactions(db, 1, "swiggy", 20, 0)) == 2
+
+
+def test_index_built_across_a_write_is_not_cached(db, monkeypatch):
+    search.invalidate(1)
+    build = search.InvertedIndex
+
+    def racing_build(rows):
+        # A transaction is created (and the index invalidated) mid-build
+        _add(db, "Swiggy lunch")
+        search.invalidate(1)
+        return build(rows)
+
+    monkeypatch.setattr(search, "InvertedIndex", racing_build)
+    assert len(search.search_transactions(db, 1, "swiggy", 20, 0)) == 1
+    monkeypatch.undo()
+    assert len(search.search_transactions(db, 1, "swiggy", 20, 0)) == 2
+
+
+def test_no_bookkeeping_left_after_builds(db):
+    search.invalidate(1)
+    search.search_transactions(db, 1, "swiggy", 20, 0)
+    search.invalidate(1)
+    assert search._building == {}
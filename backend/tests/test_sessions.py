@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.models.refresh_token import RefreshToken
+from app.services.sessions import issue_refresh_token, revoke_refresh_token, rotate_refresh_token
+
+
+@pytest.fixture
+def token(db):
+    token = issue_refresh_token(db, 1)
+    db.commit()
+    return token
+
+
+def _live(db):
+    return db.query(RefreshToken).filter(RefreshToken.revoked_at == None).count()
+
+
+def test_second_tab_within_grace_gets_a_successor(db, token):
+    first = rotate_refresh_token(db, token)
+    second = rotate_refresh_token(db, token)
+    db.commit()
+    assert first and second and first[1] != second[1]
+    assert _live(db) == 2
+    assert rotate_refresh_token(db, first[1]) is not None
+
+
+def test_reuse_after_grace_revokes_family(db, token):
+    user_id, successor = rotate_refresh_token(db, token)
+    db.execute(update(RefreshToken).where(RefreshToken.revoked_at != None)
+               .values(revoked_at=datetime.utcnow() - timedelta(minutes=5)))
+    assert rotate_refresh_token(db, token) is None
+    db.commit()
+    assert _live(db) == 0
+    assert rotate_refresh_token(db, successor) is None
+
+
+def test_logged_out_token_is_not_revived(db, token):
+    assert revoke_refresh_token(db, token)
+    db.commit()
+    assert rotate_refresh_token(db, token) is None
+
+
+def test_replaying_a_spent_token_twice_revokes_family(db, token):
+    assert rotate_refresh_token(db, token) is not None
+    assert rotate_refresh_token(db, token) is not None
+    assert rotate_refresh_token(db, token) is None
+    db.commit()
+    assert _live(db) == 0
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.core.http_cache import canonical_key, etag_for
+from app.schemas.sip import MAX_PATH_YEARS, MAX_YEARS, SIPMonteCarloRequest, SIPRequest
+from app.services.sip import CHUNK_PATHS, simulate_sip
+
+
+def test_monte_carlo_size_is_capped():
+    SIPMonteCarloRequest(monthly_investment=5000, years=30, paths=100_000)
+    with pytest.raises(ValidationError):
+        SIPMonteCarloRequest(monthly_investment=5000, years=31, paths=100_000)
+    with pytest.raises(ValidationError):
+        SIPMonteCarloRequest(monthly_investment=5000, years=1, paths=1_000_000)
+    assert MAX_PATH_YEARS == 3_000_000
+
+
+def test_chunks_fill_every_path():
+    paths = CHUNK_PATHS + 123
+    invested, values = simulate_sip(5000, 3, 10, 12, 15, paths, seed=3)
+    assert values.shape == (paths, 3) and values.dtype == np.float32
+    assert np.isfinite(values).all() and (values > 0).all()
+    _, again = simulate_sip(5000, 3, 10, 12, 15, paths, seed=3)
+    assert np.array_equal(values, again)
+
+
+def test_sip_years_bounded():
+    SIPRequest(monthly_investment=5000, annual_rate=12, years=MAX_YEARS)
+    with pytest.raises(ValidationError):
+        SIPRequest(monthly_investment=5000, annual_rate=12, years=MAX_YEARS + 1)
+
+
+def test_cache_key_is_exact():
+    def key(rate):
+        return canonical_key(SIPRequest(monthly_investment=10000, annual_rate=rate, years=15))
+
+    assert key(12) == key(12.0) and etag_for(key(12)) == etag_for(key(12.0))
+    # Rates that only differ past the 6th decimal are different requests
+    assert key(12.0000001) != key(12.0000002)
+    assert etag_for(key(12.0000001)) != etag_for(key(12.0000002))
@@ -1,5 +1,5 @@
 import { BrowserRouter, Routes, Route, Navigate } from "react-router-dom";
-import { useState } from "react";
+import { useEffect, useState } from "react";
 
 import Login from "./pages/Login";
 import Signup from "./pages/Signup";
@@ -14,6 +14,10 @@ import Insights from "./pages/Insights";
 import SIP from "./pages/SIP";
 import InvestmentAdvisor from "./pages/InvestmentAdvisor";
 import AutoSavings from "./pages/AutoSavings";
+import { API_BASE_URL } from "./config";
+
+// Renew the access token this long before it expires
+const TOKEN_REFRESH_MARGIN_MS = 2 * 60 * 1000;
 
 function App() {
   const [isAuthenticated, setIsAuthenticated] = useState(
@@ -36,10 +40,88 @@ function App() {
   }
 
   function handleLogout() {
+    const refreshToken = localStorage.getItem("refreshToken");
+    if (refreshToken) {
+      fetch(`${API_BASE_URL}/auth/logout`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ refresh_token: refreshToken }),
+      }).catch(() => {});
+    }
     localStorage.removeItem("token");
+    localStorage.removeItem("refreshToken");
     setIsAuthenticated(false);
   }
 
+  // Keep the session alive with rotating refresh tokens instead of re-login
+  useEffect(() => {
+    if (!isAuthenticated) return;
+
+    let timer;
+
+    function scheduleRefresh() {
+      // Refresh shortly before the access token's own expiry
+      let delay = 0;
+      try {
+        const part = localStorage.getItem("token").split(".")[1];
+        const payload = JSON.parse(atob(part.replace(/-/g, "+").replace(/_/g, "/")));
+        delay = Math.max(0, payload.exp * 1000 - Date.now() - TOKEN_REFRESH_MARGIN_MS);
+      } catch {
+        // Unreadable token: refresh right away
+      }
+      timer = setTimeout(refreshAccessToken, delay);
+    }
+
+    async function refreshAccessToken() {
+      const refreshToken = localStorage.getItem("refreshToken");
+      if (!refreshToken) return;
+
+      try {
+        const res = await fetch(`${API_BASE_URL}/auth/refresh`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ refresh_token: refreshToken }),
+        });
+
+        if (res.ok) {
+          const data = await res.json();
+          localStorage.setItem("token", data.access_token);
+          localStorage.setItem("refreshToken", data.refresh_token);
+          scheduleRefresh();
+        } else if (res.status === 401) {
+          // Another tab may have rotated the token while this request was in flight
+          if (localStorage.getItem("refreshToken") !== refreshToken) {
+            scheduleRefresh();
+          } else {
+            handleLogout();
+          }
+        }
+      } catch {
+        // Offline: try again in a minute
+        timer = setTimeout(refreshAccessToken, 60 * 1000);
+      }
+    }
+
+    // Tabs share localStorage: when one refreshes (or logs out) the others
+    // pick up its tokens instead of spending the same refresh token again
+    function onStorage(event) {
+      if (event.key !== "token" && event.key !== "refreshToken") return;
+      clearTimeout(timer);
+      if (!localStorage.getItem("refreshToken")) {
+        setIsAuthenticated(false);
+      } else {
+        scheduleRefresh();
+      }
+    }
+
+    window.addEventListener("storage", onStorage);
+    scheduleRefresh();
+    return () => {
+      clearTimeout(timer);
+      window.removeEventListener("storage", onStorage);
+    };
+  }, [isAuthenticated]);
+
   function handleMonthChange(value) {
     setMonth(value);
     localStorage.setItem("selectedMonth", value);
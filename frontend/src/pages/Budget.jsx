@@ -92,18 +92,6 @@ function Budget({ selectedMonth }) {
       });
       console.log("Budget saved:", await res.json());
 
-      // Trigger alert check for this category
-      const alertRes = await fetch(
-        `${API_BASE_URL}/budget/check-alerts/${categoryId}?month=${selectedMonth}`,
-        {
-          method: "POST",
-          headers: {
-            Authorization: `Bearer ${token}`,
-          },
-        }
-      );
-      console.log("Alert check result:", await alertRes.json());
-
       setEditingId(null);
       // Refresh only the data for this month
       await loadBudgetData(selectedMonth);
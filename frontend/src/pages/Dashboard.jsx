@@ -109,6 +109,25 @@ function Dashboard({ selectedMonth }) {
     }
   }, [token, selectedMonth]);
 
+  // Live alert updates pushed by the server (no polling)
+  useEffect(() => {
+    if (!token || !selectedMonth) return;
+
+    const [year, month] = selectedMonth.split("-").map(Number);
+    const source = new EventSource(
+      `${API_BASE_URL}/alerts/stream?token=${encodeURIComponent(token)}`
+    );
+
+    source.addEventListener("alert", (e) => {
+      const change = JSON.parse(e.data);
+      if (change.year === year && change.month === month) {
+        fetchAlerts(selectedMonth);
+      }
+    });
+
+    return () => source.close();
+  }, [token, selectedMonth]);
+
   return (
     <div className="page-container">
       <div className="page-content">
@@ -42,6 +42,7 @@ function Login({ onLogin }) {
 
       if (response.ok) {
         localStorage.setItem("token", data.access_token);
+        localStorage.setItem("refreshToken", data.refresh_token);
 
         // 🔑 tell App.jsx auth state changed
         onLogin();
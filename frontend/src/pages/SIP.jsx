@@ -17,27 +17,20 @@ function SIP() {
   const [lumpYears, setLumpYears] = useState("");
   const [lumpResult, setLumpResult] = useState(null);
 
-  const token = localStorage.getItem("token");
-
   async function calculateSIP(e) {
     e.preventDefault();
     setLoading(true);
     setResult(null);
 
     try {
-      const res = await fetch(`${API_BASE_URL}/sip/calculate`, {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${token}`,
-        },
-        body: JSON.stringify({
-          monthly_investment: Number(monthly),
-          annual_rate: Number(rate),
-          years: Number(years),
-          step_up_percent: stepUpEnabled ? Number(stepUpPercent) : 0,
-        }),
+      // GET so repeat inputs are served from the HTTP cache (ETag/Cache-Control)
+      const params = new URLSearchParams({
+        monthly_investment: Number(monthly),
+        annual_rate: Number(rate),
+        years: Number(years),
+        step_up_percent: stepUpEnabled ? Number(stepUpPercent) : 0,
       });
+      const res = await fetch(`${API_BASE_URL}/sip/calculate?${params}`);
 
       const data = await res.json();
       setResult(data);
@@ -138,6 +131,8 @@ function SIP() {
                   className="sip-input"
                   type="number"
                   placeholder="10 years"
+                  min="1"
+                  max="50"
                   value={years}
                   onChange={(e) => setYears(e.target.value)}
                   required
@@ -169,18 +169,7 @@ function Transactions({ selectedMonth }) {
         throw new Error("Failed to add transaction");
       }
 
-      // 2. Check budget alerts for this category
-      await fetch(
-        `${API_BASE_URL}/budget/check-alerts/${categoryId}?month=${selectedMonth}`,
-        {
-          method: "POST",
-          headers: {
-            Authorization: `Bearer ${token}`,
-          },
-        }
-      ).catch(err => console.error("Alert check error:", err));
-
-      // 3. Refresh transaction list
+      // 2. Refresh transaction list (budget alerts are updated server-side)
       await fetchTransactions();
 
       // Reset form
@@ -198,8 +187,8 @@ function Transactions({ selectedMonth }) {
     }
   }
 
-  // delete transaction and re-check alerts
-  async function deleteTransaction(id, categoryId) {
+  // delete transaction (alerts are re-evaluated server-side)
+  async function deleteTransaction(id) {
     try {
       // Delete transaction
       await fetch(`${API_BASE_URL}/transactions/${id}`, {
@@ -209,17 +198,6 @@ function Transactions({ selectedMonth }) {
         },
       });
 
-      // Re-check alerts for this category & month
-      await fetch(
-        `${API_BASE_URL}/budget/check-alerts/${categoryId}?month=${selectedMonth}`,
-        {
-          method: "POST",
-          headers: {
-            Authorization: `Bearer ${token}`,
-          },
-        }
-      ).catch(err => console.error("Alert check error:", err));
-
       // Refresh list
       await fetchTransactions();
       showNotification("Transaction deleted successfully!", "success");
@@ -469,7 +447,7 @@ function Transactions({ selectedMonth }) {
                         </div>
                         <button
                           className="btn-delete"
-                          onClick={() => deleteTransaction(t.id, t.category_id)}
+                          onClick={() => deleteTransaction(t.id)}
                           title="Delete transaction"
                           aria-label="Delete transaction"
                         >